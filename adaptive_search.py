@@ -0,0 +1,225 @@
+"""
+Adaptive Parameter Search (Successive Halving)
+Alternatif grid sweep penuh: semua kandidat BotConfig di-backtest di prefix
+pendek history, hanya 1/eta terbaik yang dipromosikan ke prefix eta kali
+lebih panjang, dan seterusnya sampai full history.
+
+Kandidat yang dipromosikan melanjutkan backtest dari bar terakhirnya
+(run_backtest*(data, start, end_idx) di atas state bot sebelumnya), bukan
+mulai ulang; hasil di akhir setiap rung identik dengan backtest langsung ke
+bar tersebut. Di process pool, state bot dikirim antar round sebagai
+checkpoint biner (checkpoint.encode_state) berisi state minimal
+(get_state(history=False), equity curve per bar tidak direkam).
+
+Contoh:
+    configs = grid_configs(BotConfig(), {...})   # ratusan kandidat
+    result = successive_halving(data, configs, min_fraction=0.05, eta=4)
+    print(result.table.head(10))
+    print(result.stats)   # bars_simulated vs exhaustive_bars
+"""
+
+import logging
+import math
+import os
+from dataclasses import asdict, dataclass, replace
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import pandas as pd
+
+from checkpoint import decode_state, encode_state
+from ohlcv_store import OHLCVStore
+from trading_bot import BotConfig, TradingBot
+from walk_forward import score_report
+from worker_pool import create_bot, worker_data, worker_logger, worker_payload, worker_pool
+
+
+# ============================================================================
+# 1. SCHEDULE
+# ============================================================================
+
+def halving_schedule(n_bars: int, start_idx: int = 200, min_fraction: float = 0.1,
+                     eta: float = 3.0) -> List[int]:
+    """
+    end_idx setiap rung: prefix min_fraction dari history (setelah
+    start_idx), dikali eta per rung, rung terakhir selalu full history
+    """
+
+    if not 0 < min_fraction <= 1:
+        raise ValueError("min_fraction must be in (0, 1]")
+    if eta <= 1:
+        raise ValueError("eta must be greater than 1")
+
+    total = n_bars - start_idx
+    ends = []
+    bars = max(1, int(total * min_fraction))
+    while bars < total:
+        ends.append(start_idx + bars)
+        bars = int(math.ceil(bars * eta))
+    ends.append(n_bars)
+    return ends
+
+
+# ============================================================================
+# 2. CANDIDATE BACKTEST
+# ============================================================================
+
+def create_candidate(config: BotConfig) -> TradingBot:
+    """
+    Bot kandidat search: hanya report yang dipakai, jadi equity curve per
+    bar tidak disimpan (max drawdown tetap dari running peak)
+    """
+    return create_bot(replace(config, record_equity_curve=False))
+
+
+def advance(bot: TradingBot, data: pd.DataFrame, start_idx: int, end_idx: int,
+            vectorized: bool = True) -> Dict:
+    """Lanjutkan backtest bot dari start_idx sampai end_idx, return report kumulatif"""
+    if vectorized:
+        return bot.run_backtest_vectorized(data, start_idx, end_idx)
+    return bot.run_backtest(data, start_idx, end_idx)
+
+
+# ============================================================================
+# 3. WORKER
+# ============================================================================
+
+def _run_task(task: Tuple[int, Optional[bytes], int, int, bool]
+              ) -> Tuple[int, Dict, bytes]:
+    config_id, state, start_idx, end_idx, vectorized = task
+    bot = create_candidate(worker_payload()[config_id])
+    if state is not None:
+        bot.set_state(decode_state(state)['bot'])
+    report = advance(bot, worker_data(), start_idx, end_idx, vectorized)
+    # Hanya state minimal untuk rung berikutnya (tanpa order history dan daily trades)
+    return config_id, report, encode_state({'bot': bot.get_state(history=False)})
+
+
+# ============================================================================
+# 4. SUCCESSIVE HALVING
+# ============================================================================
+
+@dataclass
+class SearchResult:
+    """Hasil adaptive search: satu baris per kandidat + statistik biaya"""
+    table: pd.DataFrame
+    best_config: BotConfig
+    stats: Dict
+
+
+def successive_halving(data: Union[pd.DataFrame, OHLCVStore], configs: Sequence[BotConfig],
+                       start_idx: int = 200, min_fraction: float = 0.1, eta: float = 3.0,
+                       metric: str = 'profit_factor', min_trades: int = 1,
+                       processes: Optional[int] = None, vectorized: bool = True,
+                       log_level: int = logging.WARNING) -> SearchResult:
+    """
+    Successive halving atas kandidat configs
+
+    Setiap rung: kandidat yang tersisa dilanjutkan sampai end_idx rung,
+    di-ranking dengan metric dari report kumulatif (trade < min_trades =
+    paling bawah), lalu ceil(n / eta) terbaik lanjut ke rung berikutnya.
+    Seri diputuskan oleh config_id.
+
+    Returns:
+        SearchResult: table (config_id, field yang bervariasi, rung dan
+        end_idx terakhir, skor dan metrics di sana; urut dari yang paling
+        jauh dipromosikan), best_config, dan stats (bars_simulated vs
+        exhaustive_bars untuk grid penuh)
+    """
+
+    if not configs:
+        raise ValueError("configs must not be empty")
+    frame = data.to_frame() if isinstance(data, OHLCVStore) else data
+    ends = halving_schedule(len(frame), start_idx, min_fraction, eta)
+    processes = min(processes or os.cpu_count() or 1, len(configs))
+
+    schedule = (start_idx, ends, eta, metric, min_trades, vectorized)
+    if processes == 1:
+        worker_logger.setLevel(log_level)
+        rounds = _search_inline(frame, configs, *schedule)
+    else:
+        rounds = _search_pool(data, configs, processes, log_level, *schedule)
+
+    return _summarize(rounds, configs, start_idx, ends, metric, min_trades)
+
+
+def _promote(reports: Dict[int, Dict], eta: float, metric: str, min_trades: int) -> List[int]:
+    ranked = sorted(reports, key=lambda i: (-score_report(reports[i], metric, min_trades), i))
+    return ranked[:max(1, int(math.ceil(len(ranked) / eta)))]
+
+
+def _search_inline(data: pd.DataFrame, configs: Sequence[BotConfig], start_idx: int,
+                   ends: List[int], eta: float, metric: str, min_trades: int,
+                   vectorized: bool) -> List[Dict[int, Dict]]:
+    # Satu proses: bot kandidat disimpan di memory antar rung
+    bots = {i: create_candidate(config) for i, config in enumerate(configs)}
+    rounds = []
+    begin = start_idx
+    for rung, end in enumerate(ends):
+        reports = {i: advance(bot, data, begin, end, vectorized) for i, bot in bots.items()}
+        rounds.append(reports)
+        if rung < len(ends) - 1:
+            bots = {i: bots[i] for i in _promote(reports, eta, metric, min_trades)}
+        begin = end
+    return rounds
+
+
+def _search_pool(data: Union[pd.DataFrame, OHLCVStore], configs: Sequence[BotConfig],
+                 processes: int, log_level: int, start_idx: int, ends: List[int], eta: float,
+                 metric: str, min_trades: int, vectorized: bool) -> List[Dict[int, Dict]]:
+    # Antar rung, state bot disimpan sebagai checkpoint biner di proses utama
+    states: Dict[int, Optional[bytes]] = {i: None for i in range(len(configs))}
+    rounds = []
+    begin = start_idx
+    with worker_pool(data, processes, list(configs), log_level) as pool:
+        for rung, end in enumerate(ends):
+            tasks = [(i, state, begin, end, vectorized) for i, state in states.items()]
+            reports = {}
+            for config_id, report, state in pool.imap_unordered(_run_task, tasks):
+                reports[config_id] = report
+                states[config_id] = state
+            rounds.append(reports)
+            if rung < len(ends) - 1:
+                states = {i: states[i] for i in _promote(reports, eta, metric, min_trades)}
+            begin = end
+    return rounds
+
+
+def _summarize(rounds: List[Dict[int, Dict]], configs: Sequence[BotConfig], start_idx: int,
+               ends: List[int], metric: str, min_trades: int) -> SearchResult:
+    values = [asdict(config) for config in configs]
+    varied = [name for name in values[0] if any(v[name] != values[0][name] for v in values)]
+
+    # Report terakhir setiap kandidat (rung tertinggi yang dicapai)
+    last: Dict[int, Tuple[int, Dict]] = {}
+    for rung, reports in enumerate(rounds):
+        for config_id, report in reports.items():
+            last[config_id] = (rung, report)
+
+    rows = []
+    for config_id, (rung, report) in last.items():
+        row = {'config_id': config_id}
+        row.update({name: values[config_id][name] for name in varied})
+        row.update({'rung': rung, 'end_idx': ends[rung],
+                    'score': score_report(report, metric, min_trades)})
+        row.update(report)
+        rows.append(row)
+    table = pd.DataFrame(rows).sort_values(['rung', 'score', 'config_id'],
+                                           ascending=[False, False, True])
+    table = table.reset_index(drop=True)
+
+    bars_simulated = 0
+    begin = start_idx
+    for end, reports in zip(ends, rounds):
+        bars_simulated += (end - begin) * len(reports)
+        begin = end
+    exhaustive_bars = (ends[-1] - start_idx) * len(configs)
+
+    stats = {
+        'candidates': len(configs),
+        'rungs': ends,
+        'survivors': [len(reports) for reports in rounds],
+        'bars_simulated': bars_simulated,
+        'exhaustive_bars': exhaustive_bars,
+        'speedup': exhaustive_bars / bars_simulated if bars_simulated else 0.0,
+    }
+    return SearchResult(table, configs[int(table['config_id'].iloc[0])], stats)
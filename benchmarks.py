@@ -0,0 +1,312 @@
+"""
+Benchmark Suite
+Ukur kecepatan indikator, generate_signal kedua strategi, position sizing
+dan throughput process_candle pada beberapa ukuran data, simpan hasil ke
+JSON dan bandingkan dengan baseline untuk mendeteksi regresi.
+
+Timing absolut bergantung pada mesin, jadi setiap case juga disimpan
+relatif terhadap workload referensi tetap (loop Python atau operasi numpy)
+yang diukur di run yang sama; perbandingan baseline memakai nilai relatif
+ini. Baseline dibuat lokal dari commit pembanding, tidak di-commit.
+
+Contoh:
+    python benchmarks.py                                  # 1k, 100k, 10M bar
+    python benchmarks.py --sizes 1000 100000 --output baseline.json   # di commit pembanding
+    python benchmarks.py --sizes 1000 100000 --baseline baseline.json
+"""
+
+import argparse
+import gc
+import json
+import logging
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from data_utils import make_ohlcv
+from trading_bot import (BotConfig, INDICATOR_CACHE, MACrossoverRSIStrategy,
+                         MeanReversionStrategy, RiskManager, TechnicalIndicators,
+                         TradingBot)
+
+
+DEFAULT_SIZES = (1_000, 100_000, 10_000_000)
+DEFAULT_TOLERANCE = 0.25
+
+_logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# 1. TIMING
+# ============================================================================
+
+def measure(func: Callable[[], object], items: int, repeat: int,
+            reference: str = 'numpy') -> Dict:
+    """
+    Jalankan func `repeat` kali, ambil waktu terbaik
+
+    reference: workload pembanding untuk nilai relatif ('python' untuk case
+    yang didominasi loop Python per item, 'numpy' untuk operasi array)
+    """
+
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    best = min(timings)
+    return {
+        'seconds': best,
+        'items': items,
+        'ns_per_item': best / items * 1e9 if items else 0.0,
+        'items_per_sec': items / best if best else 0.0,
+        'reference': reference,
+    }
+
+
+REFERENCE_ITEMS = 1_000_000
+
+
+def bench_reference(repeat: int) -> Dict[str, Dict]:
+    """Workload tetap untuk normalisasi: loop Python dan reduksi numpy"""
+
+    values = list(range(REFERENCE_ITEMS))
+    array = np.random.default_rng(0).normal(size=REFERENCE_ITEMS)
+
+    def python_loop():
+        total = 0.0
+        for value in values:
+            total += value * 0.5
+
+    return {
+        'python': measure(python_loop, REFERENCE_ITEMS, repeat, 'python'),
+        'numpy': measure(lambda: np.cumsum(array), REFERENCE_ITEMS, repeat, 'numpy'),
+    }
+
+
+# ============================================================================
+# 2. CASES
+# ============================================================================
+
+def bench_indicators(data: pd.DataFrame, repeat: int) -> Dict[str, Dict]:
+    """Setiap method TechnicalIndicators, tanpa INDICATOR_CACHE"""
+
+    close, high, low = data['close'], data['high'], data['low']
+    ti = TechnicalIndicators
+    calls = {
+        'calculate_sma': lambda: ti.calculate_sma.__wrapped__(close, 50),
+        'calculate_ema': lambda: ti.calculate_ema.__wrapped__(close, 50),
+        'calculate_rsi': lambda: ti.calculate_rsi.__wrapped__(close, 14),
+        'calculate_atr': lambda: ti.calculate_atr.__wrapped__(high, low, close, 14),
+        'calculate_bollinger_bands': lambda: ti.calculate_bollinger_bands.__wrapped__(close, 20, 2),
+        'calculate_macd': lambda: ti.calculate_macd.__wrapped__(close, 12, 26, 9),
+        'calculate_trailing_mean': lambda: ti.calculate_trailing_mean.__wrapped__(data['volume'], 50),
+    }
+    return {f'indicators.{name}': measure(call, len(data), repeat)
+            for name, call in calls.items()}
+
+
+def bench_strategies(data: pd.DataFrame, config: BotConfig, repeat: int,
+                     max_calls: int) -> Dict[str, Dict]:
+    """prepare, generate_signal per bar dan generate_signal_arrays untuk kedua strategi"""
+
+    results = {}
+    for strategy_cls in (MACrossoverRSIStrategy, MeanReversionStrategy):
+        strategy = strategy_cls(config, _logger)
+        name = f'strategy.{strategy_cls.__name__}'
+
+        def prepare():
+            INDICATOR_CACHE.clear()
+            strategy.prepare(data)
+
+        results[f'{name}.prepare'] = measure(prepare, len(data), repeat)
+
+        # Sample bar tersebar rata di seluruh data (biaya per bar tidak boleh
+        # bergantung pada posisi bar)
+        start = min(config.slow_ma_period + 1, len(data) - 1)
+        indices = np.linspace(start, len(data) - 1,
+                              min(max_calls, len(data) - start)).astype(int).tolist()
+        generate = strategy.generate_signal
+
+        def signals():
+            for idx in indices:
+                generate(data, idx)
+
+        results[f'{name}.generate_signal'] = measure(signals, len(indices), repeat, 'python')
+        results[f'{name}.generate_signal_arrays'] = measure(
+            lambda: strategy.generate_signal_arrays(data), len(data), repeat)
+        INDICATOR_CACHE.clear()
+    return results
+
+
+def bench_position_size(config: BotConfig, repeat: int, calls: int) -> Dict[str, Dict]:
+    """RiskManager.calculate_position_size dengan entry/stop acak"""
+
+    risk = RiskManager(config, _logger)
+    rng = np.random.default_rng(7)
+    entries = (100 + rng.normal(0, 5, calls)).tolist()
+    stops = [e * 0.98 for e in entries]
+    balance = config.account_size
+    size = risk.calculate_position_size
+
+    def run():
+        for entry, stop in zip(entries, stops):
+            size(balance, entry, stop)
+
+    return {'risk.calculate_position_size': measure(run, calls, repeat, 'python')}
+
+
+def bench_process_candle(data: pd.DataFrame, config: BotConfig, repeat: int,
+                         max_calls: int) -> Dict[str, Dict]:
+    """Candle per detik end-to-end lewat TradingBot.process_candle"""
+
+    start = min(200, len(data) - 1)
+    stop = min(len(data), start + max_calls)
+    close = data['close'].to_numpy()
+    results = {}
+    for strategy_cls in (MACrossoverRSIStrategy, MeanReversionStrategy):
+        strategy = strategy_cls(config, _logger)
+        strategy.prepare(data)
+
+        def run():
+            bot = TradingBot(config, strategy, _logger)
+            for idx in range(start, stop):
+                bot.process_candle(data, idx, close[idx])
+
+        results[f'bot.process_candle.{strategy_cls.__name__}'] = measure(
+            run, stop - start, repeat, 'python')
+        INDICATOR_CACHE.clear()
+    return results
+
+
+def run_benchmarks(sizes: Sequence[int] = DEFAULT_SIZES, repeat: int = 3,
+                   max_calls: int = 100_000,
+                   config: Optional[BotConfig] = None) -> Dict:
+    """Jalankan semua case untuk setiap ukuran, return dict siap di-dump ke JSON"""
+
+    config = config or BotConfig()
+    references = bench_reference(repeat)
+    results: Dict[str, Dict] = {}
+    for n in sizes:
+        data = make_ohlcv(n)
+        # Data besar cukup diukur sekali; variasinya kecil dibanding durasinya
+        reps = repeat if n <= 1_000_000 else 1
+        cases = {}
+        cases.update(bench_indicators(data, reps))
+        cases.update(bench_strategies(data, config, reps, max_calls))
+        cases.update(bench_position_size(config, reps, min(n, max_calls)))
+        cases.update(bench_process_candle(data, config, reps, max_calls))
+        for name, result in cases.items():
+            result['relative'] = (result['ns_per_item']
+                                  / references[result['reference']]['ns_per_item'])
+            results[f'{name}[{n}]'] = result
+        _logger.info(f"Finished {n} bars")
+        del data
+        INDICATOR_CACHE.clear()
+
+    return {'meta': _environment(sizes, repeat, max_calls), 'references': references,
+            'results': results}
+
+
+def _environment(sizes: Sequence[int], repeat: int, max_calls: int) -> Dict:
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'],
+                                capture_output=True, text=True, timeout=5).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        commit = ''
+    return {
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'commit': commit,
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'machine': platform.machine(),
+        'platform': platform.platform(),
+        'sizes': list(sizes),
+        'repeat': repeat,
+        'max_calls': max_calls,
+    }
+
+
+# ============================================================================
+# 3. BASELINE COMPARISON
+# ============================================================================
+
+def compare(current: Dict, baseline: Dict,
+            tolerance: float = DEFAULT_TOLERANCE) -> List[Dict]:
+    """
+    Bandingkan waktu relatif (ns_per_item / referensi) dengan baseline
+
+    Returns:
+        List case yang melambat lebih dari `tolerance` (0.25 = 25%)
+    """
+
+    regressions = []
+    for name, result in current['results'].items():
+        ratio = _ratio(result, baseline['results'].get(name))
+        if ratio is not None and ratio > 1 + tolerance:
+            base = baseline['results'][name]
+            regressions.append({'case': name, 'baseline_relative': base['relative'],
+                                'current_relative': result['relative'], 'ratio': ratio})
+    return sorted(regressions, key=lambda r: r['ratio'], reverse=True)
+
+
+def _ratio(result: Dict, base: Optional[Dict]) -> Optional[float]:
+    # Baseline lama tanpa 'relative' (timing absolut) tidak dibandingkan
+    if not base or not base.get('relative'):
+        return None
+    return result['relative'] / base['relative']
+
+
+def _print_table(current: Dict, baseline: Optional[Dict]) -> None:
+    base_results = baseline['results'] if baseline else {}
+    print(f"{'case':<70} {'ns/item':>12} {'items/s':>14} {'rel':>8} {'vs base':>8}")
+    for name, result in current['results'].items():
+        ratio = _ratio(result, base_results.get(name))
+        print(f"{name:<70} {result['ns_per_item']:>12.1f} "
+              f"{result['items_per_sec']:>14,.0f} {result['relative']:>8.3f} "
+              f"{'' if ratio is None else f'{ratio:.2f}x':>8}")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES))
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--max-calls', type=int, default=100_000,
+                        help='batas jumlah panggilan untuk case per-bar')
+    parser.add_argument('--output', help='tulis hasil ke file JSON')
+    parser.add_argument('--baseline', help='file JSON baseline untuk dibandingkan')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    _logger.setLevel(logging.WARNING)
+
+    current = run_benchmarks(args.sizes, args.repeat, args.max_calls)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(current, f, indent=2)
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    _print_table(current, baseline)
+
+    if baseline:
+        regressions = compare(current, baseline, args.tolerance)
+        for r in regressions:
+            print(f"REGRESSION {r['case']}: {r['baseline_relative']:.3f} -> "
+                  f"{r['current_relative']:.3f} x reference ({r['ratio']:.2f}x)")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,186 @@
+"""
+Bot Configuration & Strategy Registry
+BotConfig dan registry strategi tanpa dependency berat (hanya stdlib), supaya
+CLI, worker dan cron job bisa parse/validasi config tanpa import pandas/numpy.
+
+Strategi didaftarkan sebagai path 'module:Class' dan baru di-import saat
+dipakai (load_strategy). trading_bot me-re-export BotConfig.
+"""
+
+import importlib
+from dataclasses import dataclass, fields
+from typing import Any, Dict, List, Optional, Union
+
+
+EXIT_MODELS = ('close', 'high_low')
+ORDER_TYPES = ('market', 'limit')
+EVENT_LOG_KINDS = ('logging', 'silent', 'jsonl', 'binary')
+
+
+@dataclass
+class BotConfig:
+    """Konfigurasi Bot Trading"""
+    # Strategy Parameters
+    fast_ma_period: int = 20
+    slow_ma_period: int = 50
+    rsi_period: int = 14
+    rsi_overbought: float = 70
+    rsi_oversold: float = 30
+
+    # Risk Management
+    account_size: float = 10000.0
+    risk_per_trade: float = 0.02  # 2% per trade
+    max_position_size: float = 0.05  # Max 5% per position
+    max_daily_loss: float = 0.05  # Max 5% daily loss
+    max_drawdown: float = 0.20  # Max 20% drawdown
+
+    # Trade Management
+    rr_ratio: float = 2.0  # Risk-Reward 1:2
+    atr_multiplier_sl: float = 1.5  # Stop Loss = Entry - ATR * 1.5
+    atr_multiplier_tp: float = 2.0  # Take Profit = Entry + ATR * 2.0
+    atr_period: int = 14
+
+    # Execution
+    order_type: str = "market"  # "market" or "limit"
+    exit_model: str = "close"  # SL/TP check: 'close' atau 'high_low' (intrabar, lihat ExitResolver)
+    order_history_size: int = 10_000  # order terminal yang disimpan di memory
+    order_spill_path: str = ""  # JSONL untuk order yang keluar dari history ("" = buang)
+    max_slippage: float = 0.01  # 1% max slippage
+
+    # Monitoring
+    log_level: str = "INFO"
+    save_trades: bool = True  # closed trades ikut ditulis ke results_db
+    results_db: str = ""  # SQLite ResultsStore untuk hasil backtest ("" = tidak disimpan)
+    collect_metrics: bool = False  # per-stage latency histograms (TradingBot.metrics)
+    record_equity_curve: bool = True  # simpan equity per bar (TradingBot.equity_curve)
+    event_log: str = "logging"  # 'logging', 'silent', 'jsonl:<path>', 'binary:<path>'
+    # strategy selector: nama di STRATEGIES (mis. 'macrossover_rsi', 'mean_reversion')
+    strategy: str = "macrossover_rsi"
+
+    def validate(self) -> List[str]:
+        """Cek nilai config, return list pesan error (kosong = valid)"""
+
+        errors = []
+        for name in ('fast_ma_period', 'slow_ma_period', 'rsi_period', 'atr_period'):
+            if getattr(self, name) <= 0:
+                errors.append(f"{name} must be positive")
+        if self.fast_ma_period >= self.slow_ma_period:
+            errors.append("fast_ma_period must be smaller than slow_ma_period")
+        if not 0 <= self.rsi_oversold < self.rsi_overbought <= 100:
+            errors.append("RSI levels must satisfy 0 <= rsi_oversold < rsi_overbought <= 100")
+
+        if self.account_size <= 0:
+            errors.append("account_size must be positive")
+        for name in ('risk_per_trade', 'max_position_size', 'max_daily_loss', 'max_drawdown'):
+            if not 0 < getattr(self, name) <= 1:
+                errors.append(f"{name} must be in (0, 1]")
+        for name in ('rr_ratio', 'atr_multiplier_sl', 'atr_multiplier_tp'):
+            if getattr(self, name) <= 0:
+                errors.append(f"{name} must be positive")
+
+        if self.order_type not in ORDER_TYPES:
+            errors.append(f"order_type must be one of {ORDER_TYPES}")
+        if self.exit_model not in EXIT_MODELS:
+            errors.append(f"exit_model must be one of {EXIT_MODELS}")
+        if self.order_history_size < 0:
+            errors.append("order_history_size must not be negative")
+        kind, _, path = self.event_log.partition(':')
+        if kind.lower() not in EVENT_LOG_KINDS or (kind.lower() in ('jsonl', 'binary') and not path):
+            errors.append("event_log must be 'logging', 'silent', 'jsonl:<path>' or 'binary:<path>'")
+        if resolve_strategy_name(self.strategy) is None:
+            errors.append(f"Unknown strategy: {self.strategy!r}. Use one of {sorted(STRATEGIES)}")
+        return errors
+
+
+def config_from_dict(values: Dict[str, Any], base: Optional[BotConfig] = None) -> BotConfig:
+    """BotConfig dari dict (mis. file JSON), value string dikonversi ke tipe field"""
+
+    types = {f.name: f.type for f in fields(BotConfig)}
+    unknown = set(values) - set(types)
+    if unknown:
+        raise ValueError(f"Unknown BotConfig fields: {sorted(unknown)}")
+
+    current = dict((base or BotConfig()).__dict__)
+    for name, value in values.items():
+        current[name] = parse_field(types[name], value) if isinstance(value, str) else value
+    return BotConfig(**current)
+
+
+def parse_field(field_type: Any, value: str) -> Any:
+    """Konversi string CLI ('20', '0.5', 'true') ke tipe field BotConfig"""
+
+    if field_type in (bool, 'bool'):
+        lowered = value.lower()
+        if lowered in ('1', 'true', 'yes', 'on'):
+            return True
+        if lowered in ('0', 'false', 'no', 'off'):
+            return False
+        raise ValueError(f"Invalid boolean: {value!r}")
+    if field_type in (int, 'int'):
+        return int(value.replace('_', ''))
+    if field_type in (float, 'float'):
+        return float(value)
+    return value
+
+
+# ============================================================================
+# STRATEGY REGISTRY
+# ============================================================================
+
+# nama -> 'module:Class', module di-import saat strategi pertama kali dipakai
+STRATEGIES: Dict[str, str] = {
+    'macrossover_rsi': 'trading_bot:MACrossoverRSIStrategy',
+    'mean_reversion': 'trading_bot:MeanReversionStrategy',
+}
+
+STRATEGY_ALIASES: Dict[str, str] = {
+    'meanreversion': 'mean_reversion',
+    'mean_rev': 'mean_reversion',
+}
+
+DEFAULT_STRATEGY = 'macrossover_rsi'
+
+
+# Class yang sudah di-import: diisi load_strategy, atau langsung oleh modul
+# strategi lewat register_strategy (sehingga tidak di-import ulang)
+_STRATEGY_CLASSES: Dict[str, type] = {}
+
+
+def register_strategy(name: str, target: Union[str, type], aliases: tuple = ()) -> None:
+    """Daftarkan strategi sebagai path 'module:Class' (import ditunda) atau class"""
+
+    name = name.lower()
+    if isinstance(target, str):
+        if ':' not in target:
+            raise ValueError(f"Strategy path must be 'module:Class', got {target!r}")
+        STRATEGIES[name] = target
+        _STRATEGY_CLASSES.pop(name, None)
+    else:
+        STRATEGIES.setdefault(name, f"{target.__module__}:{target.__qualname__}")
+        _STRATEGY_CLASSES[name] = target
+    for alias in aliases:
+        STRATEGY_ALIASES[alias.lower()] = name
+
+
+def resolve_strategy_name(name: str) -> Optional[str]:
+    """Nama kanonik di STRATEGIES, path 'module:Class' apa adanya, atau None"""
+
+    if ':' in name:
+        return name
+    name = name.lower()
+    name = STRATEGY_ALIASES.get(name, name)
+    return name if name in STRATEGIES else None
+
+
+def load_strategy(name: str) -> type:
+    """Import dan return class strategi untuk nama atau path 'module:Class'"""
+
+    resolved = resolve_strategy_name(name)
+    if resolved is None:
+        raise ValueError(f"Unknown strategy: {name!r}. Use one of {sorted(STRATEGIES)}")
+    strategy_cls = _STRATEGY_CLASSES.get(resolved)
+    if strategy_cls is None:
+        module_name, _, class_name = STRATEGIES.get(resolved, resolved).partition(':')
+        strategy_cls = getattr(importlib.import_module(module_name), class_name)
+        _STRATEGY_CLASSES[resolved] = strategy_cls
+    return strategy_cls
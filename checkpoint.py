@@ -0,0 +1,252 @@
+"""
+Binary Checkpoint / Restore
+Snapshot state TradingBot (account, open trades, ledger, order store, state
+strategi + incremental indicator) dan buffer AsyncLiveRunner ke satu file
+biner, supaya bot yang restart langsung trading lagi tanpa replay history.
+
+Layout file:
+    [0:8]    magic b'AHACKPT1'
+    [8:12]   versi format (uint32 little-endian)
+    [12:16]  flags (bit 0 = payload zlib)
+    [16:24]  panjang payload (uint64)
+    [24:28]  crc32 payload
+    [28:64]  reserved
+    [64:]    payload: pickle protocol 5 dari dict state
+
+File ditulis ke .tmp lalu os.replace, jadi checkpoint lama tetap utuh jika
+proses mati di tengah penulisan. Payload dibaca lewat unpickler yang hanya
+mengizinkan daftar global tertentu (builtin, datetime, array/scalar numpy
+dan Timestamp/Timedelta pandas), global lain ditolak.
+
+Contoh:
+    checkpointer = Checkpointer('bot.ckpt', bot, interval=30.0)
+    runner = AsyncLiveRunner(bot, checkpointer=checkpointer)
+    ...
+    # setelah restart
+    bot = TradingBot(config, create_strategy(config, logger), logger)
+    runner = AsyncLiveRunner(bot)
+    load_checkpoint('bot.ckpt', bot, runner)
+"""
+
+import io
+import os
+import pickle
+import struct
+import time
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Optional
+
+from live_runner import AsyncLiveRunner
+from trading_bot import TradingBot
+
+
+MAGIC = b'AHACKPT1'
+VERSION = 1
+HEADER_SIZE = 64
+HEADER_FORMAT = '<8sIIQI'
+
+FLAG_ZLIB = 1
+
+# Global yang boleh di-load dari payload
+_SAFE_BUILTINS = {'complex', 'frozenset', 'set', 'slice', 'range', 'bytearray'}
+# (module, name) persis; numpy 1.x memakai numpy.core, numpy 2.x numpy._core
+_SAFE_GLOBALS = frozenset({
+    ('datetime', 'datetime'), ('datetime', 'date'), ('datetime', 'time'),
+    ('datetime', 'timedelta'), ('datetime', 'timezone'),
+    ('numpy', 'dtype'), ('numpy', 'ndarray'),
+    ('numpy.core.multiarray', '_reconstruct'), ('numpy._core.multiarray', '_reconstruct'),
+    ('numpy.core.multiarray', 'scalar'), ('numpy._core.multiarray', 'scalar'),
+    ('numpy.core.numeric', '_frombuffer'), ('numpy._core.numeric', '_frombuffer'),
+    ('pandas._libs.tslibs.timestamps', '_unpickle_timestamp'),
+    ('pandas._libs.tslibs.timedeltas', '_timedelta_unpickle'),
+})
+
+
+class _StateUnpickler(pickle.Unpickler):
+    def find_class(self, module: str, name: str):
+        if (module == 'builtins' and name in _SAFE_BUILTINS) or (module, name) in _SAFE_GLOBALS:
+            return super().find_class(module, name)
+        raise pickle.UnpicklingError(f"Checkpoint refers to disallowed global {module}.{name}")
+
+
+# ============================================================================
+# 1. FILE FORMAT
+# ============================================================================
+
+def encode_state(state: Dict, compress: bool = True) -> bytes:
+    """Serialize state ke bytes checkpoint (header + payload)"""
+
+    payload = pickle.dumps(state, protocol=5)
+    flags = 0
+    if compress:
+        payload = zlib.compress(payload, 1)
+        flags |= FLAG_ZLIB
+    header = struct.pack(HEADER_FORMAT, MAGIC, VERSION, flags, len(payload),
+                         zlib.crc32(payload))
+    return header.ljust(HEADER_SIZE, b'\0') + payload
+
+
+def decode_state(raw: bytes) -> Dict:
+    """Kebalikan encode_state; validasi magic, versi, panjang dan crc"""
+
+    if len(raw) < HEADER_SIZE:
+        raise ValueError("Truncated checkpoint header")
+    magic, version, flags, length, crc = struct.unpack_from(HEADER_FORMAT, raw)
+    if magic != MAGIC:
+        raise ValueError("Not a checkpoint file")
+    if version != VERSION:
+        raise ValueError(f"Unsupported checkpoint version {version} (expected {VERSION})")
+
+    payload = memoryview(raw)[HEADER_SIZE:]
+    if len(payload) != length:
+        raise ValueError(f"Truncated checkpoint payload: {len(payload)} of {length} bytes")
+    if zlib.crc32(payload) != crc:
+        raise ValueError("Checkpoint checksum mismatch")
+    if flags & FLAG_ZLIB:
+        payload = zlib.decompress(payload)
+    return _StateUnpickler(io.BytesIO(payload)).load()
+
+
+def write_checkpoint(path: str, state: Dict, compress: bool = True) -> int:
+    """Tulis state secara atomic, return ukuran file"""
+
+    raw = encode_state(state, compress)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(raw)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    return len(raw)
+
+
+def read_checkpoint(path: str) -> Dict:
+    """Baca dan validasi file checkpoint"""
+
+    with open(path, 'rb') as f:
+        return decode_state(f.read())
+
+
+# ============================================================================
+# 2. BOT / RUNNER
+# ============================================================================
+
+def capture_state(bot: TradingBot, runner: Optional[AsyncLiveRunner] = None) -> Dict:
+    """State bot, atau state runner (sudah termasuk bot) jika runner diberikan"""
+
+    if runner is not None:
+        return {'runner': runner.get_state()}
+    return {'bot': bot.get_state()}
+
+
+def restore_state(state: Dict, bot: TradingBot,
+                  runner: Optional[AsyncLiveRunner] = None) -> None:
+    """
+    Restore ke bot (dan runner) baru dengan config yang sama
+
+    Runner harus dibuat untuk bot tersebut sebelum restore, supaya state
+    indikator masuk ke object yang dipakai stream runner.
+    """
+
+    if 'runner' in state:
+        if runner is None:
+            bot.set_state(state['runner']['bot'])
+        else:
+            runner.set_state(state['runner'])
+    else:
+        bot.set_state(state['bot'])
+
+
+def save_checkpoint(path: str, bot: TradingBot, runner: Optional[AsyncLiveRunner] = None,
+                    compress: bool = True) -> int:
+    """Snapshot dan tulis checkpoint secara sinkron"""
+    return write_checkpoint(path, capture_state(bot, runner), compress)
+
+
+def load_checkpoint(path: str, bot: TradingBot,
+                    runner: Optional[AsyncLiveRunner] = None) -> Dict:
+    """Baca checkpoint dan restore ke bot/runner, return state mentah"""
+
+    state = read_checkpoint(path)
+    restore_state(state, bot, runner)
+    return state
+
+
+# ============================================================================
+# 3. PERIODIC CHECKPOINTER
+# ============================================================================
+
+class Checkpointer:
+    """
+    Checkpoint periodik di luar hot path
+
+    maybe_checkpoint() dipanggil setelah setiap candle dan hanya membandingkan
+    jam monotonic. Saat interval lewat, state diambil di thread pemanggil
+    (konsisten dengan candle terakhir) lalu serialize + fsync dikerjakan
+    thread background. Snapshot dilewati jika penulisan sebelumnya belum
+    selesai.
+    """
+
+    def __init__(self, path: str, bot: TradingBot, runner: Optional[AsyncLiveRunner] = None,
+                 interval: float = 60.0, compress: bool = True):
+        self.path = path
+        self.bot = bot
+        self.runner = runner
+        self.interval = interval
+        self.compress = compress
+
+        self.checkpoints = 0
+        self.skipped = 0
+        self.last_size = 0
+        self.last_error: Optional[BaseException] = None
+
+        self._next_at = time.monotonic() + interval
+        self._pending: Optional[Future] = None
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='checkpoint')
+
+    def maybe_checkpoint(self) -> bool:
+        """Snapshot jika interval sudah lewat"""
+        if time.monotonic() < self._next_at:
+            return False
+        return self.snapshot()
+
+    def snapshot(self) -> bool:
+        """Ambil state sekarang dan jadwalkan penulisan di background"""
+
+        self._next_at = time.monotonic() + self.interval
+        if self._pending is not None and not self._pending.done():
+            self.skipped += 1
+            return False
+
+        state = capture_state(self.bot, self.runner)
+        self._pending = self._pool.submit(self._write, state)
+        return True
+
+    def _write(self, state: Dict) -> None:
+        try:
+            self.last_size = write_checkpoint(self.path, state, self.compress)
+            self.checkpoints += 1
+        except Exception as e:
+            self.last_error = e
+            self.bot.logger.error("Checkpoint write failed: %s", e)
+
+    def wait(self) -> None:
+        """Tunggu penulisan yang sedang berjalan"""
+        if self._pending is not None:
+            self._pending.result()
+
+    def close(self, final: bool = True) -> None:
+        """Tunggu penulisan, optionally tulis snapshot terakhir, lalu stop thread"""
+
+        self.wait()
+        if final:
+            self.snapshot()
+            self.wait()
+        self._pool.shutdown(wait=True)
+
+    def __enter__(self) -> 'Checkpointer':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,411 @@
+"""
+Command Line Interface
+Entry point untuk backtest, parameter sweep, live (replay) dan report.
+
+Module ini hanya meng-import stdlib dan bot_config di top level; pandas,
+numpy, trading_bot dan modul strategi baru di-import di dalam subcommand
+yang membutuhkannya, sehingga --help dan validasi config selesai dalam
+puluhan milidetik.
+
+Contoh:
+    python cli.py validate --config bot.json --set exit_model=high_low
+    python cli.py backtest --data history.csv --strategy mean_reversion
+    python cli.py backtest --synthetic 100000 --engine vectorized --output report.json
+    python cli.py backtest --data history.csv --monte-carlo 100000 --skip-prob 0.05
+    python cli.py sweep --data store/ --grid fast_ma_period=10,20 --grid slow_ma_period=50,100
+    python cli.py search --data history.csv --grid fast_ma_period=5,10,20 --grid rsi_period=10,14 --eta 4
+    python cli.py walkforward --data history.csv --grid rsi_period=10,14 --train-bars 20000 --test-bars 5000
+    python cli.py live --data history.csv --interval 0.01
+    python cli.py report sweep.csv --sort profit_factor --top 10
+    python cli.py report results.db --top 20 --where "max_drawdown<10"
+"""
+
+import argparse
+import json
+import os
+import sys
+from dataclasses import asdict, fields
+from typing import Dict, List, Optional, Sequence
+
+from bot_config import STRATEGIES, BotConfig, config_from_dict, parse_field
+
+
+# ============================================================================
+# 1. CONFIG & DATA
+# ============================================================================
+
+def build_config(args: argparse.Namespace) -> BotConfig:
+    """BotConfig dari --config JSON, lalu --strategy dan --set FIELD=VALUE"""
+
+    values: Dict[str, object] = {}
+    if args.config:
+        with open(args.config) as f:
+            values.update(json.load(f))
+    if args.strategy:
+        values['strategy'] = args.strategy
+    for item in args.set or ():
+        name, sep, value = item.partition('=')
+        if not sep:
+            raise ValueError(f"--set expects FIELD=VALUE, got {item!r}")
+        values[name.strip()] = value.strip()
+    return config_from_dict(values)
+
+
+def load_data(args: argparse.Namespace):
+    """DataFrame OHLCV dari --data (CSV, Parquet atau directory OHLCVStore) atau --synthetic"""
+
+    if args.data is None:
+        from data_utils import make_ohlcv
+        return make_ohlcv(args.synthetic, seed=args.seed)
+
+    if os.path.isdir(args.data):
+        from ohlcv_store import OHLCVStore
+        return OHLCVStore(args.data).to_frame()
+
+    import pandas as pd
+    if args.data.endswith(('.parquet', '.pq')):
+        return pd.read_parquet(args.data)
+    return pd.read_csv(args.data)
+
+
+def _setup_logging(args: argparse.Namespace, config: BotConfig):
+    import logging
+    logging.basicConfig(level=(args.log_level or config.log_level).upper(),
+                        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    return logging.getLogger('cli')
+
+
+def _write_json(result: Dict, output: Optional[str]) -> None:
+    text = json.dumps(result, indent=2, default=str)
+    if output:
+        with open(output, 'w') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+
+
+# ============================================================================
+# 2. SUBCOMMANDS
+# ============================================================================
+
+def cmd_validate(args: argparse.Namespace, config: BotConfig) -> int:
+    print(json.dumps(asdict(config), indent=2))
+    return 0
+
+
+def cmd_backtest(args: argparse.Namespace, config: BotConfig) -> int:
+    logger = _setup_logging(args, config)
+    from trading_bot import TradingBot, create_strategy
+
+    bot = TradingBot(config, create_strategy(config, logger), logger)
+    if args.engine == 'streaming':
+        from data_stream import iter_chunks, run_streaming_backtest
+        if args.data is None:
+            raise ValueError("--engine streaming requires --data")
+        report = run_streaming_backtest(bot, iter_chunks(args.data, args.chunksize),
+                                        args.start_idx)
+    elif args.engine == 'vectorized':
+        report = bot.run_backtest_vectorized(load_data(args), args.start_idx)
+    else:
+        report = bot.run_backtest(load_data(args), args.start_idx)
+    bot.events.close()
+
+    result = {'config': asdict(config), 'report': report}
+    if args.monte_carlo:
+        from monte_carlo import run_monte_carlo
+        result['monte_carlo'] = run_monte_carlo(bot, args.monte_carlo,
+                                                skip_prob=args.skip_prob,
+                                                slippage=args.slippage, seed=args.seed)
+    _write_json(result, args.output)
+    return 0
+
+
+def _grid_configs(args: argparse.Namespace, config: BotConfig) -> List[BotConfig]:
+    """Kombinasi --grid FIELD=V1,V2 di atas config, semua sudah divalidasi"""
+
+    grid = {}
+    types = {f.name: f.type for f in fields(BotConfig)}
+    for item in args.grid:
+        name, sep, values = item.partition('=')
+        if not sep or name not in types:
+            raise ValueError(f"--grid expects FIELD=V1,V2,... with a BotConfig field, got {item!r}")
+        grid[name] = [parse_field(types[name], value) for value in values.split(',')]
+
+    from parameter_sweep import grid_configs
+
+    configs = grid_configs(config, grid)
+    for i, candidate in enumerate(configs):
+        errors = candidate.validate()
+        if errors:
+            raise ValueError(f"Invalid config #{i} in grid: {'; '.join(errors)}")
+    return configs
+
+
+def cmd_sweep(args: argparse.Namespace, config: BotConfig) -> int:
+    _setup_logging(args, config)
+    configs = _grid_configs(args, config)
+    from parameter_sweep import run_sweep
+
+    results = run_sweep(load_data(args), configs, processes=args.processes,
+                        start_idx=args.start_idx, vectorized=args.engine == 'vectorized',
+                        label=args.label)
+    if args.output:
+        results.to_csv(args.output, index=False)
+    columns = [item.partition('=')[0] for item in args.grid] + ['total_trades', 'win_rate',
+                                                                'total_pnl', 'profit_factor']
+    ranked = results.sort_values(args.sort, ascending=False) if args.sort in results else results
+    print(ranked[[c for c in columns if c in ranked]].head(args.top).to_string(index=False))
+    return 0
+
+
+def cmd_search(args: argparse.Namespace, config: BotConfig) -> int:
+    _setup_logging(args, config)
+    configs = _grid_configs(args, config)
+    from adaptive_search import successive_halving
+
+    result = successive_halving(load_data(args), configs, start_idx=args.start_idx,
+                                min_fraction=args.min_fraction, eta=args.eta,
+                                metric=args.metric, min_trades=args.min_trades,
+                                processes=args.processes,
+                                vectorized=args.engine == 'vectorized')
+    if args.output:
+        result.table.to_csv(args.output, index=False)
+    columns = ([item.partition('=')[0] for item in args.grid] +
+               ['rung', 'end_idx', 'score', 'total_trades', 'win_rate', 'total_pnl'])
+    print(result.table[[c for c in columns if c in result.table]].head(args.top)
+          .to_string(index=False))
+    print(json.dumps(result.stats, indent=2))
+    return 0
+
+
+def cmd_walkforward(args: argparse.Namespace, config: BotConfig) -> int:
+    _setup_logging(args, config)
+    configs = _grid_configs(args, config)
+    from walk_forward import run_walk_forward
+
+    result = run_walk_forward(load_data(args), configs, args.train_bars, args.test_bars,
+                              start_idx=args.start_idx, anchored=args.anchored,
+                              metric=args.metric, min_trades=args.min_trades,
+                              processes=args.processes,
+                              vectorized=args.engine == 'vectorized')
+    if args.output:
+        result.table.to_csv(args.output, index=False)
+    if args.equity_output:
+        result.equity.to_csv(args.equity_output, index_label='bar')
+    print(result.table.to_string(index=False))
+    print(json.dumps(result.stats(), indent=2))
+    return 0
+
+
+def cmd_live(args: argparse.Namespace, config: BotConfig) -> int:
+    logger = _setup_logging(args, config)
+    from live_runner import run_simulation
+
+    stats = run_simulation(load_data(args), config, logger, interval=args.interval,
+                           order_latency=args.order_latency, offload=not args.inline)
+    _write_json(stats, args.output)
+    return 0
+
+
+STORE_SUFFIXES = ('.db', '.sqlite', '.sqlite3')
+
+
+def _store_rows(args: argparse.Namespace) -> List[Dict[str, str]]:
+    """Top run dari ResultsStore sesuai --sort/--top/--where, params di-flatten"""
+
+    from results_store import FILTER_OPERATORS, ResultsStore
+
+    filters = []
+    for item in args.where or ():
+        # Operator dua karakter dicek lebih dulu ('<=' sebelum '<')
+        for op in sorted(FILTER_OPERATORS, key=len, reverse=True):
+            name, sep, value = item.partition(op)
+            if sep:
+                filters.append((name.strip(), op, float(value)))
+                break
+        else:
+            raise ValueError(f"--where expects METRIC<OP>VALUE, got {item!r}")
+
+    with ResultsStore(args.path) as store:
+        runs = store.top_runs(args.sort, args.top, filters, kind=args.kind)
+    return [{name: '' if value is None else str(value)
+             for name, value in {**run.pop('params'), **run}.items()} for run in runs]
+
+
+def cmd_report(args: argparse.Namespace, config: Optional[BotConfig]) -> int:
+    """Ringkas output backtest (JSON), hasil sweep (CSV) atau ResultsStore (SQLite) tanpa pandas"""
+
+    if args.path.endswith('.json'):
+        with open(args.path) as f:
+            result = json.load(f)
+        report = result.get('report', result)
+        width = max(map(len, report), default=0)
+        for name, value in report.items():
+            print(f"{name:<{width}}  {value}")
+        return 0
+
+    if args.path.endswith(STORE_SUFFIXES):
+        # Sudah di-sort dan di-filter oleh SQL
+        rows = _store_rows(args)
+        default_columns = ('run_id', 'kind', 'strategy', 'fast_ma_period', 'slow_ma_period',
+                           'total_trades', 'win_rate', 'total_pnl', 'profit_factor',
+                           'max_drawdown')
+    else:
+        import csv
+        with open(args.path, newline='') as f:
+            rows = list(csv.DictReader(f))
+
+        def sort_key(row: Dict[str, str]) -> float:
+            # Nilai kosong / bukan angka / NaN selalu di bawah
+            try:
+                value = float(row.get(args.sort) or 'nan')
+            except ValueError:
+                return float('-inf')
+            return value if value == value else float('-inf')
+
+        rows.sort(key=sort_key, reverse=True)
+        default_columns = ('config_id', 'strategy', 'fast_ma_period', 'slow_ma_period',
+                           'total_trades', 'win_rate', 'total_pnl', 'profit_factor')
+
+    if not rows:
+        print("(empty)")
+        return 0
+    columns = args.columns or [c for c in default_columns if c in rows[0]]
+    widths = {c: max(len(c), *(len(row.get(c, '')) for row in rows[:args.top])) for c in columns}
+    print('  '.join(c.rjust(widths[c]) for c in columns))
+    for row in rows[:args.top]:
+        print('  '.join(row.get(c, '').rjust(widths[c]) for c in columns))
+    return 0
+
+
+# ============================================================================
+# 3. PARSER
+# ============================================================================
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='cli.py', description=__doc__.strip().splitlines()[0])
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    config_args = argparse.ArgumentParser(add_help=False)
+    config_args.add_argument('--config', help='file JSON berisi field BotConfig')
+    config_args.add_argument('--strategy', help=f"nama strategi ({', '.join(sorted(STRATEGIES))}) "
+                                                "atau path module:Class")
+    config_args.add_argument('--set', action='append', metavar='FIELD=VALUE',
+                             help='override satu field BotConfig (bisa diulang)')
+    config_args.add_argument('--log-level', help='default: BotConfig.log_level')
+
+    data_args = argparse.ArgumentParser(add_help=False)
+    data_args.add_argument('--data', help='CSV, Parquet atau directory OHLCVStore')
+    data_args.add_argument('--synthetic', type=int, default=10_000,
+                           help='jumlah bar random walk jika --data tidak diberikan')
+    data_args.add_argument('--seed', type=int, default=42)
+    data_args.add_argument('--start-idx', type=int, default=200)
+    data_args.add_argument('--output', help='tulis hasil ke file (default: stdout)')
+
+    validate = subparsers.add_parser('validate', parents=[config_args],
+                                     help='validasi config dan tampilkan hasil akhirnya')
+    validate.set_defaults(handler=cmd_validate)
+
+    backtest = subparsers.add_parser('backtest', parents=[config_args, data_args],
+                                     help='backtest satu config')
+    backtest.add_argument('--engine', choices=('event', 'vectorized', 'streaming'),
+                          default='event')
+    backtest.add_argument('--chunksize', type=int, default=100_000,
+                          help='baris per chunk untuk --engine streaming')
+    backtest.add_argument('--monte-carlo', type=int, metavar='PATHS',
+                          help='resample closed trades menjadi PATHS equity path')
+    backtest.add_argument('--skip-prob', type=float, default=0.0,
+                          help='peluang trade di-skip per path Monte Carlo')
+    backtest.add_argument('--slippage', type=float, default=0.0,
+                          help='slippage maksimum per fill (fraksi notional) untuk Monte Carlo')
+    backtest.set_defaults(handler=cmd_backtest)
+
+    sweep = subparsers.add_parser('sweep', parents=[config_args, data_args],
+                                  help='grid parameter sweep paralel')
+    sweep.add_argument('--grid', action='append', required=True, metavar='FIELD=V1,V2',
+                       help='nilai untuk satu field BotConfig (bisa diulang)')
+    sweep.add_argument('--processes', type=int)
+    sweep.add_argument('--engine', choices=('event', 'vectorized'), default='vectorized')
+    sweep.add_argument('--sort', default='profit_factor')
+    sweep.add_argument('--top', type=int, default=10)
+    sweep.add_argument('--label', default='', help='label batch di results_db')
+    sweep.set_defaults(handler=cmd_sweep)
+
+    search = subparsers.add_parser('search', parents=[config_args, data_args],
+                                   help='successive halving atas --grid (prefix pendek dulu)')
+    search.add_argument('--grid', action='append', required=True, metavar='FIELD=V1,V2',
+                        help='nilai untuk satu field BotConfig (bisa diulang)')
+    search.add_argument('--min-fraction', type=float, default=0.1,
+                        help='panjang prefix rung pertama (fraksi history)')
+    search.add_argument('--eta', type=float, default=3.0,
+                        help='faktor eliminasi dan pertambahan history per rung')
+    search.add_argument('--metric', default='profit_factor')
+    search.add_argument('--min-trades', type=int, default=1)
+    search.add_argument('--processes', type=int)
+    search.add_argument('--engine', choices=('event', 'vectorized'), default='vectorized')
+    search.add_argument('--top', type=int, default=10)
+    search.set_defaults(handler=cmd_search)
+
+    walkforward = subparsers.add_parser('walkforward', parents=[config_args, data_args],
+                                        help='optimasi --grid per train window, '
+                                             'evaluasi out-of-sample')
+    walkforward.add_argument('--grid', action='append', required=True, metavar='FIELD=V1,V2',
+                             help='nilai untuk satu field BotConfig (bisa diulang)')
+    walkforward.add_argument('--train-bars', type=int, required=True)
+    walkforward.add_argument('--test-bars', type=int, required=True)
+    walkforward.add_argument('--anchored', action='store_true',
+                             help='train window expanding dari --start-idx')
+    walkforward.add_argument('--metric', default='profit_factor',
+                             help='kolom get_overall_report untuk memilih config')
+    walkforward.add_argument('--min-trades', type=int, default=1)
+    walkforward.add_argument('--processes', type=int)
+    walkforward.add_argument('--engine', choices=('event', 'vectorized'), default='vectorized')
+    walkforward.add_argument('--equity-output', help='tulis equity out-of-sample ke CSV')
+    walkforward.set_defaults(handler=cmd_walkforward)
+
+    live = subparsers.add_parser('live', parents=[config_args, data_args],
+                                 help='replay data lewat SimulatedExchange dan AsyncLiveRunner')
+    live.add_argument('--interval', type=float, default=0.0, help='detik antar candle')
+    live.add_argument('--order-latency', type=float, default=0.0)
+    live.add_argument('--inline', action='store_true',
+                      help='process_candle di event loop (tanpa thread worker)')
+    live.set_defaults(handler=cmd_live)
+
+    report = subparsers.add_parser('report', help='ringkas output backtest (.json), sweep (.csv) '
+                                                  'atau results store (.db)')
+    report.add_argument('path')
+    report.add_argument('--sort', default='profit_factor')
+    report.add_argument('--top', type=int, default=10)
+    report.add_argument('--columns', nargs='+')
+    report.add_argument('--where', action='append', metavar='METRIC<VALUE',
+                        help='filter results store, mis. "max_drawdown<10" (bisa diulang)')
+    report.add_argument('--kind', help='filter results store: backtest, sweep, ...')
+    report.set_defaults(handler=cmd_report)
+
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    config = None
+    if args.command != 'report':
+        # Validasi sebelum import modul berat: config salah gagal dalam milidetik
+        try:
+            config = build_config(args)
+        except (OSError, ValueError) as e:
+            parser.error(str(e))
+        errors = config.validate()
+        if errors:
+            parser.error('invalid config: ' + '; '.join(errors))
+
+    try:
+        return args.handler(args, config)
+    except ValueError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,138 @@
+"""
+Chunked Streaming Data Source
+Baca history CSV/Parquet (atau OHLCVStore) per chunk dengan ukuran tetap dan
+feed ke TradingBot.process_candle lewat generator, sehingga backtest yang
+lebih besar dari RAM tetap jalan dengan peak memory yang flat.
+
+Setiap chunk digabung dengan `lookback` bar terakhir dari chunk sebelumnya
+supaya indikator (SMA, RSI, ATR, Bollinger, rata-rata volume) sudah warm-up
+di bar pertama chunk baru.
+"""
+
+import os
+from typing import Iterable, Iterator, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from ohlcv_store import OHLCVStore
+from trading_bot import BotConfig, TradingBot
+
+
+OHLCV_COLUMNS = ('timestamp', 'open', 'high', 'low', 'close', 'volume')
+
+
+# ============================================================================
+# 1. CHUNK READERS
+# ============================================================================
+
+def iter_csv_chunks(path: str, chunksize: int = 100_000,
+                    columns: Optional[Sequence[str]] = None) -> Iterator[pd.DataFrame]:
+    """Baca CSV per chunk"""
+
+    header = pd.read_csv(path, nrows=0).columns
+    usecols = [c for c in (columns or OHLCV_COLUMNS) if c in header]
+    yield from pd.read_csv(path, chunksize=chunksize, usecols=usecols)
+
+
+def iter_parquet_chunks(path: str, chunksize: int = 100_000,
+                        columns: Optional[Sequence[str]] = None) -> Iterator[pd.DataFrame]:
+    """Baca Parquet per record batch (butuh pyarrow)"""
+
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Parquet streaming requires pyarrow: pip install pyarrow") from e
+
+    parquet = pq.ParquetFile(path)
+    names = set(parquet.schema_arrow.names)
+    usecols = [c for c in (columns or OHLCV_COLUMNS) if c in names]
+    for batch in parquet.iter_batches(batch_size=chunksize, columns=usecols):
+        yield batch.to_pandas()
+
+
+def iter_store_chunks(store: OHLCVStore, chunksize: int = 100_000) -> Iterator[pd.DataFrame]:
+    """Window zero-copy dari OHLCVStore per chunk"""
+
+    for start in range(0, len(store), chunksize):
+        yield store.to_frame(start, start + chunksize)
+
+
+def iter_chunks(source, chunksize: int = 100_000) -> Iterator[pd.DataFrame]:
+    """Pilih reader berdasarkan source: path .csv/.parquet, OHLCVStore atau directory store"""
+
+    if isinstance(source, OHLCVStore):
+        return iter_store_chunks(source, chunksize)
+    if os.path.isdir(source):
+        return iter_store_chunks(OHLCVStore(source), chunksize)
+    if source.endswith(('.parquet', '.pq')):
+        return iter_parquet_chunks(source, chunksize)
+    return iter_csv_chunks(source, chunksize)
+
+
+# ============================================================================
+# 2. CANDLE GENERATOR
+# ============================================================================
+
+def default_lookback(config: BotConfig) -> int:
+    """Bar yang dibawa antar chunk: window indikator terpanjang + margin crossover"""
+
+    # 50 = window rata-rata volume, 30 = warm-up MeanReversionStrategy
+    return max(config.slow_ma_period, config.rsi_period, config.atr_period, 50, 30) + 2
+
+
+def iter_candles(chunks: Iterable[pd.DataFrame],
+                 lookback: int) -> Iterator[Tuple[pd.DataFrame, int, int, float]]:
+    """
+    Generator candle lintas chunk
+
+    Yields:
+        (frame, local_idx, global_idx, close) dimana frame = lookback bar
+        terakhir chunk sebelumnya + chunk sekarang, index posisional.
+    """
+
+    tail: Optional[pd.DataFrame] = None
+    offset = 0  # global index dari baris pertama chunk sekarang
+
+    for chunk in chunks:
+        if len(chunk) == 0:
+            continue
+        if tail is None:
+            frame = chunk.reset_index(drop=True)
+            carried = 0
+        else:
+            frame = pd.concat([tail, chunk], ignore_index=True)
+            carried = len(tail)
+
+        close = frame['close'].to_numpy()
+        for local_idx in range(carried, len(frame)):
+            yield frame, local_idx, offset + local_idx - carried, close[local_idx]
+
+        offset += len(chunk)
+        # Copy supaya chunk lama bisa di-free
+        tail = frame.iloc[-lookback:].copy()
+
+
+def run_streaming_backtest(bot: TradingBot, chunks: Iterable[pd.DataFrame],
+                           start_idx: int = 200, lookback: Optional[int] = None,
+                           record_equity: bool = False) -> dict:
+    """
+    Backtest atas stream chunk, memory hanya sebesar satu chunk + lookback
+
+    start_idx dihitung dari awal history (sama seperti run_backtest).
+    Equity curve per bar tumbuh dengan panjang history, jadi secara default
+    bot hanya menyimpan running peak/drawdown (report tetap sama);
+    record_equity=True menyimpan curve seperti config.record_equity_curve.
+    """
+
+    lookback = lookback or default_lookback(bot.config)
+    if not record_equity:
+        bot.equity_curve.record = False
+    for frame, local_idx, global_idx, close in iter_candles(chunks, lookback):
+        if global_idx < start_idx:
+            continue
+        bot.process_candle(frame, local_idx, close)
+
+    report = bot.get_overall_report()
+    if bot.config.results_db:
+        bot.save_results(report, start_idx=start_idx)
+    return report
@@ -0,0 +1,25 @@
+"""
+Data Utilities
+Data OHLCV sintetis untuk CLI (--synthetic), benchmark dan test, tanpa
+dependency ke trading_bot.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def make_ohlcv(n: int, seed: int = 42) -> pd.DataFrame:
+    """Random walk OHLCV sintetis (deterministik per seed)"""
+
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.002, n)))
+    spread = np.abs(rng.normal(0, 0.001, n)) * close
+    open_ = np.concatenate(([close[0]], close[:-1]))
+    return pd.DataFrame({
+        'timestamp': pd.date_range('2020-01-01', periods=n, freq='min'),
+        'open': open_,
+        'high': np.maximum(open_, close) + spread,
+        'low': np.minimum(open_, close) - spread,
+        'close': close,
+        'volume': rng.integers(900_000, 1_100_000, n).astype(float),
+    })
@@ -0,0 +1,385 @@
+"""
+Asyncio Live Runner
+Consume candle dari async source, jalankan TradingBot.process_candle tanpa
+memblok event loop, dan kirim order ke exchange lewat AsyncOrderExecutor.
+
+SimulatedExchange me-replay data historis sebagai feed in-process sehingga
+latency dan throughput end-to-end bisa diuji offline.
+"""
+
+import asyncio
+import itertools
+import logging
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Deque, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from trading_bot import (BotConfig, EventLog, IndicatorStream, Order, OrderExecutor,
+                         StrategyEnsemble, TradingBot, create_strategy)
+
+
+CANDLE_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+
+
+# ============================================================================
+# 1. SIMULATED EXCHANGE
+# ============================================================================
+
+class SimulatedExchange:
+    """
+    Stand-in exchange in-process: replay candle dan terima order
+
+    interval = 0 berarti replay secepat mungkin (hanya yield ke event loop).
+    """
+
+    def __init__(self, data: pd.DataFrame, interval: float = 0.0,
+                 order_latency: float = 0.0):
+        self.data = data
+        self.interval = interval
+        self.order_latency = order_latency
+        self.orders: List[Dict] = []
+        self.last_price: Optional[float] = None
+
+    async def stream_candles(self) -> AsyncIterator[Dict]:
+        """Async stream candle, setiap candle diberi timestamp publish"""
+
+        columns = {col: self.data[col].to_numpy() for col in CANDLE_COLUMNS}
+        timestamps = (self.data['timestamp'].to_numpy() if 'timestamp' in self.data.columns
+                      else np.arange(len(self.data)))
+
+        for i in range(len(self.data)):
+            candle = {col: values[i] for col, values in columns.items()}
+            candle['timestamp'] = timestamps[i]
+            candle['published_at'] = time.perf_counter()
+            self.last_price = candle['close']
+            yield candle
+            await asyncio.sleep(self.interval)
+
+    async def place_order(self, order: Order) -> Dict:
+        """Terima order, fill di harga order setelah simulasi latency"""
+
+        if self.order_latency:
+            await asyncio.sleep(self.order_latency)
+        ack = {
+            'order_id': order.order_id,
+            'symbol': order.symbol,
+            'side': order.order_type.value,
+            'quantity': order.quantity,
+            'price': order.price,
+            'acked_at': time.perf_counter()
+        }
+        self.orders.append(ack)
+        return ack
+
+
+# ============================================================================
+# 2. ASYNC ORDER EXECUTOR
+# ============================================================================
+
+class AsyncOrderExecutor(OrderExecutor):
+    """
+    OrderExecutor yang meneruskan setiap order ke exchange secara async
+
+    Buku order lokal tetap di-update secara sync (TradingBot memanggilnya dari
+    thread worker), lalu order masuk outbox dan dikirim oleh submit_orders()
+    yang berjalan di event loop.
+    """
+
+    def __init__(self, logger: logging.Logger, exchange: SimulatedExchange,
+                 max_samples: int = 100_000, events: Optional[EventLog] = None,
+                 history_size: int = 10_000, spill_path: Optional[str] = None):
+        super().__init__(logger, events, history_size, spill_path)
+        self.exchange = exchange
+        self.outbox: Optional[asyncio.Queue] = None
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.acks: Deque[Dict] = deque(maxlen=max_samples)
+        self.submit_latencies: Deque[float] = deque(maxlen=max_samples)
+        self.orders_sent = 0
+
+    def bind(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Hubungkan ke event loop yang menjalankan submit_orders()"""
+        self.loop = loop
+        self.outbox = asyncio.Queue()
+
+    def create_buy_order(self, symbol: str, quantity: float,
+                         price: float, order_type: str = "market") -> Order:
+        order = super().create_buy_order(symbol, quantity, price, order_type)
+        self._enqueue(order)
+        return order
+
+    def create_sell_order(self, symbol: str, quantity: float,
+                          price: float, order_type: str = "market") -> Order:
+        order = super().create_sell_order(symbol, quantity, price, order_type)
+        self._enqueue(order)
+        return order
+
+    async def create_buy_order_async(self, symbol: str, quantity: float,
+                                     price: float, order_type: str = "market") -> Dict:
+        """Create buy order dan tunggu ack dari exchange"""
+        order = super().create_buy_order(symbol, quantity, price, order_type)
+        return await self._submit(order, time.perf_counter())
+
+    async def create_sell_order_async(self, symbol: str, quantity: float,
+                                      price: float, order_type: str = "market") -> Dict:
+        """Create sell order dan tunggu ack dari exchange"""
+        order = super().create_sell_order(symbol, quantity, price, order_type)
+        return await self._submit(order, time.perf_counter())
+
+    async def submit_orders(self) -> None:
+        """Loop pengiriman order dari outbox ke exchange"""
+        while True:
+            order, queued_at = await self.outbox.get()
+            try:
+                await self._submit(order, queued_at)
+            finally:
+                self.outbox.task_done()
+
+    async def _submit(self, order: Order, queued_at: float) -> Dict:
+        ack = await self.exchange.place_order(order)
+        self.acks.append(ack)
+        self.submit_latencies.append(ack['acked_at'] - queued_at)
+        self.orders_sent += 1
+        return ack
+
+    def _enqueue(self, order: Order) -> None:
+        if self.loop is None:
+            return
+        self.loop.call_soon_threadsafe(self.outbox.put_nowait, (order, time.perf_counter()))
+
+
+# ============================================================================
+# 3. LIVE RUNNER
+# ============================================================================
+
+class AsyncLiveRunner:
+    """
+    Jalankan TradingBot atas async candle source
+
+    Candle disimpan di buffer numpy (kapasitas 2x lookback, di-compact saat
+    penuh sehingga append amortized O(1)). Jika strategi punya
+    create_indicator_stream(), indikator di-update O(1) per candle ke buffer
+    yang sejajar dan strategi membaca keduanya tanpa prepare ulang. Jika
+    tidak, strategi menerima window `lookback` bar terakhir.
+
+    offload=True menjalankan process_candle di thread worker supaya event
+    loop tetap bebas untuk feed dan pengiriman order; thread dibuat per
+    run() sehingga runner bisa dijalankan ulang (mis. setelah restore).
+
+    checkpointer (checkpoint.Checkpointer) dipanggil di antara candle;
+    snapshot diambil di sana dan ditulis ke disk di thread terpisah.
+
+    indicator_stream: IndicatorStream bersama (lihat EnsembleLiveRunner);
+    runner hanya membaca nilainya, pemilik stream yang meng-update.
+    """
+
+    def __init__(self, bot: TradingBot, lookback: Optional[int] = None,
+                 offload: bool = True, max_samples: int = 100_000,
+                 checkpointer=None, indicator_stream: Optional[IndicatorStream] = None):
+        self.bot = bot
+        self.checkpointer = checkpointer
+        if checkpointer is not None and checkpointer.runner is None:
+            checkpointer.runner = self
+        config = bot.config
+        self.lookback = lookback or 2 * max(config.slow_ma_period, config.rsi_period,
+                                            config.atr_period, 50) + 2
+        self.offload = offload
+
+        capacity = 2 * self.lookback
+        self.buffers = {col: np.full(capacity, np.nan) for col in CANDLE_COLUMNS}
+        self.length = 0
+
+        if indicator_stream is not None and bot.strategy.required_indicators():
+            self.stream = bot.strategy.create_indicator_stream(indicator_stream)
+        else:
+            self.stream = bot.strategy.create_indicator_stream()
+        self.indicator_buffers = {name: np.full(capacity, np.nan) for name in self.stream}
+        if self.stream:
+            # Frame tetap (view atas buffer), indikator di-attach sekali
+            self.frame = pd.DataFrame(self.buffers, copy=False)
+            bot.strategy.attach_prepared(self.frame, self.indicator_buffers)
+
+        self.latencies: Deque[float] = deque(maxlen=max_samples)
+        self.candles = 0
+        self.elapsed = 0.0
+
+    def _append(self, candle: Dict) -> None:
+        capacity = len(self.buffers['close'])
+        if self.length == capacity:
+            keep = self.lookback - 1
+            for values in itertools.chain(self.buffers.values(), self.indicator_buffers.values()):
+                values[:keep] = values[capacity - keep:]
+                values[keep:] = np.nan
+            self.length = keep
+
+        pos = self.length
+        for col, values in self.buffers.items():
+            values[pos] = candle[col]
+        for name, update in self.stream.items():
+            self.indicator_buffers[name][pos] = update(candle)
+        self.length += 1
+
+    def get_state(self) -> Dict:
+        """Buffer candle/indikator dan state bot untuk checkpoint"""
+        return {
+            'bot': self.bot.get_state(),
+            'candles': self.candles,
+            'buffers': {col: values[:self.length].copy() for col, values in self.buffers.items()},
+            'indicator_buffers': {name: values[:self.length].copy()
+                                  for name, values in self.indicator_buffers.items()},
+        }
+
+    def set_state(self, state: Dict) -> None:
+        """
+        Restore dari get_state(): bot (termasuk state incremental indicator
+        stream runner ini) dan buffer lookback, tanpa replay data
+        """
+
+        self.bot.set_state(state['bot'])
+        self.candles = state['candles']
+
+        saved = state['buffers']
+        length = min(len(saved['close']), self.lookback)
+        for target, source in ((self.buffers, saved),
+                               (self.indicator_buffers, state['indicator_buffers'])):
+            for name, values in target.items():
+                values[:] = np.nan
+                if name in source:
+                    values[:length] = source[name][len(source[name]) - length:]
+        self.length = length
+
+    def _current(self):
+        if self.stream:
+            return self.frame, self.length - 1
+        data = self._window()
+        return data, len(data) - 1
+
+    def _window(self) -> pd.DataFrame:
+        # Copy kecil (lookback bar) supaya buffer bisa di-compact dengan aman
+        # dan entry INDICATOR_CACHE untuk window lama ikut terbuang
+        start = max(0, self.length - self.lookback)
+        return pd.DataFrame({col: values[start:self.length]
+                             for col, values in self.buffers.items()})
+
+    def process(self, candle: Dict) -> None:
+        """Append satu candle dan jalankan process_candle inline (feed sync)"""
+
+        self._append(candle)
+        data, idx = self._current()
+        self.bot.process_candle(data, idx, candle['close'])
+        self.candles += 1
+        if self.checkpointer is not None:
+            self.checkpointer.maybe_checkpoint()
+
+    async def run(self, source: AsyncIterator[Dict]) -> Dict:
+        """Consume source sampai habis, return statistik latency/throughput"""
+
+        loop = asyncio.get_running_loop()
+        executor = self.bot.order_executor
+        sender = None
+        if isinstance(executor, AsyncOrderExecutor):
+            executor.bind(loop)
+            sender = asyncio.create_task(executor.submit_orders())
+
+        pool = (ThreadPoolExecutor(max_workers=1, thread_name_prefix='process_candle')
+                if self.offload else None)
+        started = time.perf_counter()
+        try:
+            async for candle in source:
+                self._append(candle)
+                data, idx = self._current()
+
+                if pool is not None:
+                    await loop.run_in_executor(pool, self.bot.process_candle,
+                                               data, idx, candle['close'])
+                else:
+                    self.bot.process_candle(data, idx, candle['close'])
+
+                self.candles += 1
+                if 'published_at' in candle:
+                    self.latencies.append(time.perf_counter() - candle['published_at'])
+                if self.checkpointer is not None:
+                    self.checkpointer.maybe_checkpoint()
+
+            if sender is not None:
+                await executor.outbox.join()
+        finally:
+            if sender is not None:
+                sender.cancel()
+            # Tunggu candle yang sedang diproses worker (jika run() dibatalkan)
+            if pool is not None:
+                pool.shutdown(wait=True)
+            self.elapsed += time.perf_counter() - started
+
+        return self.stats()
+
+    def stats(self) -> Dict:
+        """Latency end-to-end (publish -> selesai diproses) dan throughput"""
+
+        latencies = np.array(self.latencies) * 1e6
+        stats = {
+            'candles': self.candles,
+            'elapsed_sec': self.elapsed,
+            'candles_per_sec': self.candles / self.elapsed if self.elapsed else 0.0,
+            'latency_us_mean': float(latencies.mean()) if len(latencies) else 0.0,
+            'latency_us_p50': float(np.percentile(latencies, 50)) if len(latencies) else 0.0,
+            'latency_us_p99': float(np.percentile(latencies, 99)) if len(latencies) else 0.0,
+        }
+        executor = self.bot.order_executor
+        if isinstance(executor, AsyncOrderExecutor):
+            submit = np.array(executor.submit_latencies) * 1e6
+            stats['orders_sent'] = executor.orders_sent
+            stats['order_latency_us_p50'] = float(np.percentile(submit, 50)) if len(submit) else 0.0
+        return stats
+
+
+class EnsembleLiveRunner:
+    """
+    Beberapa bot (masing-masing dengan strateginya) atas feed candle yang sama
+
+    Indikator semua strategi dievaluasi sekali per candle lewat satu
+    IndicatorStream bersama (StrategyEnsemble); setiap bot tetap punya
+    buffer, account dan order sendiri.
+    """
+
+    def __init__(self, bots: List[TradingBot], lookback: Optional[int] = None):
+        self.bots = list(bots)
+        self.ensemble = StrategyEnsemble(bot.strategy for bot in self.bots)
+        self.stream = self.ensemble.create_stream()
+        self.runners = [AsyncLiveRunner(bot, lookback, offload=False,
+                                        indicator_stream=self.stream)
+                        for bot in self.bots]
+
+    def process(self, candle: Dict) -> None:
+        """Update indikator bersama sekali, lalu proses candle di setiap bot"""
+
+        self.stream.update(candle)
+        for runner in self.runners:
+            runner.process(candle)
+
+    def reports(self) -> List[Dict]:
+        return [bot.get_overall_report() for bot in self.bots]
+
+
+def run_simulation(data: pd.DataFrame, config: BotConfig,
+                   logger: Optional[logging.Logger] = None,
+                   interval: float = 0.0, order_latency: float = 0.0,
+                   offload: bool = True) -> Dict:
+    """Replay data lewat SimulatedExchange dan AsyncLiveRunner, return stats"""
+
+    logger = logger or logging.getLogger(__name__)
+    exchange = SimulatedExchange(data, interval=interval, order_latency=order_latency)
+
+    bot = TradingBot(config, create_strategy(config, logger), logger)
+    bot.order_executor = AsyncOrderExecutor(logger, exchange, events=bot.events,
+                                            history_size=config.order_history_size,
+                                            spill_path=config.order_spill_path or None)
+
+    runner = AsyncLiveRunner(bot, offload=offload)
+    stats = asyncio.run(runner.run(exchange.stream_candles()))
+    stats['report'] = bot.get_overall_report()
+    bot.events.close()
+    return stats
@@ -0,0 +1,179 @@
+"""
+Monte Carlo Robustness
+Resample urutan closed trade hasil backtest menjadi ribuan equity path:
+bootstrap (dengan pengembalian) atau shuffle urutan, slippage acak per
+fill (opt-in, default 0) dan trade yang di-skip secara acak.
+
+Semua path dalam satu chunk dihitung sebagai satu matrix numpy (path x
+trade): cumsum untuk equity, maximum.accumulate untuk peak. Jumlah path per
+chunk dibatasi max_bytes sehingga memory tetap flat untuk 100k+ path; yang
+disimpan per path hanya final equity dan max drawdown. Setiap sumber random
+(urutan trade, slippage entry/exit, skip) punya stream sendiri dari seed,
+sehingga hasil tidak bergantung pada ukuran chunk.
+
+Contoh:
+    bot.run_backtest(data)
+    result = run_monte_carlo(bot, n_paths=100_000, skip_prob=0.05, seed=1)
+    print(result['max_drawdown']['p95'], result['prob_breach_max_drawdown'])
+"""
+
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from trading_bot import BotConfig, TradeLedger, TradingBot
+
+
+METHODS = ('bootstrap', 'shuffle')
+PERCENTILES = (1, 5, 25, 50, 75, 95, 99)
+
+# Perkiraan byte per elemen matrix: index int32, P&L/notional/peak float64,
+# random float32 (presisi cukup untuk fraksi slippage dan threshold skip)
+_BYTES_PER_CELL = 40
+
+
+# ============================================================================
+# 1. TRADE INPUT
+# ============================================================================
+
+def trade_arrays(ledger: TradeLedger) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(pnl, entry_notional, exit_notional) dari ledger closed trades"""
+
+    quantity = ledger.column('quantity')
+    return (ledger.column('pnl').copy(),
+            np.abs(ledger.column('entry_price') * quantity),
+            np.abs(ledger.column('exit_price') * quantity))
+
+
+# ============================================================================
+# 2. SIMULATION
+# ============================================================================
+
+def simulate_paths(pnl: np.ndarray, n_paths: int = 100_000, start_equity: float = 10000.0,
+                   method: str = 'bootstrap', skip_prob: float = 0.0,
+                   slippage: float = 0.0, entry_notional: Optional[np.ndarray] = None,
+                   exit_notional: Optional[np.ndarray] = None, seed: Optional[int] = None,
+                   max_bytes: int = 64 * 1024 * 1024) -> Dict[str, np.ndarray]:
+    """
+    Simulasi n_paths equity path dari P&L per trade
+
+    - method 'bootstrap': setiap path mengambil len(pnl) trade dengan
+      pengembalian; 'shuffle': permutasi urutan trade yang sama
+    - skip_prob: peluang setiap trade dilewati (P&L dan slippage = 0)
+    - slippage: biaya per fill uniform [0, slippage] x notional entry/exit
+      (butuh entry_notional dan exit_notional); 0 = tanpa biaya
+
+    Returns:
+        {'final_equity', 'max_drawdown' (fraksi dari peak), 'min_equity'},
+        masing-masing array satu nilai per path
+    """
+
+    if method not in METHODS:
+        raise ValueError(f"Unknown method: {method!r}. Use one of {METHODS}")
+    if slippage and (entry_notional is None or exit_notional is None):
+        raise ValueError("slippage requires entry_notional and exit_notional")
+
+    pnl = np.asarray(pnl, dtype=np.float64)
+    n_trades = len(pnl)
+    result = {
+        'final_equity': np.full(n_paths, float(start_equity)),
+        'max_drawdown': np.zeros(n_paths),
+        'min_equity': np.full(n_paths, float(start_equity)),
+    }
+    if n_trades == 0 or n_paths == 0:
+        return result
+
+    order_rng, entry_rng, exit_rng, skip_rng = (
+        np.random.default_rng(child) for child in np.random.SeedSequence(seed).spawn(4))
+    chunk = max(1, min(n_paths, max_bytes // (_BYTES_PER_CELL * n_trades)))
+    order = np.arange(n_trades, dtype=np.int32)
+
+    for start in range(0, n_paths, chunk):
+        rows = min(chunk, n_paths - start)
+        if method == 'bootstrap':
+            idx = order_rng.integers(0, n_trades, size=(rows, n_trades), dtype=np.int32)
+        else:
+            idx = order_rng.permuted(np.tile(order, (rows, 1)), axis=1)
+
+        paths = pnl[idx]
+        if slippage:
+            cost = entry_notional[idx]
+            cost *= entry_rng.random((rows, n_trades), dtype=np.float32)
+            exit_cost = exit_notional[idx]
+            exit_cost *= exit_rng.random((rows, n_trades), dtype=np.float32)
+            cost += exit_cost
+            del exit_cost
+            cost *= slippage
+            paths -= cost
+            del cost
+        del idx
+        if skip_prob:
+            paths[skip_rng.random((rows, n_trades), dtype=np.float32) < skip_prob] = 0.0
+
+        # Equity setelah setiap trade, peak termasuk equity awal
+        np.cumsum(paths, axis=1, out=paths)
+        paths += start_equity
+        peak = np.maximum.accumulate(paths, axis=1)
+        np.maximum(peak, start_equity, out=peak)
+
+        window = slice(start, start + rows)
+        result['final_equity'][window] = paths[:, -1]
+        result['min_equity'][window] = np.minimum(paths.min(axis=1), start_equity)
+
+        # drawdown = (peak - equity) / peak, ditulis ke buffer paths
+        np.subtract(peak, paths, out=paths)
+        np.divide(paths, peak, out=paths)
+        result['max_drawdown'][window] = paths.max(axis=1)
+        del paths, peak
+
+    return result
+
+
+def summarize(paths: Dict[str, np.ndarray], start_equity: float,
+              max_drawdown: float) -> Dict:
+    """Distribusi final equity dan max drawdown + probabilitas breach/loss/ruin"""
+
+    final_equity = paths['final_equity']
+    drawdown = paths['max_drawdown']
+
+    def distribution(values: np.ndarray, scale: float = 1.0) -> Dict[str, float]:
+        stats = {'mean': float(values.mean()) * scale, 'std': float(values.std()) * scale,
+                 'min': float(values.min()) * scale, 'max': float(values.max()) * scale}
+        for q, value in zip(PERCENTILES, np.percentile(values, PERCENTILES)):
+            stats[f'p{q}'] = float(value) * scale
+        return stats
+
+    return {
+        'paths': len(final_equity),
+        'start_equity': start_equity,
+        'final_equity': distribution(final_equity),
+        'return_percent': distribution(final_equity / start_equity - 1, 100.0),
+        'max_drawdown': distribution(drawdown, 100.0),  # persen, sama dengan get_overall_report
+        'prob_loss': float(np.mean(final_equity < start_equity)),
+        'prob_breach_max_drawdown': float(np.mean(drawdown > max_drawdown)),
+        'prob_ruin': float(np.mean(paths['min_equity'] <= 0)),
+    }
+
+
+def run_monte_carlo(bot: TradingBot, n_paths: int = 100_000, method: str = 'bootstrap',
+                    skip_prob: float = 0.0, slippage: float = 0.0,
+                    seed: Optional[int] = None, max_bytes: int = 64 * 1024 * 1024,
+                    config: Optional[BotConfig] = None) -> Dict:
+    """
+    Monte Carlo atas closed trades bot setelah backtest
+
+    Equity awal = config.account_size, breach = max drawdown path >
+    config.max_drawdown. slippage (fraksi notional per fill, maksimum) harus
+    diisi eksplisit: config.max_slippage adalah toleransi eksekusi, bukan
+    biaya yang diharapkan.
+    """
+
+    config = config or bot.config
+    pnl, entry_notional, exit_notional = trade_arrays(bot.closed_trades)
+
+    paths = simulate_paths(pnl, n_paths, config.account_size, method, skip_prob, slippage,
+                           entry_notional, exit_notional, seed, max_bytes)
+    summary = summarize(paths, config.account_size, config.max_drawdown)
+    summary.update({'trades': len(pnl), 'method': method, 'skip_prob': skip_prob,
+                    'slippage': slippage})
+    return summary
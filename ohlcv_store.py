@@ -0,0 +1,167 @@
+"""
+Memory-Mapped OHLCV Store
+Format columnar di disk untuk data OHLCV + timestamp: satu file per kolom
+dengan header kecil, dibuka lewat numpy.memmap.
+
+Membuka history multi-GB hanya membaca header (milidetik); data di-load
+oleh OS per page saat diakses, dan beberapa proses worker yang membuka
+store yang sama berbagi page lewat OS page cache.
+
+Layout file kolom (<name>.col):
+    [0:8]    magic b'AHAOHLC1'
+    [8:24]   dtype numpy (ascii, mis. '<f8'), di-pad null
+    [24:32]  jumlah baris (int64 little-endian)
+    [32:64]  reserved
+    [64:]    data kolom (raw, contiguous)
+"""
+
+import os
+import struct
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+MAGIC = b'AHAOHLC1'
+HEADER_SIZE = 64
+HEADER_FORMAT = '<8s16sq'
+
+TIMESTAMP_COLUMN = 'timestamp'
+DEFAULT_COLUMNS = ('timestamp', 'open', 'high', 'low', 'close', 'volume')
+
+
+def _write_header(f, dtype: np.dtype, length: int) -> None:
+    header = struct.pack(HEADER_FORMAT, MAGIC, dtype.str.encode('ascii'), length)
+    f.seek(0)
+    f.write(header.ljust(HEADER_SIZE, b'\0'))
+
+
+def _read_header(path: str):
+    with open(path, 'rb') as f:
+        raw = f.read(HEADER_SIZE)
+    if len(raw) < HEADER_SIZE:
+        raise ValueError(f"Truncated column file: {path}")
+    magic, dtype, length = struct.unpack_from(HEADER_FORMAT, raw)
+    if magic != MAGIC:
+        raise ValueError(f"Not an OHLCV column file: {path}")
+    return np.dtype(dtype.rstrip(b'\0').decode('ascii')), length
+
+
+def _column_values(data: pd.DataFrame, name: str) -> np.ndarray:
+    series = data[name]
+    if name == TIMESTAMP_COLUMN:
+        # Timestamp disimpan sebagai int64 nanoseconds
+        return pd.to_datetime(series).to_numpy(dtype='datetime64[ns]').view(np.int64)
+    return np.ascontiguousarray(series.to_numpy())
+
+
+class OHLCVStore:
+    """Store OHLCV columnar berbasis numpy.memmap (satu directory per dataset)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.columns: Dict[str, np.memmap] = {}
+        self.length = 0
+        self.reload()
+
+    # ------------------------------------------------------------------
+    # Write
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def write(cls, path: str, data: pd.DataFrame,
+              columns: Optional[Sequence[str]] = None) -> 'OHLCVStore':
+        """Tulis DataFrame ke store baru (menimpa kolom yang sudah ada)"""
+
+        columns = [c for c in (columns or DEFAULT_COLUMNS) if c in data.columns]
+        os.makedirs(path, exist_ok=True)
+        for name in columns:
+            values = _column_values(data, name)
+            with open(os.path.join(path, f"{name}.col"), 'wb') as f:
+                _write_header(f, values.dtype, len(values))
+                f.seek(HEADER_SIZE)
+                values.tofile(f)
+        return cls(path)
+
+    def append(self, data: pd.DataFrame) -> None:
+        """
+        Append baris baru ke semua kolom, lalu remap
+
+        Semua kolom dikonversi dan divalidasi sebelum file pertama ditulis;
+        header (jumlah baris) baru di-update setelah data semua kolom
+        tertulis, sehingga append yang gagal tidak membuat store rusak.
+        """
+
+        missing = set(self.columns) - set(data.columns)
+        if missing:
+            raise ValueError(f"Missing columns for append: {sorted(missing)}")
+
+        converted = {}
+        for name, current in self.columns.items():
+            values = _column_values(data, name)
+            if not np.can_cast(values.dtype, current.dtype, casting='same_kind'):
+                raise ValueError(f"Column {name!r} has dtype {values.dtype}, "
+                                 f"store expects {current.dtype}")
+            converted[name] = values.astype(current.dtype, copy=False)
+
+        paths = {name: os.path.join(self.path, f"{name}.col") for name in converted}
+        for name, values in converted.items():
+            with open(paths[name], 'r+b') as f:
+                f.seek(HEADER_SIZE + self.length * values.dtype.itemsize)
+                values.tofile(f)
+        for name, values in converted.items():
+            with open(paths[name], 'r+b') as f:
+                _write_header(f, values.dtype, self.length + len(values))
+        self.reload()
+
+    # ------------------------------------------------------------------
+    # Read
+    # ------------------------------------------------------------------
+
+    def reload(self) -> None:
+        """Baca ulang header dan buat memmap baru (mis. setelah append)"""
+
+        self.columns = {}
+        lengths = set()
+        for file_name in sorted(os.listdir(self.path)):
+            if not file_name.endswith('.col'):
+                continue
+            file_path = os.path.join(self.path, file_name)
+            dtype, length = _read_header(file_path)
+            lengths.add(length)
+            self.columns[file_name[:-4]] = np.memmap(
+                file_path, dtype=dtype, mode='r', offset=HEADER_SIZE, shape=(length,)
+            ) if length else np.empty(0, dtype=dtype)
+
+        if len(lengths) > 1:
+            raise ValueError(f"Column lengths differ in store {self.path}: {sorted(lengths)}")
+        self.length = lengths.pop() if lengths else 0
+
+    def __len__(self) -> int:
+        return self.length
+
+    def column(self, name: str, start: int = 0, stop: Optional[int] = None) -> np.ndarray:
+        """View zero-copy dari satu kolom untuk range [start, stop)"""
+
+        values = self.columns[name][start:stop]
+        if name == TIMESTAMP_COLUMN:
+            return values.view('datetime64[ns]')
+        return values
+
+    def window(self, start: int = 0, stop: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """Semua kolom untuk range [start, stop) sebagai view zero-copy"""
+        return {name: self.column(name, start, stop) for name in self.columns}
+
+    def to_frame(self, start: int = 0, stop: Optional[int] = None) -> pd.DataFrame:
+        """
+        DataFrame untuk range [start, stop) yang kolomnya view atas memmap
+
+        Index posisional dimulai dari 0 sehingga bisa langsung dipakai
+        TradingBot.run_backtest / strategy.generate_signal.
+        """
+
+        ordered = [c for c in DEFAULT_COLUMNS if c in self.columns]
+        ordered += [c for c in self.columns if c not in ordered]
+        return pd.DataFrame({name: self.column(name, start, stop) for name in ordered},
+                            copy=False)
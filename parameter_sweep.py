@@ -0,0 +1,148 @@
+"""
+Parallel Parameter Sweep
+Backtest banyak variasi BotConfig sekaligus di process pool, dengan data
+OHLCV ditaruh sekali di shared memory atau dibaca dari OHLCVStore memmap
+(worker tidak perlu pickle DataFrame)
+
+Contoh:
+    configs = grid_configs(BotConfig(), {
+        'fast_ma_period': [10, 20],
+        'slow_ma_period': [50, 100],
+        'atr_multiplier_sl': [1.0, 1.5, 2.0],
+    })
+    results = run_sweep(data, configs, processes=8)
+    print(results.sort_values('profit_factor', ascending=False).head())
+"""
+
+import itertools
+import logging
+import os
+import random
+from dataclasses import asdict, fields, replace
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import pandas as pd
+
+from ohlcv_store import OHLCVStore
+from results_store import ResultsStore
+from trading_bot import BotConfig
+# SharedMarketData tetap bisa di-import dari parameter_sweep
+from worker_pool import SharedMarketData, create_bot, run_pool, worker_data, worker_logger
+
+
+# ============================================================================
+# 1. CONFIG GENERATION
+# ============================================================================
+
+def grid_configs(base: BotConfig, grid: Dict[str, Sequence]) -> List[BotConfig]:
+    """Semua kombinasi nilai di grid, sisanya diambil dari base config"""
+
+    _check_fields(grid)
+    names = list(grid)
+    return [replace(base, **dict(zip(names, values)))
+            for values in itertools.product(*(grid[name] for name in names))]
+
+
+def random_configs(base: BotConfig, space: Dict[str, object], n: int,
+                   seed: Optional[int] = None) -> List[BotConfig]:
+    """
+    Random sample dari parameter space
+
+    Setiap value di space bisa berupa:
+    - list: dipilih salah satu
+    - tuple (low, high): uniform untuk field float, randint untuk field int
+    """
+
+    _check_fields(space)
+    rng = random.Random(seed)
+    field_types = {f.name: f.type for f in fields(BotConfig)}
+
+    configs = []
+    for _ in range(n):
+        values = {}
+        for name, choices in space.items():
+            if isinstance(choices, tuple):
+                low, high = choices
+                if field_types[name] in (int, 'int'):
+                    values[name] = rng.randint(low, high)
+                else:
+                    values[name] = rng.uniform(low, high)
+            else:
+                values[name] = rng.choice(list(choices))
+        configs.append(replace(base, **values))
+    return configs
+
+
+def _check_fields(params: Dict[str, object]) -> None:
+    valid = {f.name for f in fields(BotConfig)}
+    unknown = set(params) - valid
+    if unknown:
+        raise ValueError(f"Unknown BotConfig fields: {sorted(unknown)}")
+
+
+# ============================================================================
+# 2. WORKER
+# ============================================================================
+
+def run_config(data: pd.DataFrame, config: BotConfig, start_idx: int = 200,
+               vectorized: bool = True,
+               logger: Optional[logging.Logger] = None) -> Dict:
+    """Backtest satu config, return get_overall_report()"""
+
+    bot = create_bot(config, logger)
+    if vectorized:
+        return bot.run_backtest_vectorized(data, start_idx)
+    return bot.run_backtest(data, start_idx)
+
+
+def _run_task(task: Tuple[int, BotConfig, int, bool]) -> Tuple[int, Dict]:
+    config_id, config, start_idx, vectorized = task
+    return config_id, run_config(worker_data(), config, start_idx, vectorized)
+
+
+# ============================================================================
+# 3. SWEEP
+# ============================================================================
+
+def run_sweep(data: Union[pd.DataFrame, OHLCVStore], configs: Sequence[BotConfig],
+              processes: Optional[int] = None, start_idx: int = 200,
+              vectorized: bool = True, chunksize: Optional[int] = None,
+              log_level: int = logging.WARNING, results_db: Optional[str] = None,
+              label: str = '') -> pd.DataFrame:
+    """
+    Backtest semua configs secara paralel
+
+    data bisa berupa DataFrame (di-copy sekali ke shared memory) atau
+    OHLCVStore (setiap worker membuka memmap store yang sama).
+
+    results_db (default: results_db config pertama): config + metrics semua
+    run ditulis ke ResultsStore sebagai satu batch dalam satu transaksi.
+
+    Returns:
+        DataFrame satu baris per config: config_id, semua field BotConfig
+        dan metrics dari get_overall_report()
+    """
+
+    processes = processes or os.cpu_count() or 1
+    tasks = [(i, config, start_idx, vectorized) for i, config in enumerate(configs)]
+
+    if processes == 1 or len(tasks) <= 1:
+        worker_logger.setLevel(log_level)
+        frame = data.to_frame() if isinstance(data, OHLCVStore) else data
+        reports = [(i, run_config(frame, config, start_idx, vectorized))
+                   for i, config, _, _ in tasks]
+    else:
+        # Beberapa chunk per worker supaya load tetap seimbang
+        chunksize = chunksize or max(1, len(tasks) // (processes * 4))
+        reports = run_pool(data, _run_task, tasks, processes, log_level=log_level,
+                           chunksize=chunksize)
+
+    reports.sort(key=lambda item: item[0])
+    results_db = configs[0].results_db if results_db is None and configs else results_db
+    if results_db:
+        with ResultsStore(results_db) as store:
+            store.add_sweep(configs, [report for _, report in reports], label, start_idx)
+
+    rows = [{'config_id': i, **asdict(configs[i]), **report} for i, report in reports]
+    return pd.DataFrame(rows)
+
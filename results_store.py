@@ -0,0 +1,363 @@
+"""
+SQLite Results Store
+Simpan hasil backtest dan sweep ke satu file SQLite: metadata run, config
+(dedup per hash), metrics get_overall_report() dan closed trades.
+
+Semua penulisan dikelompokkan dalam transaksi eksplisit (executemany, WAL,
+synchronous=NORMAL): satu sweep dengan ribuan run atau satu backtest dengan
+ribuan trade = satu commit. Module ini hanya meng-import stdlib sehingga
+CLI bisa query tanpa pandas/numpy.
+
+Skema:
+    configs (config_id, config_hash, strategy, params JSON)
+    runs    (run_id, batch_id, kind, label, created_at, config_id, symbol,
+             start_idx, end_idx)
+    metrics (run_id, kolom METRIC_COLUMNS, extra JSON)
+    trades  (run_id, trade_id, symbol, entry_time, exit_time [microseconds
+             sejak epoch], entry_price, exit_price, quantity, stop_loss,
+             take_profit, pnl, exit_reason)
+
+Contoh:
+    with ResultsStore('results.db') as store:
+        store.add_sweep(configs, reports, label='ma grid')
+        for row in store.top_runs('profit_factor', 20, [('max_drawdown', '<', 10)]):
+            print(row['run_id'], row['profit_factor'], row['params']['fast_ma_period'])
+"""
+
+import hashlib
+import json
+import sqlite3
+from contextlib import contextmanager
+from dataclasses import asdict
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from bot_config import BotConfig
+
+
+SCHEMA_VERSION = 1
+
+# Kolom metrics = key get_overall_report(); key lain masuk metrics.extra
+METRIC_COLUMNS = ('total_trades', 'wins', 'losses', 'win_rate', 'profit_factor', 'total_pnl',
+                  'total_pnl_percent', 'avg_win', 'avg_loss', 'max_win', 'max_loss',
+                  'balance', 'equity', 'max_drawdown')
+COUNT_COLUMNS = ('total_trades', 'wins', 'losses')
+RUN_COLUMNS = ('run_id', 'batch_id', 'kind', 'label', 'created_at', 'symbol',
+               'start_idx', 'end_idx')
+FILTER_OPERATORS = ('<', '<=', '>', '>=', '=', '!=')
+
+# Sama dengan trading_bot.NAT_US (timestamp kosong di TradeLedger)
+_NAT_US = -2 ** 63
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS configs (
+    config_id INTEGER PRIMARY KEY,
+    config_hash TEXT NOT NULL UNIQUE,
+    strategy TEXT NOT NULL,
+    params TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY,
+    batch_id INTEGER,
+    kind TEXT NOT NULL,
+    label TEXT NOT NULL DEFAULT '',
+    created_at TEXT NOT NULL,
+    config_id INTEGER NOT NULL REFERENCES configs(config_id),
+    symbol TEXT,
+    start_idx INTEGER,
+    end_idx INTEGER
+);
+CREATE TABLE IF NOT EXISTS metrics (
+    run_id INTEGER PRIMARY KEY REFERENCES runs(run_id),
+    {', '.join(f"{name} {'INTEGER' if name in COUNT_COLUMNS else 'REAL'}"
+               for name in METRIC_COLUMNS)},
+    extra TEXT
+);
+CREATE TABLE IF NOT EXISTS trades (
+    run_id INTEGER NOT NULL REFERENCES runs(run_id),
+    trade_id TEXT NOT NULL,
+    symbol TEXT NOT NULL,
+    entry_time INTEGER,
+    exit_time INTEGER,
+    entry_price REAL NOT NULL,
+    exit_price REAL,
+    quantity REAL NOT NULL,
+    stop_loss REAL,
+    take_profit REAL,
+    pnl REAL,
+    exit_reason TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_runs_batch ON runs(batch_id);
+CREATE INDEX IF NOT EXISTS idx_runs_config ON runs(config_id);
+CREATE INDEX IF NOT EXISTS idx_runs_created ON runs(created_at);
+CREATE INDEX IF NOT EXISTS idx_metrics_profit_factor ON metrics(profit_factor);
+CREATE INDEX IF NOT EXISTS idx_metrics_max_drawdown ON metrics(max_drawdown);
+CREATE INDEX IF NOT EXISTS idx_trades_run ON trades(run_id);
+CREATE INDEX IF NOT EXISTS idx_trades_symbol_time ON trades(symbol, exit_time);
+CREATE INDEX IF NOT EXISTS idx_trades_time ON trades(exit_time);
+"""
+
+
+def config_hash(params: Dict[str, Any]) -> str:
+    """Hash stabil dari field BotConfig (urutan key tidak berpengaruh)"""
+    return hashlib.sha1(json.dumps(params, sort_keys=True).encode()).hexdigest()
+
+
+class ResultsStore:
+    """
+    Penyimpanan hasil backtest di SQLite
+
+    Satu connection per object (tidak thread-safe); untuk sweep paralel,
+    worker mengembalikan report dan proses utama menulis semuanya lewat
+    add_sweep dalam satu transaksi.
+    """
+
+    def __init__(self, path: str, timeout: float = 30.0):
+        self.path = path
+        # isolation_level=None: transaksi dikontrol eksplisit lewat transaction()
+        self.conn = sqlite3.connect(path, timeout=timeout, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        self._depth = 0
+        self._config_ids: Dict[str, int] = {}
+
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        if version > SCHEMA_VERSION:
+            raise ValueError(f"Results store {path} has schema version {version}, "
+                             f"this code supports {SCHEMA_VERSION}")
+        with self.transaction():
+            for statement in _SCHEMA.split(';'):
+                if statement.strip():
+                    self.conn.execute(statement)
+            self.conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """BEGIN IMMEDIATE ... COMMIT (ROLLBACK saat error); nested = satu transaksi"""
+
+        if self._depth:
+            self._depth += 1
+            try:
+                yield self.conn
+            finally:
+                self._depth -= 1
+            return
+
+        self.conn.execute("BEGIN IMMEDIATE")
+        self._depth = 1
+        try:
+            yield self.conn
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            self._config_ids.clear()  # bisa berisi id dari insert yang di-rollback
+            raise
+        else:
+            self.conn.execute("COMMIT")
+        finally:
+            self._depth = 0
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> 'ResultsStore':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------------
+    # Write
+    # ------------------------------------------------------------------------
+
+    def config_id(self, config: BotConfig) -> int:
+        """Id config di tabel configs (insert jika belum ada)"""
+
+        params = asdict(config)
+        digest = config_hash(params)
+        config_id = self._config_ids.get(digest)
+        if config_id is None:
+            with self.transaction() as conn:
+                conn.execute("INSERT OR IGNORE INTO configs (config_hash, strategy, params) "
+                             "VALUES (?, ?, ?)", (digest, config.strategy, json.dumps(params)))
+                config_id = conn.execute("SELECT config_id FROM configs WHERE config_hash = ?",
+                                         (digest,)).fetchone()[0]
+            self._config_ids[digest] = config_id
+        return config_id
+
+    def add_runs(self, configs: Sequence[BotConfig], reports: Sequence[Dict],
+                 kind: str = 'sweep', label: str = '', symbol: Optional[str] = None,
+                 start_idx: Optional[int] = None, end_idx: Optional[int] = None,
+                 batch: bool = True) -> List[int]:
+        """
+        Simpan banyak run (config + metrics) dalam satu transaksi
+
+        batch=True: semua run mendapat batch_id = run_id pertama.
+        Returns: run_id sesuai urutan input
+        """
+
+        if len(configs) != len(reports):
+            raise ValueError("configs and reports must have the same length")
+        if not configs:
+            return []
+
+        created_at = datetime.now().isoformat(timespec='seconds')
+        with self.transaction() as conn:
+            config_ids = [self.config_id(config) for config in configs]
+            # Lock tulis sudah dipegang (BEGIN IMMEDIATE): id bisa dialokasikan di sini
+            first = conn.execute("SELECT COALESCE(MAX(run_id), 0) + 1 FROM runs").fetchone()[0]
+            run_ids = list(range(first, first + len(configs)))
+            batch_id = first if batch else None
+
+            conn.executemany(
+                "INSERT INTO runs (run_id, batch_id, kind, label, created_at, config_id, "
+                "symbol, start_idx, end_idx) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [(run_id, batch_id, kind, label, created_at, config_id, symbol, start_idx,
+                  end_idx) for run_id, config_id in zip(run_ids, config_ids)])
+            conn.executemany(
+                f"INSERT INTO metrics (run_id, {', '.join(METRIC_COLUMNS)}, extra) "
+                f"VALUES ({', '.join('?' * (len(METRIC_COLUMNS) + 2))})",
+                [self._metric_row(run_id, report) for run_id, report in zip(run_ids, reports)])
+        return run_ids
+
+    def add_run(self, config: BotConfig, report: Dict, kind: str = 'backtest',
+                label: str = '', symbol: Optional[str] = None,
+                start_idx: Optional[int] = None, end_idx: Optional[int] = None,
+                trades=None) -> int:
+        """Simpan satu run; trades (TradeLedger) ikut ditulis di transaksi yang sama"""
+
+        with self.transaction():
+            run_id, = self.add_runs([config], [report], kind, label, symbol, start_idx,
+                                    end_idx, batch=False)
+            if trades is not None:
+                self.add_trades(run_id, trades)
+        return run_id
+
+    def add_sweep(self, configs: Sequence[BotConfig], reports: Sequence[Dict],
+                  label: str = '', start_idx: Optional[int] = None,
+                  end_idx: Optional[int] = None) -> Optional[int]:
+        """Simpan hasil parameter sweep sebagai satu batch, return batch_id (None jika kosong)"""
+        run_ids = self.add_runs(configs, reports, 'sweep', label, start_idx=start_idx,
+                                end_idx=end_idx)
+        return run_ids[0] if run_ids else None
+
+    def add_trades(self, run_id: int, ledger) -> int:
+        """Tulis semua closed trades dari TradeLedger (kolom numpy) dengan executemany"""
+
+        n = len(ledger)
+        if n == 0:
+            return 0
+
+        def times(name: str) -> List[Optional[int]]:
+            return [None if value == _NAT_US else value for value in ledger.column(name).tolist()]
+
+        symbols = [ledger.symbols[code] for code in ledger.column('symbol_code').tolist()]
+        reasons = [ledger.reasons[code] for code in ledger.column('reason_code').tolist()]
+
+        rows = zip([run_id] * n, ledger.trade_ids(), symbols, times('entry_time'), times('exit_time'),
+                   *(ledger.column(name).tolist() for name in
+                     ('entry_price', 'exit_price', 'quantity', 'stop_loss', 'take_profit',
+                      'pnl')),
+                   reasons)
+        with self.transaction() as conn:
+            conn.executemany(
+                "INSERT INTO trades (run_id, trade_id, symbol, entry_time, exit_time, "
+                "entry_price, exit_price, quantity, stop_loss, take_profit, pnl, exit_reason) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+        return n
+
+    @staticmethod
+    def _metric_row(run_id: int, report: Dict) -> Tuple:
+        extra = {key: value for key, value in report.items() if key not in METRIC_COLUMNS}
+        values = []
+        for name in METRIC_COLUMNS:
+            value = report.get(name)
+            if value is not None:
+                # numpy scalar -> int/float Python supaya bisa di-bind sqlite3
+                value = int(value) if name in COUNT_COLUMNS else float(value)
+            values.append(value)
+        return (run_id, *values, json.dumps(extra, default=str) if extra else None)
+
+    # ------------------------------------------------------------------------
+    # Query
+    # ------------------------------------------------------------------------
+
+    def top_runs(self, metric: str = 'profit_factor', limit: int = 20,
+                 filters: Sequence[Tuple[str, str, float]] = (), kind: Optional[str] = None,
+                 batch_id: Optional[int] = None, strategy: Optional[str] = None,
+                 ascending: bool = False) -> List[Dict]:
+        """
+        Run terbaik menurut satu metric
+
+        filters: (metric, operator, value), mis. [('max_drawdown', '<', 10),
+        ('total_trades', '>=', 30)]. Return dict per run: kolom runs,
+        metrics, strategy dan params (dict field BotConfig).
+        """
+
+        self._check_metric(metric)
+        clauses, params = [], []
+        for name, op, value in filters:
+            self._check_metric(name)
+            if op not in FILTER_OPERATORS:
+                raise ValueError(f"Unknown operator {op!r}. Use one of {FILTER_OPERATORS}")
+            clauses.append(f"m.{name} {op} ?")
+            params.append(value)
+        for column, value in (('r.kind', kind), ('r.batch_id', batch_id),
+                              ('c.strategy', strategy)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+        order = 'ASC' if ascending else 'DESC'
+        rows = self.conn.execute(
+            f"SELECT {', '.join('r.' + name for name in RUN_COLUMNS)}, c.strategy, c.params, "
+            f"{', '.join('m.' + name for name in METRIC_COLUMNS)} "
+            f"FROM runs r JOIN metrics m USING (run_id) JOIN configs c USING (config_id) "
+            f"{where} ORDER BY m.{metric} IS NULL, m.{metric} {order}, r.run_id LIMIT ?",
+            (*params, limit)).fetchall()
+        return [self._run_dict(row) for row in rows]
+
+    def run(self, run_id: int) -> Optional[Dict]:
+        """Satu run lengkap dengan metrics (termasuk extra) dan params"""
+
+        row = self.conn.execute(
+            "SELECT r.*, c.strategy, c.params, m.* FROM runs r JOIN configs c USING (config_id) "
+            "LEFT JOIN metrics m USING (run_id) WHERE r.run_id = ?", (run_id,)).fetchone()
+        if row is None:
+            return None
+        result = self._run_dict(row)
+        extra = result.pop('extra', None)
+        if extra:
+            result.update(json.loads(extra))
+        return result
+
+    def trades(self, run_id: Optional[int] = None, symbol: Optional[str] = None,
+               start_time: Optional[int] = None, end_time: Optional[int] = None) -> List[Dict]:
+        """Closed trades, filter per run/symbol/exit_time [start, end) (microseconds)"""
+
+        clauses, params = [], []
+        for clause, value in (('run_id = ?', run_id), ('symbol = ?', symbol),
+                              ('exit_time >= ?', start_time), ('exit_time < ?', end_time)):
+            if value is not None:
+                clauses.append(clause)
+                params.append(value)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+        return [dict(row) for row in self.conn.execute(
+            f"SELECT * FROM trades {where} ORDER BY run_id, rowid", params)]
+
+    def query(self, sql: str, params: Sequence = ()) -> List[Dict]:
+        """SQL bebas (read), hasil list dict"""
+        return [dict(row) for row in self.conn.execute(sql, params)]
+
+    @staticmethod
+    def _check_metric(name: str) -> None:
+        if name not in METRIC_COLUMNS:
+            raise ValueError(f"Unknown metric {name!r}. Use one of {METRIC_COLUMNS}")
+
+    @staticmethod
+    def _run_dict(row: sqlite3.Row) -> Dict:
+        result = dict(row)
+        result['params'] = json.loads(result['params'])
+        return result
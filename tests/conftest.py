@@ -0,0 +1,30 @@
+"""Fixture bersama test suite: data OHLCV sintetis deterministik"""
+
+import logging
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_utils import make_ohlcv  # noqa: E402
+from trading_bot import INDICATOR_CACHE  # noqa: E402
+
+
+@pytest.fixture
+def ohlcv():
+    return make_ohlcv(3_000, seed=7)
+
+
+@pytest.fixture
+def logger():
+    logger = logging.getLogger('tests')
+    logger.setLevel(logging.CRITICAL)
+    return logger
+
+
+@pytest.fixture(autouse=True)
+def clear_indicator_cache():
+    yield
+    INDICATOR_CACHE.clear()
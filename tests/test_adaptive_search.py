@@ -0,0 +1,25 @@
+"""Successive halving: state minimal antar rung memberi report yang sama"""
+
+import pickle
+
+from adaptive_search import advance, create_candidate
+from checkpoint import decode_state, encode_state
+from trading_bot import BotConfig
+
+
+def test_resume_from_minimal_state_matches_direct_run(ohlcv):
+    config = BotConfig(strategy='mean_reversion', event_log='silent')
+    direct = create_candidate(config)
+    expected = advance(direct, ohlcv, 200, len(ohlcv))
+
+    first = create_candidate(config)
+    advance(first, ohlcv, 200, 1200)
+    state = first.get_state(history=False)
+    assert 'daily_trades' not in state
+    assert len(state['orders']) == len(first.order_executor.orders.open)
+    assert len(state['equity_curve']['curve']) == 0
+    assert len(pickle.dumps(state)) < len(pickle.dumps(first.get_state()))
+
+    resumed = create_candidate(config)
+    resumed.set_state(decode_state(encode_state({'bot': state}))['bot'])
+    assert advance(resumed, ohlcv, 1200, len(ohlcv)) == expected
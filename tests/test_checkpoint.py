@@ -0,0 +1,49 @@
+"""Checkpoint: round trip state bot dan penolakan global di luar allowlist"""
+
+import io
+import os
+import pickle
+
+import numpy as np
+import pytest
+
+from checkpoint import capture_state, decode_state, encode_state, restore_state
+from live_runner import AsyncLiveRunner
+from trading_bot import BotConfig, TradingBot, create_strategy
+
+
+def make_runner(logger):
+    config = BotConfig(strategy='mean_reversion', event_log='silent')
+    bot = TradingBot(config, create_strategy(config, logger), logger)
+    return bot, AsyncLiveRunner(bot, offload=False)
+
+
+def test_restore_continues_like_uninterrupted_run(ohlcv, logger):
+    rows = ohlcv.to_dict('records')
+    bot, runner = make_runner(logger)
+    for candle in rows:
+        runner.process(candle)
+
+    first, first_runner = make_runner(logger)
+    for candle in rows[:1500]:
+        first_runner.process(candle)
+    state = decode_state(encode_state(capture_state(first, first_runner)))
+
+    resumed, resumed_runner = make_runner(logger)
+    restore_state(state, resumed, resumed_runner)
+    for candle in rows[1500:]:
+        resumed_runner.process(candle)
+
+    np.testing.assert_array_equal(resumed.equity_curve.curve, bot.equity_curve.curve)
+    assert resumed.balance == bot.balance
+
+
+class _Exploit:
+    def __reduce__(self):
+        return os.system, ('true',)
+
+
+@pytest.mark.parametrize('payload', [_Exploit(), np.save, np.load, pickle.loads, io.BytesIO])
+def test_disallowed_globals_rejected(payload):
+    with pytest.raises(pickle.UnpicklingError):
+        decode_state(encode_state({'payload': payload}))
@@ -0,0 +1,33 @@
+"""Streaming backtest per chunk sama dengan run_backtest atas data penuh"""
+
+from data_stream import run_streaming_backtest
+from trading_bot import BotConfig, TradingBot, create_strategy
+
+
+def make_bot(logger):
+    config = BotConfig(event_log='silent')
+    return TradingBot(config, create_strategy(config, logger), logger)
+
+
+def chunks(data, size):
+    return (data.iloc[start:start + size] for start in range(0, len(data), size))
+
+
+def test_streaming_matches_full_backtest(ohlcv, logger):
+    full = make_bot(logger)
+    expected = full.run_backtest(ohlcv, 200)
+
+    streamed = make_bot(logger)
+    assert run_streaming_backtest(streamed, chunks(ohlcv, 250), 200) == expected
+    # Tanpa equity curve per bar, memory tidak tumbuh dengan jumlah bar
+    assert len(streamed.equity_curve.curve) == 0
+    assert streamed.equity_curve.max_drawdown == full.equity_curve.max_drawdown
+
+
+def test_streaming_can_record_equity(ohlcv, logger):
+    full = make_bot(logger)
+    full.run_backtest(ohlcv, 200)
+
+    streamed = make_bot(logger)
+    run_streaming_backtest(streamed, chunks(ohlcv, 250), 200, record_equity=True)
+    assert list(streamed.equity_curve.curve) == list(full.equity_curve.curve)
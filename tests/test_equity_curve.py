@@ -0,0 +1,73 @@
+"""EquityCurve: running market value dan equity = modal + realized P&L"""
+
+import numpy as np
+import pytest
+
+from trading_bot import BotConfig, EquityCurve, TradingBot, create_strategy
+
+
+def test_running_market_value_matches_full_sum():
+    rng = np.random.default_rng(11)
+    curve = EquityCurve(10_000.0)
+    positions = {}  # symbol -> list quantity trade terbuka
+    prices = {}
+    balance = 10_000.0
+    expected = []
+
+    for _ in range(5000):
+        symbol = str(rng.choice(['A', 'B', 'C']))
+        price = float(rng.uniform(50, 150))
+        roll = rng.random()
+        if roll < 0.1:
+            quantity = float(rng.uniform(0.1, 2))
+            positions.setdefault(symbol, []).append(quantity)
+            curve.open_position(symbol, quantity, price)
+            prices.setdefault(symbol, price)
+        elif roll < 0.2 and positions.get(symbol):
+            quantity = positions[symbol].pop()
+            if not positions[symbol]:
+                del positions[symbol]
+            curve.close_position(symbol, quantity, flat=symbol not in positions)
+
+        prices[symbol] = price
+        equity = curve.mark(symbol, price, balance)
+        expected.append(balance + sum(sum(qty) * prices[s] for s, qty in positions.items()))
+        assert np.isclose(equity, expected[-1], rtol=1e-12)
+
+    np.testing.assert_allclose(curve.curve, expected, rtol=1e-12)
+
+
+def test_single_symbol_is_exact():
+    curve = EquityCurve(1000.0)
+    curve.open_position('A', 3.0, 10.0)
+    for price in np.linspace(9, 11, 50):
+        assert curve.mark('A', price, 970.0) == float(970.0 + 3.0 * price)
+    curve.close_position('A', 3.0, flat=True)
+    assert curve.market_value == 0.0
+    assert curve.value(1000.0) == 1000.0
+
+
+def test_state_round_trip_restores_market_value():
+    curve = EquityCurve(1000.0)
+    curve.open_position('A', 2.0, 10.0)
+    curve.open_position('B', 1.0, 20.0)
+    curve.mark('A', 12.0, 960.0)
+
+    restored = EquityCurve(1000.0)
+    restored.set_state(curve.get_state())
+    assert restored.market_value == curve.market_value
+    assert restored.mark('B', 25.0, 960.0) == curve.mark('B', 25.0, 960.0)
+
+
+def test_flat_equity_equals_account_plus_realized_pnl(ohlcv, logger):
+    config = BotConfig(strategy='mean_reversion', event_log='silent')
+    bot = TradingBot(config, create_strategy(config, logger), logger)
+    report = bot.run_backtest_vectorized(ohlcv)
+    for trade_id in list(bot.open_trades):
+        bot._close_trade(trade_id, float(ohlcv['close'].iloc[-1]), 'End')
+    bot.equity_curve.mark(bot.symbol, float(ohlcv['close'].iloc[-1]), bot.balance)
+
+    total_pnl = float(bot.closed_trades.column('pnl').sum())
+    assert report['total_trades'] > 0
+    assert bot.balance == pytest.approx(config.account_size + total_pnl, abs=1e-9)
+    assert bot.equity_curve.curve[-1] == pytest.approx(config.account_size + total_pnl, abs=1e-9)
@@ -0,0 +1,71 @@
+"""EventLog: default ke writer thread, BinarySink string panjang dan file lama"""
+
+import gc
+import json
+import logging
+import struct
+import threading
+
+import pytest
+
+from trading_bot import BinarySink, EventLog, JSONLSink, create_event_log
+
+
+class ThreadRecorder(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.threads = []
+
+    def emit(self, record):
+        self.threads.append(record.threadName)
+
+
+def test_logging_event_log_writes_off_caller_thread():
+    logger = logging.getLogger('test_event_log.logging')
+    logger.setLevel(logging.INFO)
+    handler = ThreadRecorder()
+    logger.addHandler(handler)
+    try:
+        events = create_event_log('logging', logger)
+        assert events.background
+        events.emit('order_filled', 'ORDER_1', 1.0, 100.0)
+        assert events.flush(timeout=5)
+        events.close()
+    finally:
+        logger.removeHandler(handler)
+    assert handler.threads == ['event-log']
+    assert threading.current_thread().name != 'event-log'
+
+
+def test_writer_stops_when_event_log_collected(tmp_path):
+    path = tmp_path / 'events.jsonl'
+    events = EventLog(JSONLSink(str(path)))
+    thread = events._thread
+    events.emit('order_filled', 'ORDER_1', 1.0, 100.0)
+    del events
+    gc.collect()
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+    assert json.loads(path.read_text())['order_id'] == 'ORDER_1'
+
+
+def test_binary_sink_round_trips_long_strings(tmp_path):
+    path = str(tmp_path / 'events.bin')
+    reason = 'x' * 70_000
+    events = EventLog(BinarySink(path))
+    events.emit('trade_opened', 'TRADE_1', 'BTC/USD', 100.0, 95.0, 110.0, 1.5, reason)
+    events.close()
+    [(kind, _, values)] = BinarySink.read(path)
+    assert kind == 'trade_opened'
+    assert values == ('TRADE_1', 'BTC/USD', 100.0, 95.0, 110.0, 1.5, reason)
+
+
+def test_binary_sink_reads_legacy_files_but_does_not_append(tmp_path):
+    path = tmp_path / 'legacy.bin'
+    payload = b's' + struct.pack('<H', 7) + b'ORDER_1' + b'd' + struct.pack('<d', 1.0) + \
+        b'd' + struct.pack('<d', 100.0)
+    path.write_bytes(BinarySink.LEGACY_MAGIC + BinarySink.HEADER.pack(1, 123, len(payload))
+                     + payload)
+    assert BinarySink.read(str(path)) == [('order_filled', 123, ('ORDER_1', 1.0, 100.0))]
+    with pytest.raises(ValueError):
+        BinarySink(str(path))
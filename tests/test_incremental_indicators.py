@@ -0,0 +1,97 @@
+"""Parity Incremental* (per bar) dengan TechnicalIndicators (batch)"""
+
+import numpy as np
+import pytest
+
+from trading_bot import (IncrementalATR, IncrementalBollingerBands, IncrementalEMA,
+                         IncrementalMACD, IncrementalRSI, IncrementalSMA,
+                         TechnicalIndicators)
+
+
+def assert_parity(streamed, batch):
+    np.testing.assert_allclose(np.asarray(streamed, dtype=float), np.asarray(batch),
+                               rtol=1e-9, atol=1e-9, equal_nan=True)
+
+
+@pytest.mark.parametrize('period', [1, 5, 50])
+def test_sma(ohlcv, period):
+    sma = IncrementalSMA(period)
+    streamed = [sma.update(x) for x in ohlcv['close']]
+    assert_parity(streamed, TechnicalIndicators.calculate_sma(ohlcv['close'], period))
+
+
+def test_sma_min_periods_matches_trailing_mean(ohlcv):
+    sma = IncrementalSMA(20, min_periods=1)
+    streamed = [sma.update(x) for x in ohlcv['volume']]
+    assert_parity(streamed, TechnicalIndicators.calculate_trailing_mean(ohlcv['volume'], 20))
+
+
+@pytest.mark.parametrize('period', [2, 12, 50])
+def test_ema(ohlcv, period):
+    ema = IncrementalEMA(period)
+    streamed = [ema.update(x) for x in ohlcv['close']]
+    assert_parity(streamed, TechnicalIndicators.calculate_ema(ohlcv['close'], period))
+
+
+@pytest.mark.parametrize('period', [2, 14])
+def test_rsi(ohlcv, period):
+    rsi = IncrementalRSI(period)
+    streamed = [rsi.update(x) for x in ohlcv['close']]
+    assert_parity(streamed, TechnicalIndicators.calculate_rsi(ohlcv['close'], period))
+
+
+def test_rsi_flat_prices(ohlcv):
+    # avg_loss == 0: 100 saat naik, NaN saat datar (0 / 0), sama dengan pandas
+    close = ohlcv['close'].copy()
+    close.iloc[100:200] = close.iloc[100]
+    close.iloc[300:400] = np.linspace(100, 110, 100)
+    rsi = IncrementalRSI(14)
+    streamed = [rsi.update(x) for x in close]
+    assert_parity(streamed, TechnicalIndicators.calculate_rsi(close, 14))
+
+
+@pytest.mark.parametrize('period', [1, 14])
+def test_atr(ohlcv, period):
+    atr = IncrementalATR(period)
+    streamed = [atr.update(h, l, c)
+                for h, l, c in zip(ohlcv['high'], ohlcv['low'], ohlcv['close'])]
+    expected = TechnicalIndicators.calculate_atr(ohlcv['high'], ohlcv['low'], ohlcv['close'],
+                                                 period)
+    assert_parity(streamed, expected)
+
+
+@pytest.mark.parametrize('period, std_dev', [(2, 1.0), (20, 2.0)])
+def test_bollinger_bands(ohlcv, period, std_dev):
+    bands = IncrementalBollingerBands(period, std_dev)
+    streamed = np.array([bands.update(x) for x in ohlcv['close']])
+    expected = TechnicalIndicators.calculate_bollinger_bands(ohlcv['close'], period, std_dev)
+    for column, batch in enumerate(expected):
+        assert_parity(streamed[:, column], batch)
+
+
+def test_macd(ohlcv):
+    macd = IncrementalMACD(12, 26, 9)
+    streamed = np.array([macd.update(x) for x in ohlcv['close']])
+    expected = TechnicalIndicators.calculate_macd(ohlcv['close'], 12, 26, 9)
+    for column, batch in enumerate(expected):
+        assert_parity(streamed[:, column], batch)
+
+
+def test_nan_input_skipped_like_pandas(ohlcv):
+    close = ohlcv['close'].copy()
+    close.iloc[[10, 11, 500]] = np.nan
+    sma, ema = IncrementalSMA(5), IncrementalEMA(5)
+    assert_parity([sma.update(x) for x in close], TechnicalIndicators.calculate_sma(close, 5))
+    assert_parity([ema.update(x) for x in close], TechnicalIndicators.calculate_ema(close, 5))
+
+
+@pytest.mark.parametrize('period', [1, 2, 20])
+def test_bollinger_bands_recover_after_nan(ohlcv, period):
+    close = ohlcv['close'].copy()
+    close.iloc[[0, 10, 11, 500, 501, 502]] = np.nan
+    bands = IncrementalBollingerBands(period, 2.0)
+    streamed = np.array([bands.update(x) for x in close])
+    expected = TechnicalIndicators.calculate_bollinger_bands(close, period, 2.0)
+    for column, batch in enumerate(expected):
+        assert_parity(streamed[:, column], batch)
+    assert not np.isnan(streamed[-1, 1])
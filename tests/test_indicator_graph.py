@@ -0,0 +1,46 @@
+"""IndicatorGraph: spec yang sama dari beberapa strategi dihitung sekali"""
+
+from collections import Counter
+
+import numpy as np
+
+import trading_bot
+from trading_bot import (BotConfig, IndicatorGraph, MACrossoverRSIStrategy,
+                         MeanReversionStrategy, StrategyEnsemble)
+
+
+def make_strategies(logger):
+    config = BotConfig()
+    return [MACrossoverRSIStrategy(config, logger), MeanReversionStrategy(config, logger)]
+
+
+def test_shared_specs_become_one_node(logger):
+    strategies = make_strategies(logger)
+    graph = IndicatorGraph(strategies)
+
+    # rsi, atr dan trailing_mean(volume) dideklarasikan kedua strategi;
+    # upper/lower band adalah output dari satu node bollinger_bands
+    kinds = Counter(node.kind for node in graph.nodes)
+    assert kinds == {'sma': 2, 'rsi': 1, 'atr': 1, 'trailing_mean': 1, 'bollinger_bands': 1}
+    assert set(graph.columns) == {'close', 'high', 'low', 'volume'}
+    assert graph.stats() == {'requested': 13, 'nodes': 6, 'columns': 4}
+
+
+def test_ensemble_computes_each_node_once(ohlcv, logger, monkeypatch):
+    calls = Counter()
+    for kind, (batch, stream) in list(trading_bot.INDICATOR_KINDS.items()):
+        def counted(*args, _kind=kind, _batch=batch):
+            calls[_kind] += 1
+            return _batch(*args)
+        monkeypatch.setitem(trading_bot.INDICATOR_KINDS, kind, (counted, stream))
+
+    ensemble = StrategyEnsemble(make_strategies(logger))
+    ensemble.prepare(ohlcv)
+    assert calls == {'sma': 2, 'rsi': 1, 'atr': 1, 'trailing_mean': 1, 'bollinger_bands': 1}
+
+    # Kolom prepared sama dengan strategi yang prepare sendiri
+    for shared, alone in zip(ensemble.strategies, make_strategies(logger)):
+        expected = alone.compute_indicators(ohlcv)
+        assert shared.prepared.keys() == expected.keys()
+        for name, values in expected.items():
+            np.testing.assert_array_equal(shared.prepared[name], values)
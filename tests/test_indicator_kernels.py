@@ -0,0 +1,108 @@
+"""IndicatorKernels vs rumus pandas publik (dengan dan tanpa kernel privat)"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import trading_bot
+from trading_bot import IndicatorKernels
+
+
+def reference_rsi(close, period):
+    delta = close.diff()
+    gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
+    return 100 - (100 / (1 + gain / loss))
+
+
+def reference_atr(high, low, close, period):
+    tr = pd.concat([high - low, abs(high - close.shift()), abs(low - close.shift())],
+                   axis=1).max(axis=1)
+    return tr.rolling(window=period).mean()
+
+
+@pytest.fixture(params=['private', 'public'])
+def kernels(request, monkeypatch):
+    if request.param == 'private':
+        if trading_bot._window_aggs is None:
+            pytest.skip('pandas window kernels not available for this pandas version')
+    else:
+        monkeypatch.setattr(trading_bot, '_window_aggs', None)
+    return IndicatorKernels
+
+
+def assert_same(result, expected):
+    np.testing.assert_allclose(result, np.asarray(expected), rtol=1e-12, atol=1e-12,
+                               equal_nan=True)
+
+
+def test_sma_and_ema(kernels, ohlcv):
+    close = ohlcv['close']
+    assert_same(kernels.sma(close.to_numpy(), 20), close.rolling(20).mean())
+    assert_same(kernels.ema(close.to_numpy(), 12), close.ewm(span=12, adjust=False).mean())
+
+
+def test_rsi_and_atr(kernels, ohlcv):
+    close = ohlcv['close']
+    assert_same(kernels.rsi(close.to_numpy(), 14), reference_rsi(close, 14))
+    assert_same(kernels.atr(ohlcv['high'].to_numpy(), ohlcv['low'].to_numpy(),
+                            close.to_numpy(), 14),
+                reference_atr(ohlcv['high'], ohlcv['low'], close, 14))
+
+
+def test_bollinger_and_macd(kernels, ohlcv):
+    close = ohlcv['close']
+    upper, middle, lower = kernels.bollinger_bands(close.to_numpy(), 20, 2)
+    std = close.rolling(20).std()
+    assert_same(middle, close.rolling(20).mean())
+    assert_same(upper, close.rolling(20).mean() + std * 2)
+    assert_same(lower, close.rolling(20).mean() - std * 2)
+
+    macd_line, signal_line, histogram = kernels.macd(close.to_numpy())
+    expected = close.ewm(span=12, adjust=False).mean() - close.ewm(span=26, adjust=False).mean()
+    assert_same(macd_line, expected)
+    assert_same(signal_line, expected.ewm(span=9, adjust=False).mean())
+    assert_same(histogram, expected - expected.ewm(span=9, adjust=False).mean())
+
+
+def test_nan_input(kernels, ohlcv):
+    close = ohlcv['close'].copy()
+    close.iloc[[50, 51, 400]] = np.nan
+    assert_same(kernels.sma(close.to_numpy(), 10), close.rolling(10).mean())
+    assert_same(kernels.ema(close.to_numpy(), 10), close.ewm(span=10, adjust=False).mean())
+
+
+def test_unsupported_pandas_version_falls_back(monkeypatch):
+    monkeypatch.setattr(pd, '__version__', '99.0.0')
+    assert trading_bot._load_window_aggs() is None
+
+
+@pytest.mark.parametrize('window', [1, 5, 20])
+def test_trailing_mean_matches_loop(window):
+    values = np.random.default_rng(3).normal(size=200)
+    values[[0, 7, 8, 9, 10, 11, 12, 100]] = np.nan
+    expected = []
+    for i in range(len(values)):
+        chunk = values[max(0, i - window + 1):i + 1]
+        chunk = chunk[~np.isnan(chunk)]
+        expected.append(chunk.mean() if len(chunk) else np.nan)
+    assert_same(IndicatorKernels.trailing_mean(values, window), expected)
+
+
+def test_trailing_mean_empty():
+    assert len(IndicatorKernels.trailing_mean(np.array([]), 5)) == 0
+
+
+def test_float32_and_out_buffers(ohlcv):
+    close = ohlcv['close'].to_numpy()
+    full = IndicatorKernels.sma(close, 20)
+
+    small = IndicatorKernels.sma(close, 20, dtype=np.float32)
+    assert small.dtype == np.float32
+    np.testing.assert_allclose(small, full, rtol=1e-6, equal_nan=True)
+
+    buffer = np.empty(len(close))
+    assert IndicatorKernels.sma(close, 20, out=buffer) is buffer
+    assert_same(buffer, full)
+    with pytest.raises(ValueError):
+        IndicatorKernels.sma(close, 20, out=np.empty(3))
@@ -0,0 +1,25 @@
+"""AsyncLiveRunner: replay lewat SimulatedExchange"""
+
+import asyncio
+
+from live_runner import AsyncLiveRunner, SimulatedExchange
+from trading_bot import BotConfig, TradingBot, create_strategy
+
+
+def make_runner(logger):
+    config = BotConfig(event_log='silent')
+    return AsyncLiveRunner(TradingBot(config, create_strategy(config, logger), logger))
+
+
+def test_run_can_be_called_again(ohlcv, logger):
+    # Feed dipecah dua run() pada runner yang sama == satu run() penuh
+    split = make_runner(logger)
+    first, second = ohlcv.iloc[:1500], ohlcv.iloc[1500:].reset_index(drop=True)
+    asyncio.run(split.run(SimulatedExchange(first).stream_candles()))
+    stats = asyncio.run(split.run(SimulatedExchange(second).stream_candles()))
+
+    full = make_runner(logger)
+    asyncio.run(full.run(SimulatedExchange(ohlcv).stream_candles()))
+
+    assert stats['candles'] == len(ohlcv)
+    assert split.bot.get_overall_report() == full.bot.get_overall_report()
@@ -0,0 +1,43 @@
+"""BotMetrics: timing per stage hanya direkam saat metrics aktif"""
+
+from trading_bot import BotConfig, BotMetrics, TradingBot, create_strategy
+
+
+def make_bot(logger, **overrides):
+    config = BotConfig(strategy='mean_reversion', event_log='silent', **overrides)
+    return TradingBot(config, create_strategy(config, logger), logger)
+
+
+def test_metrics_disabled_by_default(ohlcv, logger):
+    bot = make_bot(logger)
+    assert bot.metrics is None
+    bot.run_backtest(ohlcv, end_idx=400)
+    assert bot.metrics is None
+
+
+def test_stage_timings_recorded_when_enabled(ohlcv, logger):
+    bot = make_bot(logger, collect_metrics=True)
+    assert isinstance(bot.metrics, BotMetrics)
+    bot.run_backtest(ohlcv, end_idx=400)
+
+    stages = bot.metrics.stages
+    candles = 400 - 200
+    assert stages['process_candle'].count == candles
+    assert stages['check_open_trades'].count == candles
+    assert stages['generate_signal'].count == candles
+    assert sum(bot.metrics.signals.values()) == candles
+    # Stage order hanya untuk sinyal yang lolos validasi
+    assert stages['order'].count == sum(bot.metrics.orders.values())
+
+
+def test_enable_and_disable_metrics(ohlcv, logger):
+    bot = make_bot(logger)
+    metrics = bot.enable_metrics()
+    assert bot.enable_metrics() is metrics
+    bot.run_backtest(ohlcv, end_idx=300)
+    assert metrics.stages['process_candle'].count == 100
+
+    bot.disable_metrics()
+    bot.run_backtest(ohlcv, start_idx=300, end_idx=400)
+    assert bot.metrics is None
+    assert metrics.stages['process_candle'].count == 100
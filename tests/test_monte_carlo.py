@@ -0,0 +1,51 @@
+"""Monte Carlo: invariansi chunk, reproduksi backtest dan percentile drawdown"""
+
+import numpy as np
+import pytest
+
+from monte_carlo import run_monte_carlo, simulate_paths, summarize
+from trading_bot import BotConfig, TradingBot, create_strategy
+
+
+@pytest.mark.parametrize('method', ['bootstrap', 'shuffle'])
+def test_results_do_not_depend_on_chunk_size(method):
+    rng = np.random.default_rng(0)
+    pnl = rng.normal(1, 20, size=50)
+    notional = rng.uniform(400, 600, size=50)
+    kwargs = dict(n_paths=1000, method=method, skip_prob=0.1, slippage=0.001,
+                  entry_notional=notional, exit_notional=notional, seed=5)
+    whole = simulate_paths(pnl, **kwargs)
+    chunked = simulate_paths(pnl, max_bytes=40 * 50 * 7, **kwargs)  # 7 path per chunk
+    for name in whole:
+        np.testing.assert_array_equal(chunked[name], whole[name])
+
+
+def test_no_skip_no_slippage_reproduces_backtest(ohlcv, logger):
+    config = BotConfig(strategy='mean_reversion', event_log='silent')
+    bot = TradingBot(config, create_strategy(config, logger), logger)
+    bot.run_backtest_vectorized(ohlcv)
+    for trade_id in list(bot.open_trades):
+        bot._close_trade(trade_id, float(ohlcv['close'].iloc[-1]), 'End')
+
+    result = run_monte_carlo(bot, n_paths=200, method='shuffle', seed=1)
+    assert result['trades'] > 0
+    assert result['slippage'] == 0.0
+    assert result['final_equity']['min'] == pytest.approx(bot.balance, abs=1e-6)
+    assert result['final_equity']['max'] == pytest.approx(bot.balance, abs=1e-6)
+
+
+def test_drawdown_percentiles():
+    # Bootstrap dua trade dari {-1000, +1000}: empat path dengan drawdown diketahui
+    paths = simulate_paths(np.array([-1000.0, 1000.0]), n_paths=4000, start_equity=10_000,
+                           seed=3)
+    expected = {0.0, 0.1, 0.2, 1000 / 11_000}
+    values, counts = np.unique(paths['max_drawdown'].round(12), return_counts=True)
+    assert set(values) == {round(v, 12) for v in expected}
+    np.testing.assert_allclose(counts / 4000, 0.25, atol=0.03)
+
+    summary = summarize(paths, 10_000, max_drawdown=0.15)
+    for q in (5, 50, 95):
+        assert summary['max_drawdown'][f'p{q}'] == pytest.approx(
+            np.percentile(paths['max_drawdown'], q) * 100)
+    assert summary['prob_breach_max_drawdown'] == pytest.approx(
+        np.mean(paths['max_drawdown'] > 0.15))
@@ -0,0 +1,31 @@
+"""OHLCVStore: write, append dan validasi append"""
+
+import pandas as pd
+import pytest
+
+from ohlcv_store import OHLCVStore
+
+
+def test_append_round_trip(ohlcv, tmp_path):
+    store = OHLCVStore.write(str(tmp_path), ohlcv.iloc[:1000])
+    store.append(ohlcv.iloc[1000:])
+    pd.testing.assert_frame_equal(OHLCVStore(str(tmp_path)).to_frame(), ohlcv)
+
+
+def test_append_missing_column_leaves_store_intact(ohlcv, tmp_path):
+    store = OHLCVStore.write(str(tmp_path), ohlcv.iloc[:1000])
+    bad = ohlcv.iloc[1000:].drop(columns='volume').assign(extra=1.0)
+    with pytest.raises(ValueError, match='volume'):
+        store.append(bad)
+    assert len(OHLCVStore(str(tmp_path))) == 1000
+
+
+def test_append_rejects_lossy_dtype(ohlcv, tmp_path):
+    store = OHLCVStore.write(str(tmp_path), ohlcv.iloc[:1000])
+    bad = ohlcv.iloc[1000:].copy()
+    bad['close'] = bad['close'].astype(str)
+    with pytest.raises(ValueError, match='close'):
+        store.append(bad)
+    reopened = OHLCVStore(str(tmp_path))
+    assert len(reopened) == 1000
+    pd.testing.assert_frame_equal(reopened.to_frame(), ohlcv.iloc[:1000])
@@ -0,0 +1,76 @@
+"""OrderStore: history bounded, spill JSONL dan index open + history"""
+
+import json
+from datetime import datetime
+
+from trading_bot import (BotConfig, Order, OrderStatus, OrderStore, OrderType, TradingBot,
+                         create_strategy)
+
+
+def make_order(i, symbol):
+    return Order(order_id=f"ORD_{i:06d}", order_type=OrderType.BUY, symbol=symbol,
+                 quantity=1.0, price=100.0 + i, created_at=datetime(2024, 1, 1))
+
+
+def test_history_evicts_and_spills(tmp_path):
+    spill_path = tmp_path / 'orders.jsonl'
+    store = OrderStore(retention=5, spill_path=str(spill_path))
+    symbols = ['BTC/USD', 'ETH/USD']
+    orders = [make_order(i, symbols[i % 2]) for i in range(12)]
+    for order in orders:
+        store.add(order)
+    for order in orders[:10]:
+        store.set_status(order, OrderStatus.FILLED)
+    store.close()
+
+    # 2 order masih open, 5 terminal terbaru di history, 5 tertua di-spill
+    assert len(store.open) == 2
+    assert list(store.history) == [o.order_id for o in orders[5:10]]
+    assert store.evicted == store.spilled == 5
+    assert len(store) == 7
+
+    records = [json.loads(line) for line in spill_path.read_text().splitlines()]
+    assert [r['order_id'] for r in records] == [o.order_id for o in orders[:5]]
+    assert all(r['status'] == 'FILLED' for r in records)
+
+    # Index mencakup open + history, order yang di-evict tidak lagi ditemukan
+    for order in orders[:5]:
+        assert store.get(order.order_id) is None
+    for order in orders[5:]:
+        assert store.get(order.order_id) is order
+    for symbol in symbols:
+        expected = [o for o in orders[5:] if o.symbol == symbol]
+        assert sorted(store.by_symbol(symbol), key=lambda o: o.order_id) == expected
+    assert store.by_symbol('BTC/USD', OrderStatus.PENDING) == [orders[10]]
+    assert store.by_status(OrderStatus.FILLED) == orders[5:10]
+    assert store.counts()['FILLED'] == 5
+    assert store.counts()['PENDING'] == 2
+
+
+def test_zero_retention_without_spill_keeps_only_open():
+    store = OrderStore(retention=0)
+    orders = [make_order(i, 'BTC/USD') for i in range(3)]
+    for order in orders:
+        store.add(order)
+    store.set_status(orders[0], OrderStatus.CANCELLED)
+
+    assert len(store) == 2 and not store.history
+    assert store.evicted == 1 and store.spilled == 0
+    assert store.get(orders[0].order_id) is None
+    assert store.by_symbol('BTC/USD') == orders[1:]
+
+
+def test_bot_config_bounds_order_history(ohlcv, logger, tmp_path):
+    spill_path = tmp_path / 'orders.jsonl'
+    config = BotConfig(strategy='mean_reversion', event_log='silent', order_history_size=3,
+                       order_spill_path=str(spill_path))
+    bot = TradingBot(config, create_strategy(config, logger), logger)
+    bot.run_backtest(ohlcv, end_idx=1000)
+    store = bot.order_executor.orders
+    store.close()
+
+    assert store.retention == 3
+    assert len(store.history) == 3
+    assert store.spilled > 0
+    assert len(spill_path.read_text().splitlines()) == store.spilled
+    assert store.spilled + len(store) == bot.order_executor.order_counter
@@ -0,0 +1,38 @@
+"""PortfolioEngine sebagai TradingBot: entry point run_backtest* memakai run()"""
+
+import pytest
+
+from data_utils import make_ohlcv
+from trading_bot import BotConfig, PortfolioEngine, TradingBot, create_strategy
+
+
+@pytest.mark.parametrize('run', ['run_backtest', 'run_backtest_vectorized'])
+def test_single_frame_matches_trading_bot(ohlcv, logger, run):
+    config = BotConfig(event_log='silent')
+    bot = TradingBot(config, create_strategy(config, logger), logger)
+    engine = PortfolioEngine(config, logger)
+    assert getattr(engine, run)(ohlcv, 200, symbol='ETH/USD') == bot.run_backtest(ohlcv, 200)
+    assert list(engine.symbols) == ['ETH/USD']
+
+
+def test_single_frame_requires_symbol(ohlcv, logger):
+    engine = PortfolioEngine(BotConfig(event_log='silent'), logger)
+    with pytest.raises(ValueError, match='symbol'):
+        engine.run_backtest(ohlcv)
+
+    # Satu symbol terdaftar: DataFrame tanpa symbol menggantikan data symbol itu
+    engine.add_symbol('ETH/USD', ohlcv.iloc[:1000])
+    engine.run_backtest(ohlcv)
+    assert engine.symbols['ETH/USD'].data is ohlcv
+
+
+def test_windows_match_full_run(ohlcv, logger):
+    config = BotConfig(event_log='silent')
+    data = {'A': ohlcv, 'B': make_ohlcv(len(ohlcv), seed=8)}
+    full = PortfolioEngine(config, logger)
+    report = full.run_backtest(data)
+
+    windowed = PortfolioEngine(config, logger)
+    windowed.run_backtest(data, 200, 1500)
+    assert windowed.run_backtest(data, 1500) == report
+    assert windowed.get_symbol_report() == full.get_symbol_report()
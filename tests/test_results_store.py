@@ -0,0 +1,31 @@
+"""ResultsStore: batch sweep dan auto-save backtest"""
+
+from parameter_sweep import grid_configs, run_sweep
+from results_store import ResultsStore
+from trading_bot import BotConfig, TradingBot, create_strategy
+
+
+def test_add_sweep_empty_returns_none(tmp_path):
+    with ResultsStore(str(tmp_path / 'r.db')) as store:
+        assert store.add_sweep([], []) is None
+        assert store.query("SELECT COUNT(*) AS n FROM runs") == [{'n': 0}]
+
+
+def test_run_sweep_writes_one_batch(ohlcv, tmp_path):
+    path = str(tmp_path / 'r.db')
+    configs = grid_configs(BotConfig(event_log='silent'), {'fast_ma_period': [10, 20]})
+    assert run_sweep(ohlcv, [], processes=1, results_db=path).empty
+    run_sweep(ohlcv, configs, processes=1, results_db=path)
+    with ResultsStore(path) as store:
+        rows = store.query("SELECT run_id, batch_id, kind FROM runs ORDER BY run_id")
+    assert [row['batch_id'] for row in rows] == [rows[0]['run_id']] * 2
+    assert {row['kind'] for row in rows} == {'sweep'}
+
+
+def test_backtest_auto_saves_to_results_db(ohlcv, logger, tmp_path):
+    config = BotConfig(event_log='silent', results_db=str(tmp_path / 'r.db'))
+    bot = TradingBot(config, create_strategy(config, logger), logger)
+    report = bot.run_backtest_vectorized(ohlcv)
+    with ResultsStore(config.results_db) as store:
+        saved = store.run(1)
+    assert saved['total_trades'] == report['total_trades']
@@ -0,0 +1,49 @@
+"""Tick-to-candle aggregator vs resample pandas"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tick_aggregator import (BarAggregator, TickBarAggregator, TimeBarAggregator,
+                             VolumeBarAggregator)
+
+
+@pytest.fixture
+def ticks():
+    rng = np.random.default_rng(3)
+    timestamps = np.cumsum(rng.integers(1, 2_000, 5_000))
+    prices = 100 + np.cumsum(rng.normal(0, 0.05, 5_000))
+    sizes = rng.uniform(0.1, 2.0, 5_000)
+    return list(zip(timestamps.tolist(), prices.tolist(), sizes.tolist()))
+
+
+def collect(aggregator, ticks):
+    return pd.DataFrame([dict(bar) for bar in aggregator.iter_bars(ticks, flush=True)])
+
+
+def test_base_aggregator_is_abstract():
+    with pytest.raises(TypeError):
+        BarAggregator()
+
+
+def test_time_bars_match_resample(ticks):
+    bars = collect(TimeBarAggregator(60_000), ticks)
+    frame = pd.DataFrame(ticks, columns=['timestamp', 'price', 'size'])
+    grouped = frame.groupby(frame['timestamp'] // 60_000)
+    expected = pd.DataFrame({
+        'timestamp': grouped['timestamp'].first().index * 60_000,
+        'open': grouped['price'].first(), 'high': grouped['price'].max(),
+        'low': grouped['price'].min(), 'close': grouped['price'].last(),
+        'volume': grouped['size'].sum(), 'ticks': grouped.size(),
+    }).reset_index(drop=True)
+    pd.testing.assert_frame_equal(bars[expected.columns], expected, check_dtype=False)
+
+
+def test_tick_and_volume_bars(ticks):
+    tick_bars = collect(TickBarAggregator(100), ticks)
+    assert (tick_bars['ticks'] == 100).all()
+    assert len(tick_bars) == len(ticks) // 100
+
+    volume_bars = collect(VolumeBarAggregator(50.0), ticks)
+    assert (volume_bars['volume'].iloc[:-1] >= 50.0).all()
+    assert volume_bars['ticks'].sum() == len(ticks)
@@ -0,0 +1,80 @@
+"""TradeLedger: growth kolom dan running stats vs hitung ulang dari Trade"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from trading_bot import Trade, TradeLedger
+
+
+def make_trades(n):
+    rng = np.random.default_rng(5)
+    start = datetime(2024, 1, 1)
+    trades = []
+    for i in range(n):
+        entry = float(rng.uniform(90, 110))
+        # Sebagian trade breakeven (pnl == 0 dihitung sebagai loss)
+        exit_price = entry if i % 7 == 0 else float(entry + rng.normal(0, 3))
+        trades.append(Trade(
+            trade_id=f"TRADE_{i + 1}" if i % 5 else f"manual-{i}",
+            symbol=['BTC/USD', 'ETH/USD'][i % 2],
+            entry_price=entry,
+            entry_time=start + timedelta(hours=i),
+            quantity=float(rng.uniform(0.1, 2)),
+            stop_loss=entry * 0.98,
+            take_profit=entry * 1.04,
+            exit_price=exit_price,
+            exit_time=start + timedelta(hours=i, minutes=30),
+            exit_reason=['Stop Loss', 'Take Profit', 'End'][i % 3],
+        ))
+    return trades
+
+
+def test_growth_and_running_stats_match_trades():
+    trades = make_trades(300)
+    ledger = TradeLedger(capacity=4)
+    for trade in trades:
+        ledger.append(trade)
+
+    # Kapasitas tumbuh 2x dari 4, semua baris tetap utuh
+    assert len(ledger) == 300
+    assert len(ledger.columns['pnl']) == 512
+    assert list(ledger) == trades
+    assert ledger.trade_ids() == [t.trade_id for t in trades]
+
+    # Running stats = loop atas list Trade (urutan penjumlahan sama)
+    pnls = [t.pnl for t in trades]
+    wins = [p for p in pnls if p > 0]
+    losses = [p for p in pnls if p <= 0]
+    assert ledger.wins == len(wins)
+    assert ledger.losses == len(losses)
+    assert ledger.total_pnl == sum(pnls)
+    assert ledger.gross_profit == sum(wins)
+    assert ledger.gross_loss == sum(losses)
+    assert ledger.max_win == max(wins)
+    assert ledger.max_loss == min(losses)
+    np.testing.assert_array_equal(ledger.column('pnl'), pnls)
+
+
+def test_state_round_trip_keeps_stats_and_rows():
+    trades = make_trades(50)
+    ledger = TradeLedger(capacity=4)
+    for trade in trades[:30]:
+        ledger.append(trade)
+
+    restored = TradeLedger()
+    restored.set_state(ledger.get_state())
+    for trade in trades[30:]:
+        ledger.append(trade)
+        restored.append(trade)
+
+    assert list(restored) == trades
+    for name in ('wins', 'total_pnl', 'gross_profit', 'gross_loss', 'max_win', 'max_loss'):
+        assert getattr(restored, name) == getattr(ledger, name)
+
+
+def test_empty_ledger():
+    ledger = TradeLedger()
+    assert len(ledger) == 0 and ledger.losses == 0
+    assert ledger.max_win is None and ledger.max_loss is None
+    assert list(ledger) == [] and ledger.to_frame().empty
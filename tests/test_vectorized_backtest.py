@@ -0,0 +1,68 @@
+"""Regression: run_backtest_vectorized identik dengan event loop run_backtest"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from trading_bot import BotConfig, TradingBot, create_strategy
+
+# entry_time/exit_time = waktu eksekusi (datetime.now()), tidak ikut dibandingkan
+TRADE_COLUMNS = ['trade_number', 'entry_price', 'quantity', 'stop_loss', 'take_profit',
+                 'exit_price', 'pnl', 'symbol', 'exit_reason']
+
+
+def make_bot(logger, **overrides):
+    config = BotConfig(event_log='silent', **overrides)
+    return TradingBot(config, create_strategy(config, logger), logger)
+
+
+def assert_same_run(event_bot, vector_bot, event_report, vector_report):
+    assert vector_report == event_report
+    pd.testing.assert_frame_equal(vector_bot.closed_trades.to_frame()[TRADE_COLUMNS],
+                                  event_bot.closed_trades.to_frame()[TRADE_COLUMNS])
+    np.testing.assert_array_equal(vector_bot.equity_curve.curve, event_bot.equity_curve.curve)
+    assert vector_bot.balance == event_bot.balance
+    assert vector_bot.equity == event_bot.equity
+    assert vector_bot.peak_equity == event_bot.peak_equity
+    assert sorted(vector_bot.open_trades) == sorted(event_bot.open_trades)
+    assert vector_bot.strategy.last_signal == event_bot.strategy.last_signal
+
+
+@pytest.mark.parametrize('exit_model', ['close', 'high_low'])
+@pytest.mark.parametrize('strategy', ['macrossover_rsi', 'mean_reversion'])
+def test_vectorized_matches_event_loop(ohlcv, logger, strategy, exit_model):
+    event_bot = make_bot(logger, strategy=strategy, exit_model=exit_model)
+    vector_bot = make_bot(logger, strategy=strategy, exit_model=exit_model)
+    event_report = event_bot.run_backtest(ohlcv, 200)
+    vector_report = vector_bot.run_backtest_vectorized(ohlcv, 200)
+
+    assert event_report['total_trades'] > 0
+    assert_same_run(event_bot, vector_bot, event_report, vector_report)
+
+
+@pytest.mark.parametrize('exit_model', ['close', 'high_low'])
+@pytest.mark.parametrize('strategy', ['macrossover_rsi', 'mean_reversion'])
+def test_vectorized_segments_match_event_loop(ohlcv, logger, strategy, exit_model):
+    # Backtest dilanjutkan per window, termasuk trade yang masih terbuka di batas window
+    event_bot = make_bot(logger, strategy=strategy, exit_model=exit_model)
+    vector_bot = make_bot(logger, strategy=strategy, exit_model=exit_model)
+    cuts = [200, 777, 1500, 1501, 2400, len(ohlcv)]
+    for start, end in zip(cuts, cuts[1:]):
+        event_report = event_bot.run_backtest(ohlcv, start, end)
+        vector_report = vector_bot.run_backtest_vectorized(ohlcv, start, end)
+        assert_same_run(event_bot, vector_bot, event_report, vector_report)
+
+
+def test_event_loop_exit_resolver_matches_per_bar_lookup(ohlcv, logger):
+    # process_candle per bar (tanpa ExitResolver yang di-bind run_backtest)
+    # harus memberi hasil sama dengan run_backtest
+    looped_bot = make_bot(logger, exit_model='high_low')
+    looped_bot.strategy.prepare(ohlcv)
+    close = ohlcv['close'].to_numpy()
+    for idx in range(200, len(ohlcv)):
+        looped_bot.process_candle(ohlcv, idx, close[idx])
+
+    event_bot = make_bot(logger, exit_model='high_low')
+    event_report = event_bot.run_backtest(ohlcv, 200)
+    assert event_bot._exit_resolvers == {}
+    assert_same_run(event_bot, looped_bot, event_report, looped_bot.get_overall_report())
@@ -0,0 +1,54 @@
+"""Process pool (shared memory / OHLCVStore) memberi hasil sama dengan run inline"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from adaptive_search import successive_halving
+from ohlcv_store import OHLCVStore
+from parameter_sweep import grid_configs, run_sweep
+from trading_bot import BotConfig
+from walk_forward import run_walk_forward
+from worker_pool import create_bot
+
+
+@pytest.fixture
+def configs():
+    return grid_configs(BotConfig(event_log='silent'),
+                        {'fast_ma_period': [10, 20], 'atr_multiplier_sl': [1.0, 2.0]})
+
+
+@pytest.fixture(params=['frame', 'store'])
+def source(request, ohlcv, tmp_path):
+    if request.param == 'frame':
+        return ohlcv
+    return OHLCVStore.write(str(tmp_path / 'store'), ohlcv)
+
+
+def test_sweep_pool_matches_inline(ohlcv, source, configs):
+    pd.testing.assert_frame_equal(run_sweep(source, configs, processes=2),
+                                  run_sweep(ohlcv, configs, processes=1))
+
+
+def test_walk_forward_pool_matches_inline(ohlcv, source, configs):
+    pooled = run_walk_forward(source, configs, train_bars=1000, test_bars=500, processes=2)
+    inline = run_walk_forward(ohlcv, configs, train_bars=1000, test_bars=500, processes=1)
+    pd.testing.assert_frame_equal(pooled.table, inline.table)
+    pd.testing.assert_series_equal(pooled.equity, inline.equity)
+
+
+def test_successive_halving_pool_matches_inline(ohlcv, source, configs):
+    pooled = successive_halving(source, configs, min_fraction=0.2, eta=2, processes=2)
+    inline = successive_halving(ohlcv, configs, min_fraction=0.2, eta=2, processes=1)
+    pd.testing.assert_frame_equal(pooled.table, inline.table)
+    assert pooled.stats == inline.stats
+
+
+def test_create_bot_strips_results_db_and_event_log(logger, tmp_path):
+    bot = create_bot(BotConfig(results_db=str(tmp_path / 'r.db')), logger)
+    assert bot.config.results_db == ''
+    report = bot.run_backtest_vectorized(pd.DataFrame({
+        'open': np.ones(300), 'high': np.ones(300), 'low': np.ones(300),
+        'close': np.ones(300), 'volume': np.ones(300)}))
+    assert report['total_trades'] == 0
+    assert not (tmp_path / 'r.db').exists()
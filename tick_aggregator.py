@@ -0,0 +1,206 @@
+"""
+Streaming Tick-to-Candle Aggregator
+Bangun bar OHLCV langsung dari stream trade (tick) tanpa resample pandas:
+time bar, tick-count bar dan volume bar.
+
+State bar disimpan sebagai atribut scalar dan bar yang selesai ditulis ke
+satu dict yang dipakai ulang, sehingga tidak ada alokasi container per tick.
+Consumer yang perlu menyimpan bar harus meng-copy isinya (AsyncLiveRunner
+menyalinnya ke buffer numpy).
+
+Contoh:
+    aggregator = TimeBarAggregator(interval=60_000)   # timestamp dalam ms
+    runner = AsyncLiveRunner(bot, offload=False)
+    for bar in aggregator.iter_bars(ticks):           # ticks: (ts, price, size)
+        runner.process(bar)
+"""
+
+import math
+import time
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, Dict, Iterable, Iterator, Optional, Tuple
+
+from live_runner import AsyncLiveRunner
+from trading_bot import TradingBot
+
+
+Tick = Tuple[float, float, float]
+
+
+# ============================================================================
+# 1. BASE AGGREGATOR
+# ============================================================================
+
+class BarAggregator(ABC):
+    """
+    Base aggregator: update(timestamp, price, size) return True jika sebuah
+    bar baru selesai; bar tersebut ada di self.bar sampai update berikutnya
+    yang menyelesaikan bar lain.
+    """
+
+    def __init__(self):
+        self.bar: Dict[str, float] = {
+            'timestamp': 0, 'open': math.nan, 'high': math.nan, 'low': math.nan,
+            'close': math.nan, 'volume': 0.0, 'ticks': 0, 'published_at': 0.0
+        }
+        self.bars_emitted = 0
+        self._reset()
+
+    def _reset(self) -> None:
+        self.start = 0
+        self.open = self.high = self.low = self.close = math.nan
+        self.volume = 0.0
+        self.ticks = 0
+
+    def _add(self, timestamp, price: float, size: float) -> None:
+        if self.ticks == 0:
+            self.start = timestamp
+            self.open = self.high = self.low = price
+        elif price > self.high:
+            self.high = price
+        elif price < self.low:
+            self.low = price
+        self.close = price
+        self.volume += size
+        self.ticks += 1
+
+    def _label(self):
+        return self.start
+
+    def _emit(self) -> None:
+        bar = self.bar
+        bar['timestamp'] = self._label()
+        bar['open'] = self.open
+        bar['high'] = self.high
+        bar['low'] = self.low
+        bar['close'] = self.close
+        bar['volume'] = self.volume
+        bar['ticks'] = self.ticks
+        bar['published_at'] = time.perf_counter()
+        self.bars_emitted += 1
+        self._reset()
+
+    @abstractmethod
+    def update(self, timestamp, price: float, size: float) -> bool:
+        """Tambah satu tick, return True jika bar selesai (ada di self.bar)"""
+        pass
+
+    def flush(self) -> bool:
+        """Tutup bar yang sedang berjalan (mis. saat feed berhenti)"""
+        if self.ticks == 0:
+            return False
+        self._emit()
+        return True
+
+    # ------------------------------------------------------------------
+    # Sources
+    # ------------------------------------------------------------------
+
+    def iter_bars(self, ticks: Iterable[Tick], flush: bool = False) -> Iterator[Dict]:
+        """Generator bar selesai dari iterator tick (timestamp, price, size)"""
+
+        update = self.update
+        for timestamp, price, size in ticks:
+            if update(timestamp, price, size):
+                yield self.bar
+        if flush and self.flush():
+            yield self.bar
+
+    async def stream_bars(self, ticks: AsyncIterator[Tick],
+                          flush: bool = False) -> AsyncIterator[Dict]:
+        """Async generator bar, bisa langsung dipakai AsyncLiveRunner.run()"""
+
+        update = self.update
+        async for timestamp, price, size in ticks:
+            if update(timestamp, price, size):
+                yield self.bar
+        if flush and self.flush():
+            yield self.bar
+
+
+# ============================================================================
+# 2. BAR TYPES
+# ============================================================================
+
+class TimeBarAggregator(BarAggregator):
+    """
+    Bar per interval waktu, label = awal interval (seperti resample label='left')
+
+    interval memakai satuan yang sama dengan timestamp tick (mis. ms). Bar
+    selesai saat tick pertama interval berikutnya datang; interval tanpa tick
+    tidak menghasilkan bar.
+    """
+
+    def __init__(self, interval):
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        self.interval = interval
+        self.bucket = None
+        super().__init__()
+
+    def _label(self):
+        return self.bucket * self.interval
+
+    def update(self, timestamp, price: float, size: float) -> bool:
+        bucket = timestamp // self.interval
+        completed = False
+        if bucket != self.bucket:
+            if self.ticks:
+                self._emit()
+                completed = True
+            self.bucket = bucket
+        self._add(timestamp, price, size)
+        return completed
+
+
+class TickBarAggregator(BarAggregator):
+    """Bar setiap `ticks_per_bar` trade"""
+
+    def __init__(self, ticks_per_bar: int):
+        if ticks_per_bar <= 0:
+            raise ValueError("ticks_per_bar must be positive")
+        self.ticks_per_bar = ticks_per_bar
+        super().__init__()
+
+    def update(self, timestamp, price: float, size: float) -> bool:
+        self._add(timestamp, price, size)
+        if self.ticks >= self.ticks_per_bar:
+            self._emit()
+            return True
+        return False
+
+
+class VolumeBarAggregator(BarAggregator):
+    """
+    Bar setiap akumulasi volume >= `volume_per_bar`
+
+    Tick yang melewati threshold masuk penuh ke bar sekarang (tidak di-split).
+    """
+
+    def __init__(self, volume_per_bar: float):
+        if volume_per_bar <= 0:
+            raise ValueError("volume_per_bar must be positive")
+        self.volume_per_bar = volume_per_bar
+        super().__init__()
+
+    def update(self, timestamp, price: float, size: float) -> bool:
+        self._add(timestamp, price, size)
+        if self.volume >= self.volume_per_bar:
+            self._emit()
+            return True
+        return False
+
+
+# ============================================================================
+# 3. FEED INTO TRADINGBOT
+# ============================================================================
+
+def run_ticks(bot: TradingBot, aggregator: BarAggregator, ticks: Iterable[Tick],
+              runner: Optional[AsyncLiveRunner] = None, flush: bool = False) -> AsyncLiveRunner:
+    """Agregasi tick sync dan proses setiap bar selesai lewat TradingBot"""
+
+    runner = runner or AsyncLiveRunner(bot, offload=False)
+    process = runner.process
+    for bar in aggregator.iter_bars(ticks, flush):
+        process(bar)
+    return runner
@@ -3,56 +3,39 @@ Bot Trading Implementation - Complete Example
 Strategi: Simple Moving Average Crossover + RSI Filter
 """
 
+import functools
+import heapq
+import inspect
+import itertools
 import logging
+import operator
 import os
+import queue
+import struct
+import threading
+import time
+import weakref
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+from dataclasses import dataclass, replace
 from enum import Enum
 import json
 
 import pandas as pd
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 from abc import ABC, abstractmethod
 
+from bot_config import (DEFAULT_STRATEGY, EXIT_MODELS, BotConfig, load_strategy,
+                        register_strategy, resolve_strategy_name)
+
 
 # ============================================================================
 # 1. CONFIGURATION & SETUP
 # ============================================================================
 
-@dataclass
-class BotConfig:
-    """Konfigurasi Bot Trading"""
-    # Strategy Parameters
-    fast_ma_period: int = 20
-    slow_ma_period: int = 50
-    rsi_period: int = 14
-    rsi_overbought: float = 70
-    rsi_oversold: float = 30
-    
-    # Risk Management
-    account_size: float = 10000.0
-    risk_per_trade: float = 0.02  # 2% per trade
-    max_position_size: float = 0.05  # Max 5% per position
-    max_daily_loss: float = 0.05  # Max 5% daily loss
-    max_drawdown: float = 0.20  # Max 20% drawdown
-    
-    # Trade Management
-    rr_ratio: float = 2.0  # Risk-Reward 1:2
-    atr_multiplier_sl: float = 1.5  # Stop Loss = Entry - ATR * 1.5
-    atr_multiplier_tp: float = 2.0  # Take Profit = Entry + ATR * 2.0
-    atr_period: int = 14
-    
-    # Execution
-    order_type: str = "market"  # "market" or "limit"
-    max_slippage: float = 0.01  # 1% max slippage
-    
-    # Monitoring
-    log_level: str = "INFO"
-    save_trades: bool = True
-    # strategy selector: 'macrossover_rsi' or 'mean_reversion'
-    strategy: str = "macrossover_rsi"
-
+# BotConfig dan registry strategi: lihat bot_config.py (di-re-export di sini)
 
 class OrderType(Enum):
     """Tipe Order"""
@@ -136,76 +119,1497 @@ class Trade:
         return reward / risk
 
 
+# Timestamp ledger disimpan sebagai microseconds sejak epoch (NaT = int64 min)
+EPOCH = datetime(1970, 1, 1)
+NAT_US = np.iinfo(np.int64).min
+
+
+class TradeLedger:
+    """
+    Ledger columnar untuk closed trades
+    
+    Kolom disimpan di numpy array yang tumbuh 2x saat penuh; statistik
+    (wins, gross profit/loss, max win/loss) di-update O(1) per trade dengan
+    urutan penjumlahan yang sama seperti loop atas list Trade. Object Trade
+    hanya dibuat saat diakses (index, slice atau iterasi).
+    """
+    
+    FLOAT_COLUMNS = ('entry_price', 'quantity', 'stop_loss', 'take_profit',
+                     'exit_price', 'pnl')
+    INT_COLUMNS = ('trade_number', 'entry_time', 'exit_time', 'symbol_code', 'reason_code')
+    
+    def __init__(self, capacity: int = 1024):
+        self.columns: Dict[str, np.ndarray] = {}
+        for name in self.FLOAT_COLUMNS:
+            self.columns[name] = np.empty(capacity, dtype=np.float64)
+        for name in self.INT_COLUMNS:
+            self.columns[name] = np.empty(capacity, dtype=np.int64)
+        self.length = 0
+        
+        # Kategori (symbol, exit reason) disimpan sebagai kode integer
+        self.symbols: List[str] = []
+        self.reasons: List[str] = []
+        self._symbol_codes: Dict[str, int] = {}
+        self._reason_codes: Dict[str, int] = {}
+        self._custom_ids: Dict[int, str] = {}  # trade_id yang bukan format TRADE_<n>
+        
+        # Running statistics
+        self.wins = 0
+        self.total_pnl = 0.0
+        self.gross_profit = 0.0
+        self.gross_loss = 0.0  # jumlah P&L trade non-win (<= 0)
+        self.max_win: Optional[float] = None
+        self.max_loss: Optional[float] = None
+    
+    def append(self, trade: Trade) -> None:
+        """Simpan closed trade sebagai satu baris kolom"""
+        
+        if self.length == len(self.columns['pnl']):
+            self._grow()
+        
+        i = self.length
+        cols = self.columns
+        pnl = trade.pnl
+        
+        cols['entry_price'][i] = trade.entry_price
+        cols['quantity'][i] = trade.quantity
+        cols['stop_loss'][i] = trade.stop_loss
+        cols['take_profit'][i] = trade.take_profit
+        cols['exit_price'][i] = trade.exit_price
+        cols['pnl'][i] = pnl
+        cols['entry_time'][i] = self._to_us(trade.entry_time)
+        cols['exit_time'][i] = self._to_us(trade.exit_time)
+        cols['symbol_code'][i] = self._code(trade.symbol, self.symbols, self._symbol_codes)
+        cols['reason_code'][i] = self._code(trade.exit_reason, self.reasons, self._reason_codes)
+        
+        prefix, _, number = trade.trade_id.rpartition('_')
+        if prefix == 'TRADE' and number.isdigit() and str(int(number)) == number:
+            cols['trade_number'][i] = int(number)
+        else:
+            cols['trade_number'][i] = -1
+            self._custom_ids[i] = trade.trade_id
+        
+        self.length += 1
+        self.total_pnl += pnl
+        if pnl > 0:
+            self.wins += 1
+            self.gross_profit += pnl
+            self.max_win = pnl if self.max_win is None else max(self.max_win, pnl)
+        else:
+            self.gross_loss += pnl
+            self.max_loss = pnl if self.max_loss is None else min(self.max_loss, pnl)
+    
+    @property
+    def losses(self) -> int:
+        return self.length - self.wins
+    
+    def column(self, name: str) -> np.ndarray:
+        """View (tanpa copy) dari satu kolom untuk baris yang terisi"""
+        return self.columns[name][:self.length]
+    
+    def trade_ids(self) -> List[str]:
+        """trade_id semua baris tanpa membuat object Trade"""
+        custom = self._custom_ids
+        return [custom[i] if number < 0 else f"TRADE_{number}"
+                for i, number in enumerate(self.column('trade_number').tolist())]
+    
+    def to_frame(self) -> pd.DataFrame:
+        """Export ke DataFrame; kolom numeric adalah view tanpa copy"""
+        
+        frame = {name: self.column(name) for name in self.FLOAT_COLUMNS}
+        frame['trade_number'] = self.column('trade_number')
+        frame['entry_time'] = self.column('entry_time').view('datetime64[us]')
+        frame['exit_time'] = self.column('exit_time').view('datetime64[us]')
+        frame['symbol'] = pd.Categorical.from_codes(self.column('symbol_code'), self.symbols)
+        frame['exit_reason'] = pd.Categorical.from_codes(self.column('reason_code'), self.reasons)
+        return pd.DataFrame(frame, copy=False)
+    
+    def get(self, i: int) -> Trade:
+        """Buat object Trade untuk baris i"""
+        
+        cols = self.columns
+        trade_number = cols['trade_number'][i]
+        trade_id = self._custom_ids[i] if trade_number < 0 else f"TRADE_{trade_number}"
+        return Trade(
+            trade_id=trade_id,
+            symbol=self.symbols[cols['symbol_code'][i]],
+            entry_price=cols['entry_price'][i],
+            entry_time=self._from_us(cols['entry_time'][i]),
+            quantity=cols['quantity'][i],
+            stop_loss=cols['stop_loss'][i],
+            take_profit=cols['take_profit'][i],
+            exit_price=cols['exit_price'][i],
+            exit_time=self._from_us(cols['exit_time'][i]),
+            exit_reason=self.reasons[cols['reason_code'][i]]
+        )
+    
+    def __len__(self) -> int:
+        return self.length
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.get(i) for i in range(*index.indices(self.length))]
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("TradeLedger index out of range")
+        return self.get(index)
+    
+    def __iter__(self):
+        for i in range(self.length):
+            yield self.get(i)
+    
+    def get_state(self) -> Dict:
+        """
+        State untuk checkpoint
+        
+        Kolom berupa view tanpa copy: baris yang sudah terisi tidak pernah
+        diubah dan _grow membuat array baru, jadi view tetap konsisten
+        walaupun ledger terus bertambah setelah snapshot.
+        """
+        return {
+            'columns': {name: self.column(name) for name in self.columns},
+            'symbols': list(self.symbols),
+            'reasons': list(self.reasons),
+            'custom_ids': dict(self._custom_ids),
+            'wins': self.wins,
+            'total_pnl': self.total_pnl,
+            'gross_profit': self.gross_profit,
+            'gross_loss': self.gross_loss,
+            'max_win': self.max_win,
+            'max_loss': self.max_loss,
+        }
+    
+    def set_state(self, state: Dict) -> None:
+        """Restore dari get_state()"""
+        
+        length = len(state['columns']['pnl'])
+        capacity = max(1024, 2 * length)
+        for name, values in state['columns'].items():
+            column = np.empty(capacity, dtype=self.columns[name].dtype)
+            column[:length] = values
+            self.columns[name] = column
+        self.length = length
+        
+        self.symbols = list(state['symbols'])
+        self.reasons = list(state['reasons'])
+        self._symbol_codes = {value: code for code, value in enumerate(self.symbols)}
+        self._reason_codes = {value: code for code, value in enumerate(self.reasons)}
+        self._custom_ids = {int(i): trade_id for i, trade_id in state['custom_ids'].items()}
+        
+        for name in ('wins', 'total_pnl', 'gross_profit', 'gross_loss', 'max_win', 'max_loss'):
+            setattr(self, name, state[name])
+    
+    def _grow(self) -> None:
+        for name, values in self.columns.items():
+            grown = np.empty(max(2 * len(values), 1), dtype=values.dtype)
+            grown[:self.length] = values[:self.length]
+            self.columns[name] = grown
+    
+    @staticmethod
+    def _code(value: Optional[str], categories: List[str], codes: Dict[str, int]) -> int:
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(categories)
+            categories.append(value)
+        return code
+    
+    @staticmethod
+    def _to_us(value: Optional[datetime]) -> int:
+        if value is None:
+            return NAT_US
+        return (value - EPOCH) // timedelta(microseconds=1)
+    
+    @staticmethod
+    def _from_us(value: int) -> Optional[datetime]:
+        if value == NAT_US:
+            return None
+        return EPOCH + timedelta(microseconds=int(value))
+
+
+# ----------------------------------------------------------------------------
+# Structured event log: record kecil ke queue, format/tulis di writer thread
+# ----------------------------------------------------------------------------
+
+# Field per jenis event (urutan = urutan argumen EventLog.emit)
+EVENT_SCHEMAS: Dict[str, Tuple[str, ...]] = {
+    'order_created': ('order_id', 'side', 'symbol', 'quantity', 'price'),
+    'order_filled': ('order_id', 'quantity', 'price'),
+    'trade_opened': ('trade_id', 'symbol', 'entry_price', 'stop_loss', 'take_profit',
+                     'quantity', 'reason'),
+    'trade_closed': ('trade_id', 'symbol', 'entry_price', 'exit_price', 'exit_reason',
+                     'stop_loss', 'quantity', 'balance'),
+}
+EVENT_KINDS = list(EVENT_SCHEMAS)
+EVENT_CODES = {kind: code for code, kind in enumerate(EVENT_KINDS)}
+
+# Record: (kind, timestamp ns sejak epoch, tuple values)
+EventRecord = Tuple[str, int, Tuple]
+
+
+def event_to_dict(record: EventRecord) -> Dict:
+    """Record -> dict {'event', 'ts', field...}"""
+    kind, ts, values = record
+    event = {'event': kind, 'ts': ts}
+    event.update(zip(EVENT_SCHEMAS[kind], values))
+    return event
+
+
+def format_event(record: EventRecord) -> str:
+    """Pesan log human-readable untuk record (format lama logger.info)"""
+    
+    kind, _, values = record
+    if kind == 'order_created':
+        order_id, side, _, quantity, price = values
+        return f"Created {side} order: {order_id} | {quantity} @ {price}"
+    if kind == 'order_filled':
+        order_id, quantity, price = values
+        return f"Filled order {order_id}: {quantity} @ {price}"
+    if kind == 'trade_opened':
+        trade_id, _, entry, stop_loss, take_profit, quantity, reason = values
+        return (f"BUY Trade Opened: {trade_id}\n"
+                f"  Entry: {entry:.2f}\n"
+                f"  SL: {stop_loss:.2f}\n"
+                f"  TP: {take_profit:.2f}\n"
+                f"  Size: {quantity:.4f}\n"
+                f"  Signal: {reason}")
+    if kind == 'trade_closed':
+        trade_id, _, entry, exit_price, exit_reason, stop_loss, quantity, balance = values
+        pnl = (exit_price - entry) * quantity
+        pnl_percent = (exit_price - entry) / entry * 100
+        risk = entry - stop_loss
+        rr = abs(exit_price - entry) / risk if risk != 0 else 0.0
+        return (f"Trade Closed: {trade_id}\n"
+                f"  Entry: {entry:.2f}\n"
+                f"  Exit: {exit_price:.2f} ({exit_reason})\n"
+                f"  P&L: {pnl:.2f} ({pnl_percent:.2f}%)\n"
+                f"  RR Ratio: {rr:.2f}\n"
+                f"  Balance: {balance:.2f}")
+    return json.dumps(event_to_dict(record), default=str)
+
+
+class LoggingSink:
+    """Sink ke logging.Logger (INFO); format hanya jika level INFO aktif"""
+    
+    def __init__(self, logger: logging.Logger):
+        self.logger = logger
+    
+    def write(self, record: EventRecord) -> None:
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(format_event(record))
+    
+    def flush(self) -> None:
+        pass
+    
+    def close(self) -> None:
+        pass
+
+
+class JSONLSink:
+    """Satu objek JSON per baris"""
+    
+    def __init__(self, path: str):
+        self.file = open(path, 'a', encoding='utf-8')
+    
+    def write(self, record: EventRecord) -> None:
+        self.file.write(json.dumps(event_to_dict(record), default=str))
+        self.file.write('\n')
+    
+    def flush(self) -> None:
+        self.file.flush()
+    
+    def close(self) -> None:
+        self.file.close()
+
+
+class BinarySink:
+    """
+    Record biner length-prefixed
+    
+    File diawali MAGIC, lalu per record: header '<BqI' (kode event,
+    timestamp ns, panjang payload) dan payload berisi value bertag:
+    b'd' + float64, b'q' + int64, b's' + uint32 panjang + utf-8, b'n' = None.
+    File versi lama (LEGACY_MAGIC, panjang string uint16) tetap bisa dibaca.
+    """
+    
+    MAGIC = b'AHAEVT2\n'
+    LEGACY_MAGIC = b'AHAEVT1\n'
+    HEADER = struct.Struct('<BqI')
+    
+    def __init__(self, path: str):
+        self.file = open(path, 'a+b')
+        if self.file.tell() == 0:
+            self.file.write(self.MAGIC)
+        else:
+            self.file.seek(0)
+            magic = self.file.read(len(self.MAGIC))
+            self.file.seek(0, os.SEEK_END)
+            if magic != self.MAGIC:
+                self.file.close()
+                raise ValueError(f"Cannot append to {path}: not a {self.MAGIC!r} event log")
+    
+    @staticmethod
+    def _encode(values: Tuple) -> bytes:
+        parts = []
+        for value in values:
+            if value is None:
+                parts.append(b'n')
+            elif isinstance(value, (bool, int, np.integer)):
+                parts.append(b'q' + struct.pack('<q', int(value)))
+            elif isinstance(value, (float, np.floating)):
+                parts.append(b'd' + struct.pack('<d', float(value)))
+            else:
+                raw = str(value).encode('utf-8')
+                parts.append(b's' + struct.pack('<I', len(raw)) + raw)
+        return b''.join(parts)
+    
+    def write(self, record: EventRecord) -> None:
+        kind, ts, values = record
+        payload = self._encode(values)
+        self.file.write(self.HEADER.pack(EVENT_CODES[kind], ts, len(payload)))
+        self.file.write(payload)
+    
+    def flush(self) -> None:
+        self.file.flush()
+    
+    def close(self) -> None:
+        self.file.close()
+    
+    @classmethod
+    def read(cls, path: str) -> List[EventRecord]:
+        """Baca semua record dari file biner"""
+        
+        with open(path, 'rb') as f:
+            raw = f.read()
+        if raw.startswith(cls.MAGIC):
+            size_format = struct.Struct('<I')
+        elif raw.startswith(cls.LEGACY_MAGIC):
+            size_format = struct.Struct('<H')
+        else:
+            raise ValueError(f"Not an event log file: {path}")
+        
+        records = []
+        pos = len(cls.MAGIC)
+        while pos < len(raw):
+            code, ts, length = cls.HEADER.unpack_from(raw, pos)
+            pos += cls.HEADER.size
+            end = pos + length
+            values = []
+            while pos < end:
+                tag = raw[pos:pos + 1]
+                pos += 1
+                if tag == b'n':
+                    values.append(None)
+                elif tag == b'q':
+                    values.append(struct.unpack_from('<q', raw, pos)[0])
+                    pos += 8
+                elif tag == b'd':
+                    values.append(struct.unpack_from('<d', raw, pos)[0])
+                    pos += 8
+                else:
+                    (size,) = size_format.unpack_from(raw, pos)
+                    pos += size_format.size
+                    values.append(raw[pos:pos + size].decode('utf-8'))
+                    pos += size
+            records.append((EVENT_KINDS[code], ts, tuple(values)))
+        return records
+
+
+class EventLog:
+    """
+    Event log untuk order dan trade
+    
+    emit() hanya membuat tuple kecil dan push ke SimpleQueue; writer thread
+    (daemon) yang memanggil sink.write (format JSON/biner/teks). Dengan
+    background=False sink dipanggil langsung. EventLog.silent() membuang
+    semua event tanpa format apa pun (untuk sweep).
+    
+    Writer thread tidak memegang referensi ke EventLog: saat EventLog
+    di-garbage-collect (atau interpreter exit) thread diberi STOP dan
+    di-join, sehingga event yang sudah di-emit tetap tertulis.
+    """
+    
+    _STOP = object()
+    
+    def __init__(self, sink=None, background: bool = True):
+        self.sink = sink
+        self.background = background and sink is not None
+        self.emitted = 0
+        self._queue: 'queue.SimpleQueue' = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._stop_writer: Optional[weakref.finalize] = None
+        
+        if sink is None:
+            self.emit = self._discard
+        elif self.background:
+            self._thread = threading.Thread(target=_drain_events, args=(self._queue, sink),
+                                            name='event-log', daemon=True)
+            self._thread.start()
+            self._stop_writer = weakref.finalize(self, _stop_events, self._queue, self._thread)
+    
+    @classmethod
+    def silent(cls) -> 'EventLog':
+        return cls(None)
+    
+    def emit(self, kind: str, *values) -> None:
+        """Catat satu event; values sesuai EVENT_SCHEMAS[kind]"""
+        record = (kind, time.time_ns(), values)
+        self.emitted += 1
+        if self.background:
+            self._queue.put(record)
+        else:
+            self.sink.write(record)
+    
+    def _discard(self, kind: str, *values) -> None:
+        pass
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Tunggu semua event yang sudah di-emit selesai ditulis"""
+        
+        if self.sink is None:
+            return True
+        if not self.background:
+            self.sink.flush()
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+    
+    def close(self) -> None:
+        """Flush, hentikan writer thread dan tutup sink"""
+        
+        if self.sink is None:
+            return
+        if self._stop_writer is not None:
+            self._stop_writer()
+            self._stop_writer = None
+            self._thread = None
+            self.background = False
+        self.sink.flush()
+        self.sink.close()
+        self.sink = None
+        self.emit = self._discard
+
+
+def _drain_events(events: 'queue.SimpleQueue', sink) -> None:
+    """Loop writer thread EventLog: tulis record sampai STOP"""
+    get = events.get
+    write = sink.write
+    while True:
+        record = get()
+        if record is EventLog._STOP:
+            sink.flush()
+            break
+        if isinstance(record, threading.Event):
+            sink.flush()
+            record.set()
+            continue
+        try:
+            write(record)
+        except Exception:
+            logging.getLogger(__name__).exception("Event log sink failed")
+
+
+def _stop_events(events: 'queue.SimpleQueue', thread: threading.Thread) -> None:
+    events.put(EventLog._STOP)
+    thread.join()
+
+
+def create_event_log(spec: str, logger: logging.Logger) -> EventLog:
+    """
+    Buat EventLog dari spec BotConfig.event_log:
+    'logging' (default, ke logger dari writer thread), 'silent', 'jsonl:<path>',
+    'binary:<path>'
+    """
+    
+    kind, _, path = spec.partition(':')
+    kind = kind.lower()
+    if kind == 'logging':
+        return EventLog(LoggingSink(logger))
+    if kind == 'silent':
+        return EventLog.silent()
+    if kind == 'jsonl' and path:
+        return EventLog(JSONLSink(path))
+    if kind == 'binary' and path:
+        return EventLog(BinarySink(path))
+    raise ValueError(f"Unknown event log spec: {spec!r}. "
+                     f"Use 'logging', 'silent', 'jsonl:<path>' or 'binary:<path>'")
+
+
 # ============================================================================
 # 2. TECHNICAL INDICATORS
 # ============================================================================
 
+class IndicatorCache:
+    """
+    LRU cache untuk hasil indikator
+    
+    Key: nama indikator + parameter + identitas dataset (alamat buffer numpy,
+    shape, strides, dtype dan index Series input). Entry otomatis dibuang saat
+    array pemilik data di-garbage-collect, sehingga alamat yang dipakai ulang
+    tidak pernah menghasilkan hit palsu. Data input dianggap immutable, dan
+    hasil yang dikembalikan di-share antar caller (jangan di-modify in place).
+    """
+    
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.enabled = True
+        self.entries: OrderedDict = OrderedDict()  # key -> (value, nbytes, refs)
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.RLock()
+    
+    def get_or_compute(self, name: str, params: Tuple, inputs: Tuple[pd.Series, ...],
+                       compute: Callable[[], Any]) -> Any:
+        """Return hasil ter-cache, atau hitung dan simpan jika belum ada"""
+        
+        if not self.enabled:
+            return compute()
+        
+        key_parts = []
+        owners = []
+        for series in inputs:
+            values = series.to_numpy()
+            owner = values
+            while isinstance(owner.base, np.ndarray):
+                owner = owner.base
+            owners.append(owner)
+            owners.append(series.index)
+            key_parts.append((values.__array_interface__['data'][0], values.shape,
+                              values.strides, values.dtype.str, id(series.index)))
+        key = (name, params, tuple(key_parts))
+        
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+        
+        value = compute()
+        nbytes = self._nbytes(value)
+        if nbytes > self.max_bytes:
+            return value
+        
+        try:
+            refs = tuple(weakref.ref(owner, lambda _, key=key: self._discard(key))
+                         for owner in owners)
+        except TypeError:
+            return value  # data tidak bisa di-weakref, jangan di-cache
+        
+        with self._lock:
+            if key not in self.entries:
+                self.entries[key] = (value, nbytes, refs)
+                self.current_bytes += nbytes
+                self._evict()
+        return value
+    
+    def resize(self, max_bytes: int) -> None:
+        """Ubah memory cap, evict entry lama jika perlu"""
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict()
+    
+    def clear(self) -> None:
+        """Hapus semua entry (counter tidak di-reset)"""
+        with self._lock:
+            self.entries.clear()
+            self.current_bytes = 0
+    
+    def stats(self) -> Dict:
+        """Statistik cache: hits, misses, hit_rate, evictions, memory"""
+        total = self.hits + self.misses
+        return {
+            'entries': len(self.entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+            'evictions': self.evictions,
+            'current_bytes': self.current_bytes,
+            'max_bytes': self.max_bytes
+        }
+    
+    def _evict(self) -> None:
+        while self.current_bytes > self.max_bytes and self.entries:
+            _, (_, nbytes, _) = self.entries.popitem(last=False)
+            self.current_bytes -= nbytes
+            self.evictions += 1
+    
+    def _discard(self, key: Tuple) -> None:
+        with self._lock:
+            entry = self.entries.pop(key, None)
+            if entry is not None:
+                self.current_bytes -= entry[1]
+    
+    @staticmethod
+    def _nbytes(value: Any) -> int:
+        if isinstance(value, tuple):
+            return sum(IndicatorCache._nbytes(v) for v in value)
+        if isinstance(value, pd.Series):
+            return value.memory_usage(index=False)
+        return getattr(value, 'nbytes', 0)
+
+
+# Cache global yang dipakai TechnicalIndicators (dan semua strategi)
+INDICATOR_CACHE = IndicatorCache()
+
+
+def cached_indicator(func: Callable) -> Callable:
+    """Decorator: hasil indikator lewat INDICATOR_CACHE, argumen Series = dataset"""
+    
+    signature = inspect.signature(func)
+    
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        inputs = tuple(v for v in bound.arguments.values() if isinstance(v, pd.Series))
+        params = tuple(v for v in bound.arguments.values() if not isinstance(v, pd.Series))
+        try:
+            hash(params)
+        except TypeError:
+            return func(*args, **kwargs)
+        return INDICATOR_CACHE.get_or_compute(func.__name__, params, inputs,
+                                              lambda: func(*args, **kwargs))
+    
+    return wrapper
+
+
+# ----------------------------------------------------------------------------
+# Indicator kernels: numpy array in, numpy array out (tanpa Series/index)
+# ----------------------------------------------------------------------------
+
+# Routine rolling/ewm compiled yang dipakai pandas sendiri (pandas._libs,
+# API privat) memberi hasil identik dengan Series.rolling/ewm tanpa overhead
+# Series. Signature-nya berubah antar versi, jadi hanya dipakai untuk versi
+# pandas yang sudah dites dan setelah probe cocok dengan API publik; selain
+# itu kernel memakai Series.rolling/ewm.
+WINDOW_AGGS_PANDAS_VERSIONS = ((2, 0), (3, 0))  # [min, max) major.minor
+
+
+def _as_float64(values) -> np.ndarray:
+    return np.ascontiguousarray(values, dtype=np.float64)
+
+
+def _window_bounds(n: int, period: int) -> Tuple[np.ndarray, np.ndarray]:
+    end = np.arange(1, n + 1, dtype=np.int64)
+    start = np.clip(end - period, 0, n)
+    return start, end
+
+
+def _load_window_aggs():
+    """Modul aggregations pandas jika versi didukung dan probe lolos, selain itu None"""
+    
+    try:
+        from pandas._libs.window import aggregations
+    except ImportError:  # pragma: no cover - layout internal pandas berubah
+        return None
+    
+    version = tuple(int(part) for part in pd.__version__.split('.')[:2] if part.isdigit())
+    low, high = WINDOW_AGGS_PANDAS_VERSIONS
+    if len(version) < 2 or not low <= version < high:
+        return None
+    
+    probe = np.array([3.0, 1.0, 4.0, np.nan, 5.0, 9.0, 2.0, 6.0, 5.0, 3.0])
+    series = pd.Series(probe)
+    start, end = _window_bounds(len(probe), 3)
+    whole = (np.zeros(1, dtype=np.int64), np.full(1, len(probe), dtype=np.int64))
+    try:
+        checks = (
+            (aggregations.roll_mean(probe, start, end, 3), series.rolling(3).mean()),
+            (aggregations.roll_var(probe, start, end, 3, 1), series.rolling(3).var()),
+            (aggregations.ewm(probe, *whole, 1, 1.0, False, False, None, True),
+             series.ewm(span=3, adjust=False).mean()),
+        )
+    except (TypeError, ValueError, AttributeError):
+        return None
+    if all(np.array_equal(private, public.to_numpy(), equal_nan=True)
+           for private, public in checks):
+        return aggregations
+    return None
+
+
+_window_aggs = _load_window_aggs()
+
+
+def _rolling_mean(values: np.ndarray, period: int, bounds=None) -> np.ndarray:
+    if _window_aggs is None:
+        return pd.Series(values).rolling(window=period).mean().to_numpy()
+    start, end = bounds or _window_bounds(len(values), period)
+    return _window_aggs.roll_mean(values, start, end, period)
+
+
+def _rolling_std(values: np.ndarray, period: int, bounds=None) -> np.ndarray:
+    if _window_aggs is None:
+        return pd.Series(values).rolling(window=period).std().to_numpy()
+    start, end = bounds or _window_bounds(len(values), period)
+    var = _window_aggs.roll_var(values, start, end, period, 1)
+    std = np.sqrt(var, out=var)
+    std[var < 0] = 0  # sama dengan zsqrt pandas
+    return std
+
+
+def _ewm_mean(values: np.ndarray, span: int) -> np.ndarray:
+    if _window_aggs is None:
+        return pd.Series(values).ewm(span=span, adjust=False).mean().to_numpy()
+    n = len(values)
+    start = np.zeros(1 if n else 0, dtype=np.int64)
+    end = np.full(1 if n else 0, n, dtype=np.int64)
+    return _window_aggs.ewm(values, start, end, 1, (span - 1) / 2, False, False, None, True)
+
+
+def _output(result: np.ndarray, out: Optional[np.ndarray], dtype) -> np.ndarray:
+    """Tulis hasil float64 ke out (atau array baru dengan dtype)"""
+    if out is None:
+        return result if np.dtype(dtype) == result.dtype else result.astype(dtype)
+    if out.shape != result.shape:
+        raise ValueError(f"out has shape {out.shape}, expected {result.shape}")
+    out[...] = result
+    return out
+
+
+class IndicatorKernels:
+    """
+    Kernel indikator atas numpy array contiguous
+    
+    Perhitungan selalu float64 (hasil identik dengan TechnicalIndicators);
+    dtype=np.float32 atau `out` float32 hanya mengecilkan array hasil.
+    `out` (atau tuple out untuk indikator multi-output) dipakai ulang
+    sebagai buffer hasil.
+    """
+    
+    @staticmethod
+    def sma(values: np.ndarray, period: int, out: Optional[np.ndarray] = None,
+            dtype=np.float64) -> np.ndarray:
+        return _output(_rolling_mean(_as_float64(values), period), out, dtype)
+    
+    @staticmethod
+    def ema(values: np.ndarray, period: int, out: Optional[np.ndarray] = None,
+            dtype=np.float64) -> np.ndarray:
+        return _output(_ewm_mean(_as_float64(values), period), out, dtype)
+    
+    @staticmethod
+    def rsi(values: np.ndarray, period: int = 14, out: Optional[np.ndarray] = None,
+            dtype=np.float64) -> np.ndarray:
+        values = _as_float64(values)
+        delta = np.empty_like(values)
+        delta[:1] = 0.0  # diff() NaN di bar pertama, diganti 0 oleh where()
+        np.subtract(values[1:], values[:-1], out=delta[1:])
+        
+        # fmax(x, 0): bagian positif, NaN -> 0 (sama dengan where(delta > 0, 0))
+        bounds = _window_bounds(len(values), period)
+        move = np.fmax(delta, 0.0)
+        gain = _rolling_mean(move, period, bounds)
+        np.negative(delta, out=delta)
+        loss = _rolling_mean(np.fmax(delta, 0.0, out=move), period, bounds)
+        del delta, move, bounds
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rs = np.divide(gain, loss, out=gain)
+            rs += 1
+            np.divide(100, rs, out=rs)
+            rsi = np.subtract(100, rs, out=rs)
+        return _output(rsi, out, dtype)
+    
+    @staticmethod
+    def atr(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = 14,
+            out: Optional[np.ndarray] = None, dtype=np.float64) -> np.ndarray:
+        high, low, close = _as_float64(high), _as_float64(low), _as_float64(close)
+        tr = np.subtract(high, low)
+        gap = np.empty_like(tr)
+        # fmax mengabaikan NaN bar pertama (sama dengan max(axis=1) skipna)
+        gap[:1] = np.nan
+        np.subtract(high[1:], close[:-1], out=gap[1:])
+        np.fmax(tr, np.abs(gap, out=gap), out=tr)
+        np.subtract(low[1:], close[:-1], out=gap[1:])
+        np.fmax(tr, np.abs(gap, out=gap), out=tr)
+        return _output(_rolling_mean(tr, period), out, dtype)
+    
+    @staticmethod
+    def bollinger_bands(values: np.ndarray, period: int = 20, std_dev: float = 2,
+                        out: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None,
+                        dtype=np.float64) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        values = _as_float64(values)
+        bounds = _window_bounds(len(values), period)
+        sma = _rolling_mean(values, period, bounds)
+        width = _rolling_std(values, period, bounds)
+        width *= std_dev
+        upper = sma + width
+        lower = np.subtract(sma, width, out=width)
+        out = out or (None, None, None)
+        return (_output(upper, out[0], dtype), _output(sma, out[1], dtype),
+                _output(lower, out[2], dtype))
+    
+    @staticmethod
+    def macd(values: np.ndarray, fast: int = 12, slow: int = 26, signal: int = 9,
+             out: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None,
+             dtype=np.float64) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        values = _as_float64(values)
+        macd_line = _ewm_mean(values, fast)
+        macd_line -= _ewm_mean(values, slow)
+        signal_line = _ewm_mean(macd_line, signal)
+        histogram = macd_line - signal_line
+        out = out or (None, None, None)
+        return (_output(macd_line, out[0], dtype), _output(signal_line, out[1], dtype),
+                _output(histogram, out[2], dtype))
+    
+    @staticmethod
+    def trailing_mean(values: np.ndarray, window: int, out: Optional[np.ndarray] = None,
+                      dtype=np.float64) -> np.ndarray:
+        """
+        Mean dari `window` bar terakhir (termasuk bar sekarang), NaN diabaikan.
+        
+        Sama dengan values[max(0, i-window+1):i+1].mean() untuk setiap i,
+        termasuk bar awal yang window-nya belum penuh (di-pad nol; bisa
+        berbeda di digit float terakhir karena urutan penjumlahan).
+        """
+        values = _as_float64(values)
+        if len(values) == 0:
+            return _output(values, out, dtype)
+        isnan = np.isnan(values)
+        pad = np.zeros(window - 1)
+        filled = np.concatenate((pad, np.where(isnan, 0.0, values)))
+        valid = np.concatenate((pad, ~isnan))
+        
+        sums = sliding_window_view(filled, window).sum(axis=1)
+        counts = sliding_window_view(valid, window).sum(axis=1)
+        
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means = np.where(counts > 0, sums / counts, np.nan)
+        return _output(means, out, dtype)
+
+
 class TechnicalIndicators:
-    """Calculate Technical Indicators"""
+    """
+    Calculate Technical Indicators (hasil di-cache lewat INDICATOR_CACHE)
+    
+    Wrapper pandas di atas IndicatorKernels: hasil berupa Series dengan
+    index dan name yang sama dengan input.
+    """
     
     @staticmethod
+    @cached_indicator
     def calculate_sma(data: pd.Series, period: int) -> pd.Series:
         """Simple Moving Average"""
-        return data.rolling(window=period).mean()
+        return _series(IndicatorKernels.sma(data.to_numpy(), period), data)
     
     @staticmethod
+    @cached_indicator
     def calculate_ema(data: pd.Series, period: int) -> pd.Series:
         """Exponential Moving Average"""
-        return data.ewm(span=period, adjust=False).mean()
+        return _series(IndicatorKernels.ema(data.to_numpy(), period), data)
     
     @staticmethod
+    @cached_indicator
     def calculate_rsi(data: pd.Series, period: int = 14) -> pd.Series:
         """Relative Strength Index"""
-        delta = data.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-        rs = gain / loss
-        rsi = 100 - (100 / (1 + rs))
-        return rsi
+        return _series(IndicatorKernels.rsi(data.to_numpy(), period), data)
     
     @staticmethod
+    @cached_indicator
     def calculate_atr(high: pd.Series, low: pd.Series, close: pd.Series, 
                      period: int = 14) -> pd.Series:
         """Average True Range"""
-        tr1 = high - low
-        tr2 = abs(high - close.shift())
-        tr3 = abs(low - close.shift())
-        tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-        atr = tr.rolling(window=period).mean()
-        return atr
+        atr = IndicatorKernels.atr(high.to_numpy(), low.to_numpy(), close.to_numpy(), period)
+        return pd.Series(atr, index=high.index)
     
     @staticmethod
+    @cached_indicator
     def calculate_bollinger_bands(data: pd.Series, period: int = 20, 
                                  std_dev: float = 2) -> Tuple[pd.Series, pd.Series, pd.Series]:
         """Bollinger Bands"""
-        sma = data.rolling(window=period).mean()
-        std = data.rolling(window=period).std()
-        upper_band = sma + (std * std_dev)
-        lower_band = sma - (std * std_dev)
-        return upper_band, sma, lower_band
+        bands = IndicatorKernels.bollinger_bands(data.to_numpy(), period, std_dev)
+        return tuple(_series(band, data) for band in bands)
     
     @staticmethod
+    @cached_indicator
     def calculate_macd(data: pd.Series, fast: int = 12, slow: int = 26, 
                       signal: int = 9) -> Tuple[pd.Series, pd.Series, pd.Series]:
         """MACD Indicator"""
-        ema_fast = data.ewm(span=fast, adjust=False).mean()
-        ema_slow = data.ewm(span=slow, adjust=False).mean()
-        macd_line = ema_fast - ema_slow
-        signal_line = macd_line.ewm(span=signal, adjust=False).mean()
-        histogram = macd_line - signal_line
-        return macd_line, signal_line, histogram
+        lines = IndicatorKernels.macd(data.to_numpy(), fast, slow, signal)
+        return tuple(_series(line, data) for line in lines)
+    
+    @staticmethod
+    @cached_indicator
+    def calculate_trailing_mean(data: pd.Series, window: int) -> pd.Series:
+        """
+        Mean dari `window` bar terakhir (termasuk bar sekarang).
+        
+        Sama dengan data.iloc[max(0, i-window+1):i+1].mean() untuk setiap i,
+        termasuk bar awal yang window-nya belum penuh (bisa berbeda di digit
+        float terakhir, lihat IndicatorKernels.trailing_mean).
+        """
+        return pd.Series(IndicatorKernels.trailing_mean(data.to_numpy(), window),
+                         index=data.index)
+
+
+def _series(values: np.ndarray, like: pd.Series) -> pd.Series:
+    return pd.Series(values, index=like.index, name=like.name)
+
+
+# ----------------------------------------------------------------------------
+# Streaming indicators: update O(1) per bar untuk live trading
+# ----------------------------------------------------------------------------
+
+class RingBuffer:
+    """Fixed-size ring buffer untuk window indikator"""
+    
+    __slots__ = ('size', 'values', 'pos', 'count')
+    
+    def __init__(self, size: int):
+        self.size = size
+        self.values = [0.0] * size
+        self.pos = 0
+        self.count = 0
+    
+    def push(self, value: float) -> Optional[float]:
+        """Tambah value, return value lama yang keluar dari window (jika penuh)"""
+        evicted = self.values[self.pos] if self.count == self.size else None
+        self.values[self.pos] = value
+        self.pos = (self.pos + 1) % self.size
+        if self.count < self.size:
+            self.count += 1
+        return evicted
+    
+    @property
+    def is_full(self) -> bool:
+        return self.count == self.size
+
+
+class IncrementalSMA:
+    """
+    Simple Moving Average, running sum dengan kompensasi Kahan
+    
+    min_periods sama dengan rolling(window, min_periods): default = period;
+    min_periods=1 memberi trailing mean yang valid sejak bar pertama.
+    """
+    
+    __slots__ = ('period', 'min_periods', 'window', 'total', 'compensation',
+                 'nan_count', 'value')
+    
+    def __init__(self, period: int, min_periods: Optional[int] = None):
+        self.period = period
+        self.min_periods = period if min_periods is None else min_periods
+        self.window = RingBuffer(period)
+        self.total = 0.0
+        self.compensation = 0.0
+        self.nan_count = 0
+        self.value = float('nan')
+    
+    def _add(self, x: float) -> None:
+        y = x - self.compensation
+        t = self.total + y
+        self.compensation = (t - self.total) - y
+        self.total = t
+    
+    def update(self, x: float) -> float:
+        """Tambah satu bar baru, return SMA terbaru (NaN selama warm-up)"""
+        evicted = self.window.push(x)
+        if evicted is not None:
+            if evicted != evicted:
+                self.nan_count -= 1
+            else:
+                self._add(-evicted)
+        if x != x:
+            self.nan_count += 1
+        else:
+            self._add(x)
+        
+        valid = self.window.count - self.nan_count
+        if valid >= self.min_periods and valid > 0:
+            self.value = self.total / valid
+        else:
+            self.value = float('nan')
+        return self.value
+
+
+class IncrementalEMA:
+    """Exponential Moving Average (adjust=False), sama dengan pandas ewm"""
+    
+    __slots__ = ('period', 'alpha', 'old_wt', 'value')
+    
+    def __init__(self, period: int):
+        self.period = period
+        self.alpha = 2.0 / (period + 1)
+        self.old_wt = 1.0
+        self.value = float('nan')
+    
+    def update(self, x: float) -> float:
+        """Tambah satu bar baru, return EMA terbaru"""
+        if self.value != self.value:
+            if x == x:
+                self.value = x
+            return self.value
+        # Bar NaN tetap meluruhkan bobot lama (ignore_na=False pandas)
+        self.old_wt *= 1.0 - self.alpha
+        if x == x:
+            if self.value != x:
+                # Bentuk yang sama dengan pandas: (w*ema + a*x) / (w + a)
+                self.value = ((self.old_wt * self.value + self.alpha * x)
+                              / (self.old_wt + self.alpha))
+            self.old_wt = 1.0
+        return self.value
+
+
+class IncrementalRSI:
+    """Relative Strength Index dengan rolling mean gain/loss"""
+    
+    __slots__ = ('period', 'gain', 'loss', 'prev', 'value')
+    
+    def __init__(self, period: int = 14):
+        self.period = period
+        self.gain = IncrementalSMA(period)
+        self.loss = IncrementalSMA(period)
+        self.prev = None
+        self.value = float('nan')
+    
+    def update(self, x: float) -> float:
+        """Tambah satu close baru, return RSI terbaru (NaN selama warm-up)"""
+        delta = x - self.prev if self.prev is not None else float('nan')
+        self.prev = x
+        
+        # Sama dengan delta.where(delta > 0, 0): delta NaN dihitung 0
+        avg_gain = self.gain.update(delta if delta > 0 else 0.0)
+        avg_loss = self.loss.update(-delta if delta < 0 else 0.0)
+        
+        if avg_gain != avg_gain or avg_loss != avg_loss:
+            self.value = float('nan')
+        elif avg_loss == 0:
+            self.value = 100.0 if avg_gain > 0 else float('nan')
+        else:
+            self.value = 100 - (100 / (1 + avg_gain / avg_loss))
+        return self.value
+
+
+class IncrementalATR:
+    """Average True Range dari high/low/close per bar"""
+    
+    __slots__ = ('period', 'tr', 'prev_close', 'value')
+    
+    def __init__(self, period: int = 14):
+        self.period = period
+        self.tr = IncrementalSMA(period)
+        self.prev_close = None
+        self.value = float('nan')
+    
+    def update(self, high: float, low: float, close: float) -> float:
+        """Tambah satu bar baru, return ATR terbaru (NaN selama warm-up)"""
+        true_range = high - low
+        if self.prev_close is not None:
+            true_range = max(true_range, abs(high - self.prev_close), abs(low - self.prev_close))
+        self.prev_close = close
+        self.value = self.tr.update(true_range)
+        return self.value
+
+
+class IncrementalBollingerBands:
+    """
+    Bollinger Bands dengan Welford variance (add/remove) atas ring buffer
+    
+    NaN tidak masuk ke mean/variance; selama masih ada NaN di window hasil
+    NaN (sama dengan rolling(period) pandas), lalu pulih setelah NaN keluar.
+    """
+    
+    __slots__ = ('period', 'std_dev', 'window', 'count', 'nan_count', 'mean', 'm2',
+                 'upper', 'middle', 'lower')
+    
+    def __init__(self, period: int = 20, std_dev: float = 2):
+        self.period = period
+        self.std_dev = std_dev
+        self.window = RingBuffer(period)
+        self.count = 0  # jumlah value non-NaN di window
+        self.nan_count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.upper = self.middle = self.lower = float('nan')
+    
+    def update(self, x: float) -> Tuple[float, float, float]:
+        """Tambah satu close baru, return (upper, middle, lower)"""
+        evicted = self.window.push(x)
+        
+        if evicted is not None:
+            if evicted != evicted:
+                self.nan_count -= 1
+            else:
+                # Remove nilai lama dari window
+                self.count -= 1
+                if self.count == 0:
+                    self.mean = 0.0
+                    self.m2 = 0.0
+                else:
+                    delta = evicted - self.mean
+                    self.mean -= delta / self.count
+                    self.m2 -= delta * (evicted - self.mean)
+        
+        if x != x:
+            self.nan_count += 1
+        else:
+            # Add nilai baru
+            self.count += 1
+            delta = x - self.mean
+            self.mean += delta / self.count
+            self.m2 += delta * (x - self.mean)
+        
+        if not self.window.is_full or self.nan_count:
+            self.upper = self.middle = self.lower = float('nan')
+            return self.upper, self.middle, self.lower
+        
+        variance = max(self.m2, 0.0) / (self.period - 1) if self.period > 1 else float('nan')
+        std = variance ** 0.5
+        self.middle = self.mean
+        self.upper = self.mean + std * self.std_dev
+        self.lower = self.mean - std * self.std_dev
+        return self.upper, self.middle, self.lower
+
+
+class IncrementalMACD:
+    """MACD dari tiga EMA incremental"""
+    
+    __slots__ = ('ema_fast', 'ema_slow', 'ema_signal', 'macd', 'signal', 'histogram')
+    
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        self.ema_fast = IncrementalEMA(fast)
+        self.ema_slow = IncrementalEMA(slow)
+        self.ema_signal = IncrementalEMA(signal)
+        self.macd = self.signal = self.histogram = float('nan')
+    
+    def update(self, x: float) -> Tuple[float, float, float]:
+        """Tambah satu close baru, return (macd_line, signal_line, histogram)"""
+        self.macd = self.ema_fast.update(x) - self.ema_slow.update(x)
+        self.signal = self.ema_signal.update(self.macd)
+        self.histogram = self.macd - self.signal
+        return self.macd, self.signal, self.histogram
+
+
+def get_indicator_state(indicator: Any) -> Dict:
+    """State incremental indicator: nilai slot, nested indicator sebagai dict"""
+    
+    state = {}
+    for name in indicator.__slots__:
+        value = getattr(indicator, name)
+        if hasattr(value, '__slots__'):
+            value = get_indicator_state(value)
+        elif isinstance(value, list):
+            value = list(value)
+        state[name] = value
+    return state
+
+
+def set_indicator_state(indicator: Any, state: Dict) -> None:
+    """Restore state in-place (closure create_indicator_stream tetap valid)"""
+    
+    for name, value in state.items():
+        current = getattr(indicator, name)
+        if isinstance(value, dict) and hasattr(current, '__slots__'):
+            set_indicator_state(current, value)
+        else:
+            setattr(indicator, name, list(value) if isinstance(value, list) else value)
+
+
+# ----------------------------------------------------------------------------
+# Indicator graph: strategi mendeklarasikan kebutuhan indikator, indikator
+# yang sama dihitung sekali untuk semua strategi
+# ----------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class IndicatorSpec:
+    """
+    Satu indikator dalam IndicatorGraph
+    
+    inputs berisi nama kolom candle atau IndicatorSpec lain (indikator atas
+    indikator). output memilih satu elemen dari indikator multi-output,
+    mis. 0 = upper band; node graph adalah spec tanpa output.
+    """
+    kind: str
+    params: Tuple = ()
+    inputs: Tuple = ('close',)
+    output: Optional[int] = None
+    
+    @property
+    def node(self) -> 'IndicatorSpec':
+        return self if self.output is None else replace(self, output=None)
+    
+    def __str__(self) -> str:
+        args = ','.join([str(source) for source in self.inputs] +
+                        [str(param) for param in self.params])
+        suffix = '' if self.output is None else f'[{self.output}]'
+        return f'{self.kind}({args}){suffix}'
+
+
+# kind -> (batch(*input Series, *params) lewat TechnicalIndicators,
+#          factory(*params) object incremental dengan update(*input values))
+INDICATOR_KINDS: Dict[str, Tuple[Callable, Callable]] = {
+    'sma': (TechnicalIndicators.calculate_sma, IncrementalSMA),
+    'ema': (TechnicalIndicators.calculate_ema, IncrementalEMA),
+    'rsi': (TechnicalIndicators.calculate_rsi, IncrementalRSI),
+    'atr': (TechnicalIndicators.calculate_atr, IncrementalATR),
+    'bollinger_bands': (TechnicalIndicators.calculate_bollinger_bands,
+                        IncrementalBollingerBands),
+    'macd': (TechnicalIndicators.calculate_macd, IncrementalMACD),
+    'trailing_mean': (TechnicalIndicators.calculate_trailing_mean,
+                      lambda window: IncrementalSMA(window, min_periods=1)),
+}
+
+
+def register_indicator(kind: str, batch: Callable, stream: Callable) -> None:
+    """Tambah jenis indikator baru yang bisa dipakai di IndicatorSpec"""
+    INDICATOR_KINDS[kind] = (batch, stream)
+
+
+# Kebutuhan strategi: kolom prepared -> nama kolom candle atau IndicatorSpec
+IndicatorRequirements = Dict[str, Union[str, IndicatorSpec]]
+
+
+class IndicatorGraph:
+    """
+    DAG indikator unik dari kebutuhan satu atau beberapa strategi
+    
+    Spec yang sama (kind, params, inputs) dari strategi berbeda menjadi satu
+    node dan dievaluasi sekali: per dataset lewat compute(), atau per bar
+    lewat create_stream(). Node disimpan dalam urutan topologis (input
+    selalu ditambahkan sebelum indikator yang memakainya).
+    """
+    
+    def __init__(self, strategies: Iterable['BaseStrategy'] = ()):
+        self.nodes: Dict[IndicatorSpec, None] = {}
+        self.columns: Dict[str, None] = {}
+        self.requested = 0
+        for strategy in strategies:
+            self.add_strategy(strategy)
+    
+    def add(self, spec: Union[str, IndicatorSpec]) -> None:
+        """Tambah satu kebutuhan indikator (duplikat diabaikan)"""
+        self.requested += 1
+        self._add(spec)
+    
+    def _add(self, spec: Union[str, IndicatorSpec]) -> None:
+        if isinstance(spec, str):
+            self.columns.setdefault(spec)
+            return
+        node = spec.node
+        if node in self.nodes:
+            return
+        if node.kind not in INDICATOR_KINDS:
+            raise ValueError(f"Unknown indicator kind: {node.kind}")
+        for source in node.inputs:
+            self._add(source)
+        self.nodes[node] = None
+    
+    def add_strategy(self, strategy: 'BaseStrategy') -> None:
+        for spec in strategy.required_indicators().values():
+            self.add(spec)
+    
+    def compute(self, data: pd.DataFrame) -> Dict[IndicatorSpec, Any]:
+        """Hitung setiap node sekali untuk seluruh data"""
+        
+        results: Dict[IndicatorSpec, Any] = {}
+        for node in self.nodes:
+            batch = INDICATOR_KINDS[node.kind][0]
+            inputs = [self._lookup(data, results, source) for source in node.inputs]
+            results[node] = batch(*inputs, *node.params)
+        return results
+    
+    @staticmethod
+    def _lookup(data: pd.DataFrame, results: Dict[IndicatorSpec, Any],
+                spec: Union[str, IndicatorSpec]) -> Any:
+        if isinstance(spec, str):
+            return data[spec]
+        value = results[spec.node]
+        return value if spec.output is None else value[spec.output]
+    
+    def select(self, data: pd.DataFrame, results: Dict[IndicatorSpec, Any],
+               requirements: IndicatorRequirements) -> Dict[str, np.ndarray]:
+        """Kolom prepared satu strategi dari hasil compute()"""
+        return {name: self._lookup(data, results, spec).to_numpy()
+                for name, spec in requirements.items()}
+    
+    def create_stream(self) -> 'IndicatorStream':
+        return IndicatorStream(self)
+    
+    def stats(self) -> Dict:
+        """Jumlah kebutuhan yang dideklarasikan vs node yang benar-benar dihitung"""
+        return {'requested': self.requested, 'nodes': len(self.nodes),
+                'columns': len(self.columns)}
+
+
+class IndicatorStream:
+    """
+    Evaluasi streaming IndicatorGraph
+    
+    update(candle) meng-update setiap node sekali (urutan topologis) dan
+    menyimpan hasilnya per slot di self.values; reader(spec) membaca hasil
+    bar terakhir tanpa menghitung ulang.
+    """
+    
+    def __init__(self, graph: IndicatorGraph):
+        self.slots: Dict[IndicatorSpec, int] = {node: i for i, node in enumerate(graph.nodes)}
+        self.values: List[Any] = [float('nan')] * len(self.slots)
+        self.indicators: Dict[IndicatorSpec, Any] = {}
+        self.bars = 0
+        self._plan = []
+        for node, slot in self.slots.items():
+            indicator = INDICATOR_KINDS[node.kind][1](*node.params)
+            self.indicators[node] = indicator
+            self._plan.append((slot, self._step(indicator.update, node.inputs)))
+    
+    def _step(self, update: Callable, inputs: Tuple) -> Callable[[Dict], Any]:
+        # Spesialisasi untuk kasus umum (input kolom candle) supaya per bar
+        # cukup satu call per node
+        if all(isinstance(source, str) for source in inputs):
+            if len(inputs) == 1:
+                column = inputs[0]
+                return lambda candle: update(candle[column])
+            columns = operator.itemgetter(*inputs)
+            return lambda candle: update(*columns(candle))
+        readers = tuple(self.reader(source) for source in inputs)
+        return lambda candle: update(*[read(candle) for read in readers])
+    
+    def update(self, candle: Dict) -> List[Any]:
+        """Tambah satu candle, return nilai semua node (urutan slot)"""
+        values = self.values
+        for slot, step in self._plan:
+            values[slot] = step(candle)
+        self.bars += 1
+        return values
+    
+    def value(self, spec: IndicatorSpec) -> Any:
+        """Nilai spec di bar terakhir"""
+        value = self.values[self.slots[spec.node]]
+        return value if spec.output is None else value[spec.output]
+    
+    def reader(self, spec: Union[str, IndicatorSpec]) -> Callable[[Dict], Any]:
+        """Callable(candle) yang return nilai spec di bar terakhir"""
+        if isinstance(spec, str):
+            return operator.itemgetter(spec)
+        values, slot, output = self.values, self.slots[spec.node], spec.output
+        if output is None:
+            return lambda candle: values[slot]
+        return lambda candle: values[slot][output]
 
 
 # ============================================================================
 # 3. STRATEGY BASE CLASS
 # ============================================================================
 
+# Kode action generate_signal_arrays -> action signal dict
+SIGNAL_ACTIONS = {1: 'BUY', -1: 'SELL', 0: 'HOLD'}
+
+
 class BaseStrategy(ABC):
     """Base class untuk semua strategi trading"""
     
     def __init__(self, config: BotConfig, logger: logging.Logger):
         self.config = config
         self.logger = logger
+        
+        # Indikator hasil prepare(), array posisional per kolom
+        self.prepared: Dict[str, np.ndarray] = {}
+        self._prepared_data: Optional[pd.DataFrame] = None
+        self._prepared_len = 0
+        
+        # Object incremental indicator dari create_indicator_stream (untuk checkpoint)
+        self.stream_indicators: Dict[str, Any] = {}
+        self.last_signal: Optional[Dict] = None
+    
+    def required_indicators(self) -> IndicatorRequirements:
+        """
+        Deklarasi indikator yang dibutuhkan: kolom prepared -> nama kolom
+        candle atau IndicatorSpec
+        
+        Dipakai compute_indicators/create_indicator_stream default dan oleh
+        IndicatorGraph untuk share indikator antar strategi. Kosong jika
+        strategi override compute_indicators sendiri.
+        """
+        return {}
+    
+    def compute_indicators(self, data: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """
+        Hitung semua kolom indikator sekali untuk seluruh DataFrame.
+        
+        Default: evaluasi required_indicators() lewat IndicatorGraph. Nilai
+        di posisi i harus sama dengan hasil perhitungan atas data.iloc[:i+1]
+        (semua indikator bersifat causal).
+        """
+        requirements = self.required_indicators()
+        if not requirements:
+            return {}
+        graph = IndicatorGraph([self])
+        return graph.select(data, graph.compute(data), requirements)
+    
+    def prepare(self, data: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """Precompute indikator untuk seluruh data sebelum backtest"""
+        return self.attach_prepared(data, self.compute_indicators(data))
+    
+    def attach_prepared(self, data: pd.DataFrame,
+                        prepared: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """Pakai array indikator yang diisi dari luar (mis. live runner) untuk data ini"""
+        self.prepared = prepared
+        self._prepared_data = data
+        self._prepared_len = len(data)
+        return self.prepared
+    
+    def create_indicator_stream(self, shared: Optional[IndicatorStream] = None
+                                ) -> Dict[str, Callable[[Dict], float]]:
+        """
+        Versi streaming dari compute_indicators untuk live trading
+        
+        Returns:
+            Mapping kolom indikator -> update(candle) O(1) yang return nilai
+            indikator di bar tersebut. Kosong jika strategi tidak support.
+        
+        Tanpa `shared`, strategi punya IndicatorStream sendiri yang di-update
+        oleh kolom pertama. Dengan `shared` (StrategyEnsemble), semua kolom
+        hanya membaca; pemilik stream harus memanggil shared.update(candle)
+        sekali per bar sebelumnya.
+        
+        Object incremental indicator disimpan di self.stream_indicators
+        supaya state-nya ikut di-checkpoint.
+        """
+        requirements = self.required_indicators()
+        if not requirements:
+            return {}
+        
+        graph = IndicatorGraph([self])
+        stream = shared or graph.create_stream()
+        self.stream_indicators = {str(node): stream.indicators[node] for node in graph.nodes}
+        
+        readers = {name: stream.reader(spec) for name, spec in requirements.items()}
+        if shared is None:
+            first, read_first = next(iter(readers.items()))
+            
+            def advance(candle: Dict) -> float:
+                stream.update(candle)
+                return read_first(candle)
+            
+            readers[first] = advance
+        return readers
+    
+    def get_state(self) -> Dict:
+        """State strategi untuk checkpoint (last_signal + streaming indicators)"""
+        return {
+            'last_signal': dict(self.last_signal) if self.last_signal else None,
+            'indicators': {name: get_indicator_state(indicator)
+                           for name, indicator in self.stream_indicators.items()},
+        }
+    
+    def set_state(self, state: Dict) -> None:
+        """
+        Restore dari get_state(); panggil setelah create_indicator_stream()
+        supaya state masuk ke object yang dipakai stream
+        """
+        self.last_signal = state['last_signal']
+        for name, indicator_state in state['indicators'].items():
+            if name in self.stream_indicators:
+                set_indicator_state(self.stream_indicators[name], indicator_state)
+    
+    def get_prepared(self, data: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """Ambil indikator yang sudah di-prepare, prepare ulang jika data berubah"""
+        if self._prepared_data is not data or self._prepared_len != len(data):
+            return self.prepare(data)
+        return self.prepared
     
     @abstractmethod
     def generate_signal(self, data: pd.DataFrame, current_idx: int) -> Dict:
@@ -233,6 +1637,52 @@ class BaseStrategy(ABC):
         """
         pass
     
+    def generate_signal_arrays(self, data: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Versi vectorized dari generate_signal untuk seluruh data
+        
+        Returns:
+            (action, confidence) per bar, action: 1 = BUY, -1 = SELL, 0 = HOLD
+        
+        Default implementation memanggil generate_signal per bar; subclass
+        sebaiknya override dengan operasi array yang hasilnya identik.
+        """
+        action = np.zeros(len(data), dtype=np.int8)
+        confidence = np.zeros(len(data))
+        codes = {'BUY': 1, 'SELL': -1, 'HOLD': 0}
+        for idx in range(len(data)):
+            signal = self.generate_signal(data, idx)
+            action[idx] = codes[signal['action']]
+            confidence[idx] = signal['confidence']
+        return action, confidence
+    
+    def calculate_stop_loss_take_profit_arrays(self, entry_prices: np.ndarray,
+                                               data: pd.DataFrame,
+                                               indices: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Versi vectorized dari calculate_stop_loss_take_profit
+        
+        Returns:
+            (stop_loss, take_profit) array, satu elemen per indices
+        """
+        levels = [self.calculate_stop_loss_take_profit(price, data, idx)
+                  for price, idx in zip(entry_prices, indices)]
+        if not levels:
+            return np.empty(0), np.empty(0)
+        stop_loss, take_profit = zip(*levels)
+        return np.array(stop_loss, dtype=float), np.array(take_profit, dtype=float)
+    
+    def signal_from_arrays(self, data: pd.DataFrame, current_idx: int, action: np.ndarray,
+                           confidence: np.ndarray) -> Dict:
+        """
+        Signal dict bar current_idx dari hasil generate_signal_arrays, sama
+        dengan generate_signal(data, current_idx) termasuk update last_signal
+        
+        Default memanggil generate_signal; strategi built-in membangun dict
+        langsung dari array tanpa mengevaluasi ulang kondisi entry.
+        """
+        return self.generate_signal(data, current_idx)
+    
     def validate_signal(self, signal: Dict, balance: float, 
                        entry_price: float) -> bool:
         """Validate apakah signal valid untuk entry"""
@@ -241,7 +1691,7 @@ class BaseStrategy(ABC):
             return False
         
         if signal['confidence'] < 0.5:
-            self.logger.debug(f"Signal confidence terlalu rendah: {signal['confidence']}")
+            self.logger.debug("Signal confidence terlalu rendah: %s", signal['confidence'])
             return False
         
         if balance <= 0:
@@ -275,9 +1725,20 @@ class MACrossoverRSIStrategy(BaseStrategy):
     
     def __init__(self, config: BotConfig, logger: logging.Logger):
         super().__init__(config, logger)
-        self.indicators = TechnicalIndicators()
         self.last_signal = None
     
+    def required_indicators(self) -> IndicatorRequirements:
+        """MA fast/slow, RSI, ATR dan rata-rata volume"""
+        
+        return {
+            'sma_fast': IndicatorSpec('sma', (self.config.fast_ma_period,)),
+            'sma_slow': IndicatorSpec('sma', (self.config.slow_ma_period,)),
+            'rsi': IndicatorSpec('rsi', (self.config.rsi_period,)),
+            'atr': IndicatorSpec('atr', (self.config.atr_period,), ('high', 'low', 'close')),
+            'volume': 'volume',
+            'avg_volume': IndicatorSpec('trailing_mean', (50,), ('volume',)),
+        }
+    
     def generate_signal(self, data: pd.DataFrame, current_idx: int) -> Dict:
         """Generate buy/sell signal"""
         
@@ -285,30 +1746,19 @@ class MACrossoverRSIStrategy(BaseStrategy):
         if current_idx < self.config.slow_ma_period + 1:
             return {'action': 'HOLD', 'confidence': 0.0, 'reason': 'Insufficient data'}
         
-        # Calculate indicators
-        close = data['close'].iloc[:current_idx+1]
-        high = data['high'].iloc[:current_idx+1]
-        low = data['low'].iloc[:current_idx+1]
-        volume = data['volume'].iloc[:current_idx+1]
-        
-        # Moving Averages
-        sma_fast = self.indicators.calculate_sma(close, self.config.fast_ma_period)
-        sma_slow = self.indicators.calculate_sma(close, self.config.slow_ma_period)
-        
-        # RSI
-        rsi = self.indicators.calculate_rsi(close, self.config.rsi_period)
+        # Indicators (precomputed sekali per dataset)
+        ind = self.get_prepared(data)
         
         # Current values
-        current_price = close.iloc[-1]
-        current_sma_fast = sma_fast.iloc[-1]
-        current_sma_slow = sma_slow.iloc[-1]
-        current_rsi = rsi.iloc[-1]
-        current_volume = volume.iloc[-1]
-        avg_volume = volume.iloc[-50:].mean()
+        current_sma_fast = ind['sma_fast'][current_idx]
+        current_sma_slow = ind['sma_slow'][current_idx]
+        current_rsi = ind['rsi'][current_idx]
+        current_volume = ind['volume'][current_idx]
+        avg_volume = ind['avg_volume'][current_idx]
         
         # Crossover signals
-        prev_sma_fast = sma_fast.iloc[-2]
-        prev_sma_slow = sma_slow.iloc[-2]
+        prev_sma_fast = ind['sma_fast'][current_idx - 1]
+        prev_sma_slow = ind['sma_slow'][current_idx - 1]
         
         signal = {'action': 'HOLD', 'confidence': 0.0, 'reason': ''}
         
@@ -323,7 +1773,7 @@ class MACrossoverRSIStrategy(BaseStrategy):
             signal = {
                 'action': 'BUY',
                 'confidence': confidence,
-                'reason': f'MA Crossover Up | RSI:{current_rsi:.1f} | Volume:{current_volume/avg_volume:.1f}x'
+                'reason': self._reason(ind, current_idx, 'BUY')
             }
         
         # SELL Signal
@@ -336,23 +1786,85 @@ class MACrossoverRSIStrategy(BaseStrategy):
             signal = {
                 'action': 'SELL',
                 'confidence': confidence,
-                'reason': f'MA Crossover Down | RSI:{current_rsi:.1f} | Volume:{current_volume/avg_volume:.1f}x'
+                'reason': self._reason(ind, current_idx, 'SELL')
             }
         
         self.last_signal = signal
         return signal
     
+    @staticmethod
+    def _reason(ind: Dict[str, np.ndarray], idx: int, action: str) -> str:
+        if action == 'HOLD':
+            return ''
+        direction = 'Up' if action == 'BUY' else 'Down'
+        return (f"MA Crossover {direction} | RSI:{ind['rsi'][idx]:.1f} | "
+                f"Volume:{ind['volume'][idx] / ind['avg_volume'][idx]:.1f}x")
+    
+    def signal_from_arrays(self, data: pd.DataFrame, current_idx: int, action: np.ndarray,
+                           confidence: np.ndarray) -> Dict:
+        """Signal dict dari array generate_signal_arrays, sama dengan generate_signal"""
+        
+        if current_idx < self.config.slow_ma_period + 1:
+            return {'action': 'HOLD', 'confidence': 0.0, 'reason': 'Insufficient data'}
+        
+        name = SIGNAL_ACTIONS[action[current_idx]]
+        signal = {'action': name, 'confidence': float(confidence[current_idx]),
+                  'reason': self._reason(self.get_prepared(data), current_idx, name)}
+        self.last_signal = signal
+        return signal
+    
+    def generate_signal_arrays(self, data: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        """Vectorized buy/sell signal untuk seluruh data"""
+        
+        ind = self.get_prepared(data)
+        sma_fast = ind['sma_fast']
+        sma_slow = ind['sma_slow']
+        rsi = ind['rsi']
+        
+        prev_sma_fast = np.concatenate(([np.nan], sma_fast[:-1]))
+        prev_sma_slow = np.concatenate(([np.nan], sma_slow[:-1]))
+        
+        ready = np.arange(len(data)) >= self.config.slow_ma_period + 1
+        volume_ok = ind['volume'] > ind['avg_volume']
+        
+        buy = (ready &
+               (prev_sma_fast <= prev_sma_slow) &
+               (sma_fast > sma_slow) &
+               (rsi > self.config.rsi_oversold) &
+               (rsi < self.config.rsi_overbought) &
+               volume_ok)
+        sell = (ready & ~buy &
+                (prev_sma_fast >= prev_sma_slow) &
+                (sma_fast < sma_slow) &
+                (rsi < self.config.rsi_overbought) &
+                volume_ok)
+        
+        action = np.zeros(len(data), dtype=np.int8)
+        action[buy] = 1
+        action[sell] = -1
+        
+        confidence = np.zeros(len(data))
+        confidence[buy] = np.minimum(0.95, 0.7 + (rsi[buy] - 30) / 100)
+        confidence[sell] = np.minimum(0.95, 0.7 + (70 - rsi[sell]) / 100)
+        
+        return action, confidence
+    
+    def calculate_stop_loss_take_profit_arrays(self, entry_prices: np.ndarray,
+                                               data: pd.DataFrame,
+                                               indices: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Vectorized SL and TP based on ATR"""
+        
+        atr = self.get_prepared(data)['atr'][indices]
+        stop_loss = entry_prices - (atr * self.config.atr_multiplier_sl)
+        take_profit = entry_prices + (atr * self.config.atr_multiplier_tp)
+        return stop_loss, take_profit
+    
     def calculate_stop_loss_take_profit(self, entry_price: float, 
                                        data: pd.DataFrame, 
                                        current_idx: int) -> Tuple[float, float]:
         """Calculate SL and TP based on ATR"""
         
-        high = data['high'].iloc[:current_idx+1]
-        low = data['low'].iloc[:current_idx+1]
-        close = data['close'].iloc[:current_idx+1]
-        
-        atr = self.indicators.calculate_atr(high, low, close, self.config.atr_period)
-        current_atr = atr.iloc[-1]
+        current_atr = self.get_prepared(data)['atr'][current_idx]
         
         # Stop Loss: entry - ATR*1.5
         stop_loss = entry_price - (current_atr * self.config.atr_multiplier_sl)
@@ -373,48 +1885,94 @@ class MeanReversionStrategy(BaseStrategy):
 
     def __init__(self, config: BotConfig, logger: logging.Logger):
         super().__init__(config, logger)
-        self.indicators = TechnicalIndicators()
         self.last_signal = None
 
+    def required_indicators(self) -> IndicatorRequirements:
+        """Bollinger Bands (20, 2), RSI, ATR dan rata-rata volume"""
+        bands = IndicatorSpec('bollinger_bands', (20, 2))
+        return {
+            'close': 'close',
+            'upper': replace(bands, output=0),
+            'lower': replace(bands, output=2),
+            'rsi': IndicatorSpec('rsi', (self.config.rsi_period,)),
+            'atr': IndicatorSpec('atr', (self.config.atr_period,), ('high', 'low', 'close')),
+            'volume': 'volume',
+            'avg_volume': IndicatorSpec('trailing_mean', (50,), ('volume',)),
+        }
+
     def generate_signal(self, data: pd.DataFrame, current_idx: int) -> Dict:
         if current_idx < 30:
             return {'action': 'HOLD', 'confidence': 0.0, 'reason': 'Insufficient data'}
 
-        close = data['close'].iloc[:current_idx+1]
-        high = data['high'].iloc[:current_idx+1]
-        low = data['low'].iloc[:current_idx+1]
-        volume = data['volume'].iloc[:current_idx+1]
-
-        upper, mid, lower = self.indicators.calculate_bollinger_bands(close, period=20, std_dev=2)
-        rsi = self.indicators.calculate_rsi(close, period=self.config.rsi_period)
+        ind = self.get_prepared(data)
 
-        current_price = close.iloc[-1]
-        current_rsi = rsi.iloc[-1]
-        current_volume = volume.iloc[-1]
-        avg_volume = volume.iloc[-50:].mean()
+        current_price = ind['close'][current_idx]
+        current_rsi = ind['rsi'][current_idx]
+        current_volume = ind['volume'][current_idx]
+        avg_volume = ind['avg_volume'][current_idx]
 
         signal = {'action': 'HOLD', 'confidence': 0.0, 'reason': ''}
 
         # Buy condition: touch lower band, RSI oversold and volume confirmation
-        if current_price <= lower.iloc[-1] and current_rsi <= self.config.rsi_oversold and current_volume >= 0.8 * avg_volume:
+        if current_price <= ind['lower'][current_idx] and current_rsi <= self.config.rsi_oversold and current_volume >= 0.8 * avg_volume:
             confidence = min(0.95, 0.6 + (self.config.rsi_oversold - current_rsi) / 100)
-            signal = {'action': 'BUY', 'confidence': confidence, 'reason': f'MeanReversion Buy | RSI:{current_rsi:.1f}'}
+            signal = {'action': 'BUY', 'confidence': confidence, 'reason': self._reason(ind, current_idx, 'BUY')}
 
         # Sell condition: touch upper band, RSI overbought and volume confirmation
-        elif current_price >= upper.iloc[-1] and current_rsi >= self.config.rsi_overbought and current_volume >= 0.8 * avg_volume:
+        elif current_price >= ind['upper'][current_idx] and current_rsi >= self.config.rsi_overbought and current_volume >= 0.8 * avg_volume:
             confidence = min(0.95, 0.6 + (current_rsi - self.config.rsi_overbought) / 100)
-            signal = {'action': 'SELL', 'confidence': confidence, 'reason': f'MeanReversion Sell | RSI:{current_rsi:.1f}'}
+            signal = {'action': 'SELL', 'confidence': confidence, 'reason': self._reason(ind, current_idx, 'SELL')}
 
         self.last_signal = signal
         return signal
 
-    def calculate_stop_loss_take_profit(self, entry_price: float, data: pd.DataFrame, current_idx: int) -> Tuple[float, float]:
-        high = data['high'].iloc[:current_idx+1]
-        low = data['low'].iloc[:current_idx+1]
-        close = data['close'].iloc[:current_idx+1]
+    @staticmethod
+    def _reason(ind: Dict[str, np.ndarray], idx: int, action: str) -> str:
+        if action == 'HOLD':
+            return ''
+        return f"MeanReversion {action.title()} | RSI:{ind['rsi'][idx]:.1f}"
+
+    def signal_from_arrays(self, data: pd.DataFrame, current_idx: int, action: np.ndarray,
+                           confidence: np.ndarray) -> Dict:
+        if current_idx < 30:
+            return {'action': 'HOLD', 'confidence': 0.0, 'reason': 'Insufficient data'}
+
+        name = SIGNAL_ACTIONS[action[current_idx]]
+        signal = {'action': name, 'confidence': float(confidence[current_idx]),
+                  'reason': self._reason(self.get_prepared(data), current_idx, name)}
+        self.last_signal = signal
+        return signal
+
+    def generate_signal_arrays(self, data: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        ind = self.get_prepared(data)
+        close = ind['close']
+        rsi = ind['rsi']
+
+        ready = np.arange(len(data)) >= 30
+        volume_ok = ind['volume'] >= 0.8 * ind['avg_volume']
+
+        buy = ready & (close <= ind['lower']) & (rsi <= self.config.rsi_oversold) & volume_ok
+        sell = ready & ~buy & (close >= ind['upper']) & (rsi >= self.config.rsi_overbought) & volume_ok
+
+        action = np.zeros(len(data), dtype=np.int8)
+        action[buy] = 1
+        action[sell] = -1
+
+        confidence = np.zeros(len(data))
+        confidence[buy] = np.minimum(0.95, 0.6 + (self.config.rsi_oversold - rsi[buy]) / 100)
+        confidence[sell] = np.minimum(0.95, 0.6 + (rsi[sell] - self.config.rsi_overbought) / 100)
+
+        return action, confidence
 
-        atr = self.indicators.calculate_atr(high, low, close, self.config.atr_period)
-        current_atr = atr.iloc[-1]
+    def calculate_stop_loss_take_profit_arrays(self, entry_prices: np.ndarray, data: pd.DataFrame,
+                                               indices: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        atr = self.get_prepared(data)['atr'][indices]
+        stop_loss = entry_prices - (atr * self.config.atr_multiplier_sl)
+        take_profit = entry_prices + (atr * self.config.atr_multiplier_tp)
+        return stop_loss, take_profit
+
+    def calculate_stop_loss_take_profit(self, entry_price: float, data: pd.DataFrame, current_idx: int) -> Tuple[float, float]:
+        current_atr = self.get_prepared(data)['atr'][current_idx]
 
         # For mean reversion, tighter SL and moderate TP
         stop_loss = entry_price - (current_atr * self.config.atr_multiplier_sl)
@@ -422,6 +1980,49 @@ class MeanReversionStrategy(BaseStrategy):
         return stop_loss, take_profit
 
 
+
+def create_strategy(config: BotConfig, logger: logging.Logger,
+                    name: Optional[str] = None) -> BaseStrategy:
+    """Buat strategi dari nama (default: config.strategy)"""
+    
+    # Nama yang tidak dikenal jatuh ke strategi default (perilaku lama STRATEGY env)
+    selected = resolve_strategy_name(name or config.strategy) or DEFAULT_STRATEGY
+    return load_strategy(selected)(config, logger)
+
+
+# Class built-in langsung masuk registry (juga saat modul ini dijalankan sebagai script)
+register_strategy('macrossover_rsi', MACrossoverRSIStrategy)
+register_strategy('mean_reversion', MeanReversionStrategy)
+
+
+class StrategyEnsemble:
+    """
+    Beberapa strategi atas feed yang sama dengan satu IndicatorGraph
+    
+    Indikator yang dideklarasikan lebih dari satu strategi (mis. RSI dan ATR
+    dengan period sama) dihitung sekali; menambah strategi hanya menambah
+    indikator yang unik untuk strategi itu.
+    """
+    
+    def __init__(self, strategies: Iterable[BaseStrategy]):
+        self.strategies = list(strategies)
+        self.graph = IndicatorGraph(self.strategies)
+    
+    def prepare(self, data: pd.DataFrame) -> None:
+        """Precompute indikator semua strategi untuk data, sekali per node"""
+        
+        results = self.graph.compute(data)
+        for strategy in self.strategies:
+            requirements = strategy.required_indicators()
+            if requirements:
+                strategy.attach_prepared(data, self.graph.select(data, results, requirements))
+            else:
+                strategy.prepare(data)
+    
+    def create_stream(self) -> IndicatorStream:
+        """Stream bersama; update sekali per candle lalu baca lewat stream strategi"""
+        return self.graph.create_stream()
+
 # ============================================================================
 # 5. RISK MANAGEMENT
 # ============================================================================
@@ -461,7 +2062,7 @@ class RiskManager:
         
         position_size = min(position_size, max_units)
         
-        self.logger.debug(f"Calculated position size: {position_size} units")
+        self.logger.debug("Calculated position size: %s units", position_size)
         
         return position_size
     
@@ -471,7 +2072,7 @@ class RiskManager:
         max_daily_loss = account_balance * self.config.max_daily_loss
         
         if current_pnl < -max_daily_loss:
-            self.logger.warning(f"Daily loss limit exceeded: {current_pnl:.2f} < {-max_daily_loss:.2f}")
+            self.logger.warning("Daily loss limit exceeded: %.2f < %.2f", current_pnl, -max_daily_loss)
             return False
         
         return True
@@ -485,7 +2086,8 @@ class RiskManager:
         drawdown = (peak_equity - current_equity) / peak_equity
         
         if drawdown > self.config.max_drawdown:
-            self.logger.warning(f"Max drawdown exceeded: {drawdown*100:.2f}% > {self.config.max_drawdown*100:.2f}%")
+            self.logger.warning("Max drawdown exceeded: %.2f%% > %.2f%%", drawdown * 100,
+                                self.config.max_drawdown * 100)
             return False
         
         return True
@@ -495,15 +2097,162 @@ class RiskManager:
 # 6. ORDER EXECUTOR
 # ============================================================================
 
+class OrderStore:
+    """
+    Penyimpanan order dengan index dan history bounded
+    
+    - open: order yang belum terminal (PENDING / PARTIALLY_FILLED)
+    - history: order terminal (FILLED / CANCELLED / REJECTED), paling
+      banyak `retention` order; yang tertua di-spill ke JSONL (jika
+      spill_path diset) lalu dibuang, sehingga memory tetap flat
+    - index per symbol dan per status mencakup open + history
+    """
+    
+    TERMINAL = frozenset({OrderStatus.FILLED, OrderStatus.CANCELLED, OrderStatus.REJECTED})
+    
+    def __init__(self, retention: int = 10_000, spill_path: Optional[str] = None):
+        if retention < 0:
+            raise ValueError("retention must be >= 0")
+        self.retention = retention
+        self.spill_path = spill_path
+        self.spilled = 0
+        self.evicted = 0
+        
+        self.open: Dict[str, Order] = {}
+        self.history: 'OrderedDict[str, Order]' = OrderedDict()
+        self._by_symbol: Dict[str, Dict[str, Order]] = {}
+        self._by_status: Dict[OrderStatus, Dict[str, Order]] = {status: {} for status in OrderStatus}
+        self._spill_file = None
+    
+    def add(self, order: Order) -> None:
+        self.open[order.order_id] = order
+        self._by_symbol.setdefault(order.symbol, {})[order.order_id] = order
+        self._by_status[order.status][order.order_id] = order
+        if order.status in self.TERMINAL:
+            self._retire(order)
+    
+    def set_status(self, order: Order, status: OrderStatus) -> None:
+        """Update status + index; order terminal pindah dari open ke history"""
+        
+        del self._by_status[order.status][order.order_id]
+        order.status = status
+        self._by_status[status][order.order_id] = order
+        if status in self.TERMINAL and order.order_id in self.open:
+            self._retire(order)
+    
+    def _retire(self, order: Order) -> None:
+        del self.open[order.order_id]
+        self.history[order.order_id] = order
+        while len(self.history) > self.retention:
+            _, oldest = self.history.popitem(last=False)
+            self._drop(oldest)
+    
+    def _drop(self, order: Order) -> None:
+        symbol_orders = self._by_symbol[order.symbol]
+        del symbol_orders[order.order_id]
+        if not symbol_orders:
+            del self._by_symbol[order.symbol]
+        del self._by_status[order.status][order.order_id]
+        self.evicted += 1
+        if self.spill_path:
+            self._spill(order)
+    
+    def _spill(self, order: Order) -> None:
+        if self._spill_file is None:
+            self._spill_file = open(self.spill_path, 'a', encoding='utf-8')
+        record = {
+            'order_id': order.order_id,
+            'order_type': order.order_type.value,
+            'symbol': order.symbol,
+            'quantity': order.quantity,
+            'price': order.price,
+            'status': order.status.value,
+            'filled_quantity': order.filled_quantity,
+            'created_at': order.created_at.isoformat() if order.created_at else None,
+            'filled_at': order.filled_at.isoformat() if order.filled_at else None,
+            'execution_price': order.execution_price,
+        }
+        self._spill_file.write(json.dumps(record) + '\n')
+        self.spilled += 1
+    
+    def get_state(self, history: bool = True) -> List[Tuple]:
+        """Semua order (open lalu history, urutan dipertahankan) sebagai tuple"""
+        orders = self.open.values()
+        if history:
+            orders = itertools.chain(orders, self.history.values())
+        return [
+            (o.order_id, o.order_type.value, o.symbol, o.quantity, o.price, o.status.value,
+             o.filled_quantity, o.created_at, o.filled_at, o.execution_price)
+            for o in orders
+        ]
+    
+    def set_state(self, state: List[Tuple]) -> None:
+        """Restore dari get_state() (store dikosongkan dulu)"""
+        
+        self.open.clear()
+        self.history.clear()
+        self._by_symbol.clear()
+        for orders in self._by_status.values():
+            orders.clear()
+        
+        for (order_id, order_type, symbol, quantity, price, status, filled_quantity,
+             created_at, filled_at, execution_price) in state:
+            self.add(Order(order_id=order_id, order_type=OrderType(order_type), symbol=symbol,
+                           quantity=quantity, price=price, status=OrderStatus(status),
+                           filled_quantity=filled_quantity, created_at=created_at,
+                           filled_at=filled_at, execution_price=execution_price))
+    
+    def get(self, order_id: str) -> Optional[Order]:
+        """Order open atau di history, None jika tidak ada / sudah di-evict"""
+        order = self.open.get(order_id)
+        return order if order is not None else self.history.get(order_id)
+    
+    def by_symbol(self, symbol: str, status: Optional[OrderStatus] = None) -> List[Order]:
+        orders = self._by_symbol.get(symbol, {})
+        if status is None:
+            return list(orders.values())
+        return [order for order in orders.values() if order.status == status]
+    
+    def by_status(self, status: OrderStatus) -> List[Order]:
+        return list(self._by_status[status].values())
+    
+    def counts(self) -> Dict[str, int]:
+        """Jumlah order per status (open + history yang masih disimpan)"""
+        return {status.value: len(orders) for status, orders in self._by_status.items()}
+    
+    def __len__(self) -> int:
+        return len(self.open) + len(self.history)
+    
+    def flush(self) -> None:
+        if self._spill_file is not None:
+            self._spill_file.flush()
+    
+    def close(self) -> None:
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
+
+
 class OrderExecutor:
     """Handle order execution"""
     
-    def __init__(self, logger: logging.Logger):
+    def __init__(self, logger: logging.Logger, events: Optional[EventLog] = None,
+                 history_size: int = 10_000, spill_path: Optional[str] = None):
         self.logger = logger
-        self.open_orders: Dict[str, Order] = {}
-        self.closed_orders: List[Order] = []
+        self.events = events or EventLog(LoggingSink(logger))
+        self.orders = OrderStore(history_size, spill_path)
         self.order_counter = 0
     
+    @property
+    def open_orders(self) -> Dict[str, Order]:
+        """Order yang belum terminal"""
+        return self.orders.open
+    
+    @property
+    def closed_orders(self) -> List[Order]:
+        """Order terminal yang masih di history (terlama dulu)"""
+        return list(self.orders.history.values())
+    
     def create_buy_order(self, symbol: str, quantity: float, 
                         price: float, order_type: str = "market") -> Order:
         """Create buy order"""
@@ -519,8 +2268,8 @@ class OrderExecutor:
             created_at=datetime.now()
         )
         
-        self.open_orders[order.order_id] = order
-        self.logger.info(f"Created BUY order: {order.order_id} | {quantity} @ {price}")
+        self.orders.add(order)
+        self.events.emit('order_created', order.order_id, 'BUY', symbol, quantity, price)
         
         return order
     
@@ -539,8 +2288,8 @@ class OrderExecutor:
             created_at=datetime.now()
         )
         
-        self.open_orders[order.order_id] = order
-        self.logger.info(f"Created SELL order: {order.order_id} | {quantity} @ {price}")
+        self.orders.add(order)
+        self.events.emit('order_created', order.order_id, 'SELL', symbol, quantity, price)
         
         return order
     
@@ -548,11 +2297,11 @@ class OrderExecutor:
                   filled_quantity: Optional[float] = None) -> bool:
         """Fill order dengan execution price"""
         
-        if order_id not in self.open_orders:
-            self.logger.error(f"Order not found: {order_id}")
+        order = self.orders.open.get(order_id)
+        if order is None:
+            self.logger.error("Order not found: %s", order_id)
             return False
         
-        order = self.open_orders[order_id]
         filled_qty = filled_quantity if filled_quantity else order.quantity
         
         order.filled_quantity = filled_qty
@@ -560,12 +2309,23 @@ class OrderExecutor:
         order.filled_at = datetime.now()
         
         if abs(order.filled_quantity - order.quantity) < 0.001:  # Fully filled
-            order.status = OrderStatus.FILLED
+            self.orders.set_status(order, OrderStatus.FILLED)
         else:
-            order.status = OrderStatus.PARTIALLY_FILLED
+            self.orders.set_status(order, OrderStatus.PARTIALLY_FILLED)
+        
+        self.events.emit('order_filled', order_id, filled_qty, execution_price)
         
-        self.logger.info(f"Filled order {order_id}: {filled_qty} @ {execution_price}")
+        return True
+    
+    def cancel_order(self, order_id: str) -> bool:
+        """Cancel order yang masih open"""
+        
+        order = self.orders.open.get(order_id)
+        if order is None:
+            self.logger.error("Order not found: %s", order_id)
+            return False
         
+        self.orders.set_status(order, OrderStatus.CANCELLED)
         return True
 
 
@@ -573,81 +2333,877 @@ class OrderExecutor:
 # 7. TRADING BOT MAIN ENGINE
 # ============================================================================
 
+def find_first_touch(close: np.ndarray, start_bars: np.ndarray, end_bars: np.ndarray,
+                     stop_loss: np.ndarray, take_profit: np.ndarray,
+                     max_cells: int = 1 << 22, upper: Optional[np.ndarray] = None,
+                     lower: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Cari bar pertama di [start, end) dimana close >= take_profit atau
+    close <= stop_loss, untuk banyak trade sekaligus.
+    
+    Jika upper/lower diberikan (mis. high/low), take_profit dicek terhadap
+    upper dan stop_loss terhadap lower.
+    
+    Window pencarian dimulai kecil dan melebar 2x setiap putaran, dengan
+    ukuran matrix dibatasi max_cells agar memory tetap bounded.
+    
+    Returns:
+        Bar index per trade, -1 jika tidak tersentuh sebelum end
+    """
+    upper = close if upper is None else upper
+    lower = close if lower is None else lower
+    result = np.full(len(start_bars), -1, dtype=np.int64)
+    pending = np.flatnonzero(start_bars < end_bars)
+    last_bar = len(close) - 1
+    offset = 0
+    width = 16
+    
+    while pending.size:
+        width = max(1, min(width, max_cells // pending.size))
+        bars = (start_bars[pending] + offset)[:, None] + np.arange(width)
+        clipped = np.minimum(bars, last_bar)
+        high_window = upper[clipped]
+        low_window = high_window if lower is upper else lower[clipped]
+        
+        hit = (((high_window >= take_profit[pending, None]) |
+                (low_window <= stop_loss[pending, None])) &
+               (bars < end_bars[pending, None]))
+        found = hit.any(axis=1)
+        first = hit.argmax(axis=1)
+        result[pending[found]] = bars[found, first[found]]
+        
+        exhausted = start_bars[pending] + offset + width >= end_bars[pending]
+        pending = pending[~(found | exhausted)]
+        offset += width
+        width *= 2
+    
+    return result
+
+
+# ----------------------------------------------------------------------------
+# Exit SL/TP dan mark-to-market equity curve
+# ----------------------------------------------------------------------------
+
+class ExitResolver:
+    """
+    Resolusi exit SL/TP untuk satu dataset, dipakai event loop dan engine
+    vectorized sehingga keduanya identik.
+    
+    exit_model 'close': SL/TP dicek terhadap close, TP didahulukan, fill di
+    level SL/TP (perilaku asli).
+    
+    exit_model 'high_low': touch intrabar dengan aturan fill deterministik:
+    1. open >= TP (gap up)          -> Take Profit, fill di open
+    2. min(open, low) <= SL         -> Stop Loss, fill di min(open, SL)
+    3. max(open, high) >= TP        -> Take Profit, fill di TP
+    Jika SL dan TP sama-sama tersentuh di dalam satu bar, SL dianggap lebih
+    dulu (konservatif).
+    """
+    
+    MODELS = EXIT_MODELS
+    
+    def __init__(self, data: pd.DataFrame, exit_model: str = 'close'):
+        if exit_model not in self.MODELS:
+            raise ValueError(f"Unknown exit_model: {exit_model!r}. Use one of {self.MODELS}")
+        self.exit_model = exit_model
+        self.close = data['close'].to_numpy(dtype=float)
+        if exit_model == 'high_low':
+            self.open = data['open'].to_numpy(dtype=float)
+            self.upper = np.fmax(self.open, data['high'].to_numpy(dtype=float))
+            self.lower = np.fmin(self.open, data['low'].to_numpy(dtype=float))
+        else:
+            self.open = self.upper = self.lower = self.close
+    
+    def first_touch(self, start_bars: np.ndarray, end_bars: np.ndarray,
+                    stop_loss: np.ndarray, take_profit: np.ndarray) -> np.ndarray:
+        """Bar pertama di [start, end) yang menyentuh SL/TP, -1 jika tidak ada"""
+        return find_first_touch(self.close, start_bars, end_bars, stop_loss, take_profit,
+                                upper=self.upper, lower=self.lower)
+    
+    def fill(self, idx: int, stop_loss: float,
+             take_profit: float) -> Optional[Tuple[float, str]]:
+        """(harga fill, exit reason) di bar idx, None jika tidak tersentuh"""
+        return resolve_exit(self.exit_model, stop_loss, take_profit, self.open[idx],
+                            self.upper[idx], self.lower[idx], self.close[idx])
+
+
+def resolve_exit(exit_model: str, stop_loss: float, take_profit: float,
+                 open_: float, high: float, low: float,
+                 close: float) -> Optional[Tuple[float, str]]:
+    """Aturan fill SL/TP untuk satu bar (lihat ExitResolver)"""
+    
+    if exit_model == 'high_low':
+        if open_ >= take_profit:
+            return open_, "Take Profit Hit"
+        if min(open_, low) <= stop_loss:
+            return min(open_, stop_loss), "Stop Loss Hit"
+        if max(open_, high) >= take_profit:
+            return take_profit, "Take Profit Hit"
+        return None
+    
+    if close >= take_profit:
+        return take_profit, "Take Profit Hit"
+    if close <= stop_loss:
+        return stop_loss, "Stop Loss Hit"
+    return None
+
+
+class EquityCurve:
+    """
+    Mark-to-market equity per bar
+    
+    Posisi terbuka disimpan sebagai running sum quantity per symbol plus
+    running market value (quantity * harga mark terakhir, semua symbol),
+    di-update O(1) saat trade dibuka/ditutup dan saat satu symbol di-mark
+    (symbol yang flat dihapus). mark() menghitung equity = balance + market
+    value, meng-update running peak/drawdown dan menyimpan equity ke array
+    numpy yang tumbuh 2x saat penuh (record=False: hanya running
+    peak/drawdown).
+    """
+    
+    def __init__(self, start_equity: float, record: bool = True, capacity: int = 4096):
+        self.record = record
+        self.values = np.empty(capacity if record else 0, dtype=np.float64)
+        self.length = 0
+        
+        self.quantity: Dict[str, float] = {}
+        self.prices: Dict[str, float] = {}
+        self.market_value = 0.0
+        
+        self.equity = start_equity
+        self.peak = start_equity
+        self.max_drawdown = 0.0
+    
+    def open_position(self, symbol: str, quantity: float, price: float) -> None:
+        self.quantity[symbol] = self.quantity.get(symbol, 0.0) + quantity
+        self.market_value += quantity * self.prices.setdefault(symbol, price)
+    
+    def close_position(self, symbol: str, quantity: float, flat: bool = False) -> None:
+        """Kurangi posisi; flat=True (tidak ada trade terbuka lagi) hapus symbol"""
+        if flat:
+            quantity = self.quantity.pop(symbol, 0.0)
+        else:
+            self.quantity[symbol] -= quantity
+        if self.quantity:
+            self.market_value -= quantity * self.prices[symbol]
+        else:
+            self.market_value = 0.0
+    
+    def set_price(self, symbol: str, price: float) -> None:
+        """Update harga mark symbol (dan market value) tanpa menambah titik ke curve"""
+        price = float(price)
+        held = self.quantity.get(symbol)
+        if held is not None:
+            if len(self.quantity) == 1:
+                # Satu symbol: dihitung ulang, error float tidak terakumulasi
+                self.market_value = held * price
+            else:
+                self.market_value += held * (price - self.prices[symbol])
+        self.prices[symbol] = price
+    
+    def value(self, balance: float) -> float:
+        """Equity pada harga mark terakhir tanpa menambah titik ke curve"""
+        return balance + self.market_value if self.quantity else balance
+    
+    def mark(self, symbol: str, price: float, balance: float) -> float:
+        """Mark satu bar: update harga, equity, peak dan drawdown"""
+        
+        # float Python: aritmetika scalar numpy jauh lebih lambat di hot path
+        price = float(price)
+        if self.quantity:
+            self.set_price(symbol, price)
+            equity = float(balance + self.market_value)
+        else:
+            self.prices[symbol] = price
+            equity = float(balance)
+        
+        self.equity = equity
+        peak = self.peak
+        if equity > peak:
+            self.peak = equity
+        elif peak > 0:
+            drawdown = (peak - equity) / peak
+            if drawdown > self.max_drawdown:
+                self.max_drawdown = drawdown
+        
+        if self.record:
+            length = self.length
+            if length == len(self.values):
+                self._grow(length + 1)
+            self.values[length] = equity
+            self.length = length + 1
+        return equity
+    
+    def extend(self, equity: np.ndarray) -> None:
+        """Tambah banyak bar sekaligus (backtest vectorized), hasil sama dengan mark() per bar"""
+        
+        if len(equity) == 0:
+            return
+        peak = np.maximum.accumulate(equity)
+        np.maximum(peak, self.peak, out=peak)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            drawdown = np.where(peak > 0, (peak - equity) / peak, 0.0)
+        
+        self.equity = float(equity[-1])
+        self.peak = float(peak[-1])
+        self.max_drawdown = max(self.max_drawdown, float(drawdown.max()))
+        
+        if self.record:
+            end = self.length + len(equity)
+            if end > len(self.values):
+                self._grow(end)
+            self.values[self.length:end] = equity
+            self.length = end
+    
+    def _grow(self, needed: int) -> None:
+        values = np.empty(max(needed, 2 * len(self.values), 1024), dtype=np.float64)
+        values[:self.length] = self.values[:self.length]
+        self.values = values
+    
+    @property
+    def drawdown(self) -> float:
+        """Drawdown sekarang sebagai fraksi dari peak"""
+        return (self.peak - self.equity) / self.peak if self.peak > 0 else 0.0
+    
+    @property
+    def curve(self) -> np.ndarray:
+        """View (tanpa copy) equity per bar yang sudah di-mark"""
+        return self.values[:self.length]
+    
+    def stats(self, periods_per_year: float = 252, risk_free: float = 0.0) -> Dict:
+        return equity_stats(self.curve, periods_per_year, risk_free)
+    
+    def get_state(self) -> Dict:
+        """State untuk checkpoint (curve berupa view, append-only)"""
+        return {
+            'curve': self.curve,
+            'quantity': dict(self.quantity),
+            'prices': dict(self.prices),
+            'equity': self.equity,
+            'peak': self.peak,
+            'max_drawdown': self.max_drawdown,
+        }
+    
+    def set_state(self, state: Dict) -> None:
+        curve = state['curve']
+        self.length = 0
+        if self.record:
+            self.values = np.empty(max(1024, 2 * len(curve)), dtype=np.float64)
+            self.values[:len(curve)] = curve
+            self.length = len(curve)
+        self.quantity = dict(state['quantity'])
+        self.prices = dict(state['prices'])
+        self.market_value = sum(quantity * self.prices[symbol]
+                                for symbol, quantity in self.quantity.items())
+        for name in ('equity', 'peak', 'max_drawdown'):
+            setattr(self, name, state[name])
+
+
+def equity_stats(equity: np.ndarray, periods_per_year: float = 252,
+                 risk_free: float = 0.0) -> Dict:
+    """
+    Statistik risk dari equity per bar (vectorized)
+    
+    Return per bar = perubahan equity relatif; sharpe/sortino di-annualize
+    dengan sqrt(periods_per_year), risk_free per tahun. Durasi drawdown
+    dalam jumlah bar sejak peak terakhir.
+    """
+    
+    equity = np.asarray(equity, dtype=np.float64)
+    if len(equity) < 2:
+        return {'bars': len(equity), 'total_return': 0.0, 'sharpe': 0.0, 'sortino': 0.0,
+                'volatility': 0.0, 'max_drawdown': 0.0, 'max_drawdown_duration': 0,
+                'current_drawdown_duration': 0, 'time_under_water': 0.0}
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        returns = np.diff(equity) / equity[:-1]
+    returns = returns[np.isfinite(returns)]
+    excess = returns - risk_free / periods_per_year
+    scale = np.sqrt(periods_per_year)
+    
+    std = excess.std(ddof=1) if len(excess) > 1 else 0.0
+    downside = np.sqrt(np.mean(np.minimum(excess, 0.0) ** 2)) if len(excess) else 0.0
+    mean = excess.mean() if len(excess) else 0.0
+    
+    peak = np.maximum.accumulate(equity)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        drawdown = np.where(peak > 0, (peak - equity) / peak, 0.0)
+    
+    # Bar peak terakhir untuk setiap posisi -> lama di bawah peak
+    positions = np.arange(len(equity))
+    last_peak = np.maximum.accumulate(np.where(equity >= peak, positions, 0))
+    duration = positions - last_peak
+    
+    return {
+        'bars': len(equity),
+        'total_return': float(equity[-1] / equity[0] - 1) if equity[0] else 0.0,
+        'sharpe': float(mean / std * scale) if std > 0 else 0.0,
+        'sortino': float(mean / downside * scale) if downside > 0 else 0.0,
+        'volatility': float(std * scale),
+        'max_drawdown': float(drawdown.max()),
+        'max_drawdown_duration': int(duration.max()),
+        'current_drawdown_duration': int(duration[-1]),
+        'time_under_water': float(np.mean(duration > 0)),
+    }
+
+
+# ----------------------------------------------------------------------------
+# Instrumentation: latency histogram per stage process_candle
+# ----------------------------------------------------------------------------
+
+class LatencyHistogram:
+    """
+    Histogram latency (nanoseconds) dengan bucket log-linear tetap
+    
+    Setiap octave dibagi 2**SUB_BITS bucket (error relatif <= 12.5%).
+    record() hanya increment elemen list tanpa lock: satu writer (thread
+    bot), reader mengambil snapshot tanpa menghentikan writer.
+    """
+    
+    SUB_BITS = 3
+    SUB_MASK = (1 << SUB_BITS) - 1
+    BUCKETS = 64 << SUB_BITS
+    
+    def __init__(self):
+        self.counts = [0] * self.BUCKETS
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+    
+    def record(self, ns: int) -> None:
+        # Literal 3/7/4 = SUB_BITS/SUB_MASK/SUB_BITS+1 (hot path)
+        if ns < 8:
+            index = ns
+        else:
+            shift = ns.bit_length() - 4
+            index = ((shift + 1) << 3) | ((ns >> shift) & 7)
+        self.counts[index] += 1
+        self.count += 1
+        self.total_ns += ns
+        if ns > self.max_ns:
+            self.max_ns = ns
+    
+    @classmethod
+    def bucket_bounds(cls, index: int) -> Tuple[int, int]:
+        """Range [lower, upper) nanoseconds untuk bucket index"""
+        if index <= cls.SUB_MASK:
+            return index, index + 1
+        shift = (index >> cls.SUB_BITS) - 1
+        mantissa = (1 << cls.SUB_BITS) | (index & cls.SUB_MASK)
+        return mantissa << shift, (mantissa + 1) << shift
+    
+    def percentile(self, q: float, counts: Optional[List[int]] = None) -> float:
+        """Percentile (0-100) dalam nanoseconds, titik tengah bucket"""
+        counts = counts if counts is not None else list(self.counts)
+        total = sum(counts)
+        if total == 0:
+            return 0.0
+        rank = max(1, int(np.ceil(total * q / 100)))
+        seen = 0
+        for index, c in enumerate(counts):
+            seen += c
+            if seen >= rank:
+                lower, upper = self.bucket_bounds(index)
+                return min((lower + upper) / 2, self.max_ns)
+        return float(self.max_ns)
+    
+    def snapshot(self) -> Dict:
+        counts = list(self.counts)
+        count = sum(counts)
+        return {
+            'count': count,
+            'mean_us': self.total_ns / count / 1e3 if count else 0.0,
+            'p50_us': self.percentile(50, counts) / 1e3,
+            'p99_us': self.percentile(99, counts) / 1e3,
+            'p999_us': self.percentile(99.9, counts) / 1e3,
+            'max_us': self.max_ns / 1e3,
+        }
+
+
+class BotMetrics:
+    """
+    Timing per stage + counter signal/order untuk TradingBot
+    
+    Stage: check_open_trades, generate_signal, validate_signal,
+    stop_loss_take_profit, position_size, order, process_candle (total).
+    """
+    
+    STAGES = ('check_open_trades', 'generate_signal', 'validate_signal',
+              'stop_loss_take_profit', 'position_size', 'order', 'process_candle')
+    
+    def __init__(self):
+        self.stages: Dict[str, LatencyHistogram] = {name: LatencyHistogram()
+                                                    for name in self.STAGES}
+        self.signals: Dict[str, int] = {'BUY': 0, 'SELL': 0, 'HOLD': 0}
+        self.orders: Dict[str, int] = {status.value: 0 for status in OrderStatus}
+    
+    def record(self, stage: str, ns: int) -> None:
+        self.stages[stage].record(ns)
+    
+    def count_signal(self, action: str) -> None:
+        self.signals[action] = self.signals.get(action, 0) + 1
+    
+    def count_order(self, status: 'OrderStatus') -> None:
+        self.orders[status.value] += 1
+    
+    def reset(self) -> None:
+        self.__init__()
+    
+    def snapshot(self) -> Dict:
+        """Snapshot JSON-serializable"""
+        return {
+            'stages': {name: hist.snapshot() for name, hist in self.stages.items()},
+            'signals': dict(self.signals),
+            'orders': dict(self.orders),
+        }
+    
+    def to_json(self) -> str:
+        return json.dumps(self.snapshot(), indent=2)
+    
+    def to_prometheus(self, prefix: str = 'trading_bot', labels: str = '') -> str:
+        """
+        Export format Prometheus text exposition (summary + counter)
+        
+        labels: label tambahan untuk semua sample, mis. 'symbol="BTC/USD"'
+        """
+        
+        extra = f",{labels}" if labels else ''
+        lines = [
+            f"# HELP {prefix}_stage_latency_seconds process_candle stage latency",
+            f"# TYPE {prefix}_stage_latency_seconds summary",
+        ]
+        for name, hist in self.stages.items():
+            counts = list(hist.counts)
+            for q in (0.5, 0.99, 0.999):
+                value = hist.percentile(q * 100, counts) / 1e9
+                lines.append(f'{prefix}_stage_latency_seconds{{stage="{name}",'
+                             f'quantile="{q}"{extra}}} {value:.9f}')
+            lines.append(f'{prefix}_stage_latency_seconds_sum{{stage="{name}"{extra}}} '
+                         f'{hist.total_ns / 1e9:.9f}')
+            lines.append(f'{prefix}_stage_latency_seconds_count{{stage="{name}"{extra}}} '
+                         f'{sum(counts)}')
+        
+        lines += [f"# HELP {prefix}_signals_total Signals generated per action",
+                  f"# TYPE {prefix}_signals_total counter"]
+        lines += [f'{prefix}_signals_total{{action="{action}"{extra}}} {n}'
+                  for action, n in self.signals.items()]
+        lines += [f"# HELP {prefix}_orders_total Orders per final status",
+                  f"# TYPE {prefix}_orders_total counter"]
+        lines += [f'{prefix}_orders_total{{status="{status}"{extra}}} {n}'
+                  for status, n in self.orders.items()]
+        return "\n".join(lines) + "\n"
+
+
 class TradingBot:
     """Main Trading Bot Engine"""
     
     def __init__(self, config: BotConfig, strategy: BaseStrategy, 
-                 logger: logging.Logger):
+                 logger: logging.Logger, symbol: str = "BTC/USD"):
+        if config.exit_model not in ExitResolver.MODELS:
+            raise ValueError(f"Unknown exit_model: {config.exit_model!r}. "
+                             f"Use one of {ExitResolver.MODELS}")
+        
         self.config = config
         self.strategy = strategy
         self.logger = logger
+        self.symbol = symbol
         
         self.risk_manager = RiskManager(config, logger)
-        self.order_executor = OrderExecutor(logger)
+        self.events = create_event_log(config.event_log, logger)
+        self.order_executor = OrderExecutor(logger, self.events, config.order_history_size,
+                                            config.order_spill_path or None)
         
         # Account state
         self.balance = config.account_size
         self.equity = config.account_size
         self.peak_equity = config.account_size
+        self.equity_curve = EquityCurve(config.account_size, config.record_equity_curve)
         
         # Trading state
         self.open_trades: Dict[str, Trade] = {}
-        self.closed_trades: List[Trade] = []
+        self.open_trades_by_symbol: Dict[str, Dict[str, Trade]] = {}
+        self.closed_trades = TradeLedger()
         self.trade_counter = 0
         
         # Performance tracking
-        self.daily_trades: List[Trade] = []
+        self.daily_trades = TradeLedger()
         self.daily_pnl = 0.0
+        
+        # Instrumentation (opt-in): None = tidak ada overhead di hot path
+        self.metrics: Optional[BotMetrics] = BotMetrics() if config.collect_metrics else None
+        
+        # (data, action, confidence) dari run_backtest_vectorized terakhir,
+        # dipakai ulang saat backtest dilanjutkan di data yang sama
+        self._signal_arrays: Optional[Tuple[pd.DataFrame, np.ndarray, np.ndarray]] = None
+        
+        # symbol -> (data, ExitResolver) selama run_backtest/run: array
+        # open/high/low dibaca sekali per run, bukan per candle
+        self._exit_resolvers: Dict[str, Tuple[pd.DataFrame, ExitResolver]] = {}
+    
+    def enable_metrics(self) -> 'BotMetrics':
+        """Aktifkan per-stage latency instrumentation"""
+        if self.metrics is None:
+            self.metrics = BotMetrics()
+        return self.metrics
+    
+    def disable_metrics(self) -> None:
+        self.metrics = None
+    
+    def set_event_log(self, events: EventLog) -> None:
+        """Ganti event log bot dan order executor"""
+        self.events = events
+        self.order_executor.events = events
+    
+    # Field Trade yang disimpan di checkpoint (urutan tuple)
+    TRADE_STATE_FIELDS = ('trade_id', 'symbol', 'entry_price', 'entry_time', 'quantity',
+                          'stop_loss', 'take_profit', 'exit_price', 'exit_time', 'exit_reason')
+    
+    def get_state(self, history: bool = True) -> Dict:
+        """
+        Snapshot state bot untuk checkpoint: account, open trades, ledger,
+        order store dan state strategi. Murah (copy scalar dan tuple kecil,
+        kolom ledger berupa view) sehingga bisa dipanggil di antara candle.
+        
+        history=False: state minimal untuk melanjutkan backtest (report
+        tetap sama): tanpa daily_trades, order store hanya order open.
+        """
+        state = {
+            'symbol': self.symbol,
+            'balance': self.balance,
+            'equity': self.equity,
+            'peak_equity': self.peak_equity,
+            'trade_counter': self.trade_counter,
+            'daily_pnl': self.daily_pnl,
+            'open_trades': [tuple(getattr(trade, name) for name in self.TRADE_STATE_FIELDS)
+                            for trade in self.open_trades.values()],
+            'closed_trades': self.closed_trades.get_state(),
+            'order_counter': self.order_executor.order_counter,
+            'orders': self.order_executor.orders.get_state(history),
+            'strategy': self.strategy.get_state() if self.strategy is not None else None,
+            'equity_curve': self.equity_curve.get_state(),
+        }
+        if history:
+            state['daily_trades'] = self.daily_trades.get_state()
+        return state
+    
+    def set_state(self, state: Dict) -> None:
+        """Restore dari get_state() ke bot yang baru dibuat dengan config yang sama"""
+        
+        self.symbol = state['symbol']
+        self.balance = state['balance']
+        self.equity = state['equity']
+        self.peak_equity = state['peak_equity']
+        self.trade_counter = state['trade_counter']
+        self.daily_pnl = state['daily_pnl']
+        
+        self.open_trades = {}
+        self.open_trades_by_symbol = {}
+        for values in state['open_trades']:
+            trade = Trade(**dict(zip(self.TRADE_STATE_FIELDS, values)))
+            self.open_trades[trade.trade_id] = trade
+            self.open_trades_by_symbol.setdefault(trade.symbol, {})[trade.trade_id] = trade
+        
+        self.closed_trades = TradeLedger()
+        self.closed_trades.set_state(state['closed_trades'])
+        self.daily_trades = TradeLedger()
+        if 'daily_trades' in state:
+            self.daily_trades.set_state(state['daily_trades'])
+        
+        self.order_executor.order_counter = state['order_counter']
+        self.order_executor.orders.set_state(state['orders'])
+        
+        if self.strategy is not None and state['strategy'] is not None:
+            self.strategy.set_state(state['strategy'])
+        
+        if 'equity_curve' in state:
+            self.equity_curve.set_state(state['equity_curve'])
+    
+    def get_strategy(self, symbol: str) -> BaseStrategy:
+        """Strategi untuk symbol (single-symbol bot: selalu self.strategy)"""
+        return self.strategy
     
     def process_candle(self, data: pd.DataFrame, current_idx: int, 
-                      current_price: float) -> None:
+                      current_price: float, symbol: Optional[str] = None) -> None:
         """Process new candle and execute trading logic"""
         
+        if self.metrics is not None:
+            self._process_candle_timed(data, current_idx, current_price, symbol)
+            return
+        
+        symbol = symbol or self.symbol
+        strategy = self.get_strategy(symbol)
+        
         # Check for exit conditions on open trades
-        self._check_open_trades(current_price, current_idx, data)
+        self._check_open_trades(current_price, current_idx, data, symbol)
         
         # Generate signal
-        signal = self.strategy.generate_signal(data, current_idx)
+        signal = strategy.generate_signal(data, current_idx)
+        
+        # Validate and execute signal
+        if strategy.validate_signal(signal, self.balance, current_price):
+            if signal['action'] == 'BUY':
+                self._execute_buy_signal(signal, current_price, data, current_idx, symbol)
+            elif signal['action'] == 'SELL':
+                self._execute_sell_signal(signal, current_price, data, current_idx, symbol)
+        
+        # Mark-to-market: equity dan peak ikut unrealized P&L
+        self.equity = self.equity_curve.mark(symbol, current_price, self.balance)
+        self.peak_equity = self.equity_curve.peak
+    
+    def _process_candle_timed(self, data: pd.DataFrame, current_idx: int,
+                              current_price: float, symbol: Optional[str] = None) -> None:
+        """process_candle dengan timing per stage ke self.metrics"""
+        
+        metrics = self.metrics
+        clock = time.perf_counter_ns
+        symbol = symbol or self.symbol
+        strategy = self.get_strategy(symbol)
+        
+        started = clock()
+        self._check_open_trades(current_price, current_idx, data, symbol)
+        checked = clock()
+        signal = strategy.generate_signal(data, current_idx)
+        generated = clock()
+        valid = strategy.validate_signal(signal, self.balance, current_price)
+        validated = clock()
+        
+        metrics.record('check_open_trades', checked - started)
+        metrics.record('generate_signal', generated - checked)
+        metrics.record('validate_signal', validated - generated)
+        metrics.count_signal(signal['action'])
+        
+        if valid:
+            if signal['action'] == 'BUY':
+                self._execute_buy_signal(signal, current_price, data, current_idx, symbol)
+            elif signal['action'] == 'SELL':
+                self._execute_sell_signal(signal, current_price, data, current_idx, symbol)
+        
+        self.equity = self.equity_curve.mark(symbol, current_price, self.balance)
+        self.peak_equity = self.equity_curve.peak
+        metrics.record('process_candle', clock() - started)
+    
+    def run_backtest(self, data: pd.DataFrame, start_idx: int = 200,
+                     end_idx: Optional[int] = None) -> Dict:
+        """
+        Backtest event loop: process_candle untuk setiap bar di [start_idx, end_idx)
         
-        # Validate signal
-        if not self.strategy.validate_signal(signal, self.balance, current_price):
-            return
+        end_idx membatasi backtest ke satu window tanpa slicing data, sehingga
+        indikator full history (INDICATOR_CACHE) tetap dipakai ulang.
+        """
+        
+        self.strategy.prepare(data)
+        close = data['close'].to_numpy()
+        
+        self._bind_exit_resolvers({self.symbol: data})
+        try:
+            for idx in range(start_idx, len(data) if end_idx is None else end_idx):
+                self.process_candle(data, idx, close[idx])
+        finally:
+            self._exit_resolvers.clear()
         
-        # Execute signal
-        if signal['action'] == 'BUY':
-            self._execute_buy_signal(signal, current_price, data, current_idx)
-        elif signal['action'] == 'SELL':
-            self._execute_sell_signal(signal, current_price, data, current_idx)
+        report = self.get_overall_report()
+        if self.config.results_db and end_idx is None:
+            self.save_results(report, start_idx=start_idx, end_idx=len(data))
+        return report
+    
+    def run_backtest_vectorized(self, data: pd.DataFrame, start_idx: int = 200,
+                                end_idx: Optional[int] = None) -> Dict:
+        """
+        Backtest vectorized, hasil identik dengan run_backtest
+        
+        Signal entry/exit dan level SL/TP dihitung sebagai array untuk seluruh
+        data, lalu bar exit SL/TP dicari dengan ExitResolver.first_touch
+        (close atau high/low sesuai config.exit_model). Loop Python hanya
+        berjalan per event (entry, SL/TP hit, sell signal), bukan per
+        candle; eksekusi tetap lewat _execute_buy_signal dan _close_trade
+        sehingga balance, equity dan closed_trades sama persis. end_idx sama
+        dengan run_backtest: scan SL/TP berhenti di akhir window, dan backtest
+        bisa dilanjutkan dari end_idx dengan trade yang masih terbuka.
+        """
+        
+        n = len(data)
+        end = n if end_idx is None else min(end_idx, n)
+        close = data['close'].to_numpy()
+        resolver = ExitResolver(data, self.config.exit_model)
+        
+        self.strategy.prepare(data)
+        cached = self._signal_arrays
+        if cached is not None and cached[0] is data and len(cached[1]) == n:
+            _, action, confidence = cached
+        else:
+            action, confidence = self.strategy.generate_signal_arrays(data)
+            self._signal_arrays = (data, action, confidence)
+        action = action[:end].copy()
+        action[:start_idx] = 0
+        
+        # next_sell[k] = bar SELL pertama >= k, end jika tidak ada
+        next_sell = np.where(action == -1, np.arange(end), end)
+        next_sell = np.append(np.minimum.accumulate(next_sell[::-1])[::-1], end)
+        
+        # Bar SL/TP hit untuk setiap kandidat entry, sampai SELL berikutnya
+        buy_bars = np.flatnonzero(action == 1)
+        stop_loss, take_profit = self.strategy.calculate_stop_loss_take_profit_arrays(
+            close[buy_bars], data, buy_bars
+        )
+        touch_bars = resolver.first_touch(
+            buy_bars + 1, np.minimum(next_sell[buy_bars + 1] + 1, end),
+            stop_loss, take_profit
+        )
+        
+        touches: List[Tuple[int, int, str]] = []  # heap (bar, trade_counter, trade_id)
+        unresolved: Dict[str, int] = {}  # trade tanpa SL/TP hit sebelum SELL berikutnya
+        pos = 0
+        idx = start_idx
+        
+        # Trade yang masih terbuka dari backtest/checkpoint sebelumnya: scan
+        # SL/TP mulai start_idx, urutan sama dengan open_trades_by_symbol
+        carried = list(self.open_trades_by_symbol.get(self.symbol, {}).values())
+        if carried and start_idx < end:
+            found = resolver.first_touch(
+                np.full(len(carried), start_idx),
+                np.full(len(carried), min(next_sell[start_idx] + 1, end)),
+                np.array([t.stop_loss for t in carried], dtype=float),
+                np.array([t.take_profit for t in carried], dtype=float)
+            )
+            for order, (trade, touch_bar) in enumerate(zip(carried, found)):
+                if touch_bar >= 0:
+                    heapq.heappush(touches, (touch_bar, order, trade.trade_id))
+                else:
+                    unresolved[trade.trade_id] = order
+        
+        # (bar, balance, quantity) setelah setiap bar event, untuk equity curve
+        curve = self.equity_curve
+        symbol = self.symbol
+        marks: List[Tuple[int, float, float]] = [(start_idx - 1, self.balance,
+                                                  curve.quantity.get(symbol, 0.0))]
+        
+        while True:
+            next_entry = buy_bars[pos] if pos < len(buy_bars) else end
+            next_touch = touches[0][0] if touches else end
+            next_exit = next_sell[idx] if self.open_trades else end
+            idx = min(next_entry, next_touch, next_exit)
+            if idx >= end:
+                break
+            
+            current_price = close[idx]
+            
+            # SL/TP hits, urutan sama dengan _check_open_trades
+            while touches and touches[0][0] == idx:
+                _, _, trade_id = heapq.heappop(touches)
+                trade = self.open_trades.get(trade_id)
+                if trade is None:
+                    continue  # sudah ditutup oleh sell signal
+                self._close_trade(trade_id, *resolver.fill(idx, trade.stop_loss,
+                                                           trade.take_profit))
+            
+            if action[idx] != 0:
+                signal = self.strategy.signal_from_arrays(data, idx, action, confidence)
+                
+                if self.strategy.validate_signal(signal, self.balance, current_price):
+                    if signal['action'] == 'BUY':
+                        trade_counter = self.trade_counter
+                        self._execute_buy_signal(signal, current_price, data, idx)
+                        
+                        if self.trade_counter != trade_counter:
+                            trade_id = f"TRADE_{self.trade_counter}"
+                            if touch_bars[pos] >= 0:
+                                heapq.heappush(touches, (touch_bars[pos], self.trade_counter, trade_id))
+                            else:
+                                unresolved[trade_id] = self.trade_counter
+                    
+                    elif signal['action'] == 'SELL':
+                        self._execute_sell_signal(signal, current_price, data, idx)
+                        unresolved.clear()
+                
+                elif action[idx] == -1 and unresolved:
+                    # SELL ditolak: lanjutkan pencarian SL/TP sampai SELL berikutnya
+                    trade_ids = list(unresolved)
+                    trades = [self.open_trades[trade_id] for trade_id in trade_ids]
+                    found = resolver.first_touch(
+                        np.full(len(trades), idx + 1),
+                        np.full(len(trades), min(next_sell[idx + 1] + 1, end)),
+                        np.array([t.stop_loss for t in trades], dtype=float),
+                        np.array([t.take_profit for t in trades], dtype=float)
+                    )
+                    for trade_id, touch_bar in zip(trade_ids, found):
+                        if touch_bar >= 0:
+                            heapq.heappush(touches, (touch_bar, unresolved.pop(trade_id), trade_id))
+            
+            marks.append((idx, self.balance, curve.quantity.get(symbol, 0.0)))
+            if next_entry == idx:
+                pos += 1
+            idx += 1
+        
+        if end > start_idx:
+            # last_signal = signal bar terakhir, sama dengan event loop
+            self.strategy.signal_from_arrays(data, end - 1, action, confidence)
+            self._mark_bars(close[:end], start_idx, marks)
+        
+        report = self.get_overall_report()
+        if self.config.results_db and end_idx is None:
+            self.save_results(report, start_idx=start_idx, end_idx=n)
+        return report
+    
+    def _mark_bars(self, close: np.ndarray, start_idx: int,
+                   marks: List[Tuple[int, float, float]]) -> None:
+        """Equity curve bar start_idx..n-1: balance/quantity bar event terakhir x close"""
+        
+        bars, balance, quantity = (np.array(column) for column in zip(*marks))
+        latest = np.searchsorted(bars, np.arange(start_idx, len(close)), side='right') - 1
+        balance, quantity = balance[latest], quantity[latest]
+        equity = np.where(quantity != 0, balance + quantity * close[start_idx:], balance)
+        
+        curve = self.equity_curve
+        curve.extend(equity)
+        curve.set_price(self.symbol, close[-1])
+        self.equity = curve.equity
+        self.peak_equity = curve.peak
     
     def _execute_buy_signal(self, signal: Dict, current_price: float,
-                           data: pd.DataFrame, current_idx: int) -> None:
+                           data: pd.DataFrame, current_idx: int,
+                           symbol: Optional[str] = None) -> None:
         """Execute buy signal"""
         
+        symbol = symbol or self.symbol
+        metrics = self.metrics
+        if metrics is not None:
+            started = time.perf_counter_ns()
+        
         # Calculate SL & TP
-        stop_loss, take_profit = self.strategy.calculate_stop_loss_take_profit(
+        stop_loss, take_profit = self.get_strategy(symbol).calculate_stop_loss_take_profit(
             current_price, data, current_idx
         )
+        if metrics is not None:
+            levels_done = time.perf_counter_ns()
+            metrics.record('stop_loss_take_profit', levels_done - started)
         
         # Calculate position size
         position_size = self.risk_manager.calculate_position_size(
             self.balance, current_price, stop_loss
         )
+        if metrics is not None:
+            sized = time.perf_counter_ns()
+            metrics.record('position_size', sized - levels_done)
         
         if position_size <= 0:
             self.logger.warning("Invalid position size, skipping trade")
+            if metrics is not None:
+                metrics.count_order(OrderStatus.REJECTED)
             return
         
         # Check if we have sufficient balance
         required_balance = position_size * current_price
         if required_balance > self.balance:
-            self.logger.warning(f"Insufficient balance: {required_balance:.2f} > {self.balance:.2f}")
+            self.logger.warning("Insufficient balance: %.2f > %.2f", required_balance, self.balance)
+            if metrics is not None:
+                metrics.count_order(OrderStatus.REJECTED)
             return
         
         # Create trade
         self.trade_counter += 1
         trade = Trade(
             trade_id=f"TRADE_{self.trade_counter}",
-            symbol="BTC/USD",  # Replace with actual symbol
+            symbol=symbol,
             entry_price=current_price,
             entry_time=datetime.now(),
             quantity=position_size,
@@ -662,35 +3218,69 @@ class TradingBot:
         
         # Fill order immediately (market order)
         self.order_executor.fill_order(order.order_id, current_price, position_size)
+        if metrics is not None:
+            metrics.record('order', time.perf_counter_ns() - sized)
+            metrics.count_order(order.status)
         
         # Add to open trades
         self.open_trades[trade.trade_id] = trade
+        self.open_trades_by_symbol.setdefault(symbol, {})[trade.trade_id] = trade
         
         # Update balance
         self.balance -= required_balance
+        self.equity_curve.open_position(symbol, position_size, current_price)
         
-        self.logger.info(
-            f"BUY Trade Opened: {trade.trade_id}\n"
-            f"  Entry: {current_price:.2f}\n"
-            f"  SL: {stop_loss:.2f}\n"
-            f"  TP: {take_profit:.2f}\n"
-            f"  Size: {position_size:.4f}\n"
-            f"  Signal: {signal['reason']}"
-        )
+        self.events.emit('trade_opened', trade.trade_id, symbol, current_price,
+                         stop_loss, take_profit, position_size, signal['reason'])
     
     def _execute_sell_signal(self, signal: Dict, current_price: float,
-                            data: pd.DataFrame, current_idx: int) -> None:
+                            data: pd.DataFrame, current_idx: int,
+                            symbol: Optional[str] = None) -> None:
         """Execute sell signal - usually closes open positions"""
         
-        # Close all open trades
-        for trade_id, trade in list(self.open_trades.items()):
+        symbol = symbol or self.symbol
+        
+        # Close all open trades for this symbol
+        for trade_id in list(self.open_trades_by_symbol.get(symbol, ())):
             self._close_trade(trade_id, current_price, "Sell Signal")
     
+    def _bind_exit_resolvers(self, frames: Dict[str, pd.DataFrame]) -> None:
+        """Siapkan ExitResolver per symbol untuk _check_open_trades (exit_model non-close)"""
+        
+        self._exit_resolvers.clear()
+        if self.config.exit_model != 'close':
+            for symbol, data in frames.items():
+                self._exit_resolvers[symbol] = (data, ExitResolver(data, self.config.exit_model))
+    
     def _check_open_trades(self, current_price: float, current_idx: int,
-                          data: pd.DataFrame) -> None:
+                          data: pd.DataFrame, symbol: Optional[str] = None) -> None:
         """Check open trades for SL/TP hits"""
         
-        for trade_id, trade in list(self.open_trades.items()):
+        symbol = symbol or self.symbol
+        
+        symbol_trades = self.open_trades_by_symbol.get(symbol)
+        if not symbol_trades:
+            return
+        
+        if self.config.exit_model != 'close':
+            cached = self._exit_resolvers.get(symbol)
+            if cached is not None and cached[0] is data:
+                resolver = cached[1]
+                bar = (resolver.open[current_idx], resolver.upper[current_idx],
+                       resolver.lower[current_idx], current_price)
+            else:
+                # Di luar run_backtest (live) frame bisa di-mutate in place,
+                # jadi bar dibaca langsung dari data
+                bar = (data['open'].to_numpy()[current_idx], data['high'].to_numpy()[current_idx],
+                       data['low'].to_numpy()[current_idx], current_price)
+            for trade_id, trade in list(symbol_trades.items()):
+                fill = resolve_exit(self.config.exit_model, trade.stop_loss,
+                                    trade.take_profit, *bar)
+                if fill is not None:
+                    self._close_trade(trade_id, *fill)
+            return
+        
+        for trade_id, trade in list(symbol_trades.items()):
             # Check Take Profit
             if current_price >= trade.take_profit:
                 self._close_trade(trade_id, trade.take_profit, "Take Profit Hit")
@@ -704,7 +3294,7 @@ class TradingBot:
         """Close an open trade"""
         
         if trade_id not in self.open_trades:
-            self.logger.error(f"Trade not found: {trade_id}")
+            self.logger.error("Trade not found: %s", trade_id)
             return
         
         trade = self.open_trades[trade_id]
@@ -715,31 +3305,49 @@ class TradingBot:
         trade.exit_reason = exit_reason
         
         pnl = trade.pnl
-        pnl_percent = trade.pnl_percent
         
-        # Update balance
-        self.balance += (trade.quantity * exit_price) + pnl
+        # Update balance: proceeds qty * exit sudah termasuk P&L
+        self.balance += trade.quantity * exit_price
         
         # Move to closed trades
         del self.open_trades[trade_id]
+        del self.open_trades_by_symbol[trade.symbol][trade_id]
         self.closed_trades.append(trade)
         self.daily_trades.append(trade)
         self.daily_pnl += pnl
         
-        # Update equity
-        self.equity = self.balance + sum(t.quantity * (exit_price if t.exit_price else 0) 
-                                         for t in self.open_trades.values())
+        # Update equity (harga mark terakhir; peak di-update per bar oleh process_candle)
+        self.equity_curve.close_position(trade.symbol, trade.quantity,
+                                         flat=not self.open_trades_by_symbol[trade.symbol])
+        self.equity = self.equity_curve.value(self.balance)
+        
+        self.events.emit('trade_closed', trade_id, trade.symbol, trade.entry_price,
+                         exit_price, exit_reason, trade.stop_loss, trade.quantity,
+                         self.balance)
+    
+    def save_results(self, report: Optional[Dict] = None, store: Optional['ResultsStore'] = None,
+                     kind: str = 'backtest',
+                     label: str = '', start_idx: Optional[int] = None,
+                     end_idx: Optional[int] = None) -> Optional[int]:
+        """
+        Simpan report (dan closed trades jika config.save_trades) ke ResultsStore
         
-        self.peak_equity = max(self.peak_equity, self.equity)
+        store default: config.results_db. run_backtest/run_backtest_vectorized
+        memanggil ini otomatis untuk backtest full (tanpa end_idx) jika
+        results_db diisi. Return run_id, None jika tidak ada store.
+        """
         
-        self.logger.info(
-            f"Trade Closed: {trade_id}\n"
-            f"  Entry: {trade.entry_price:.2f}\n"
-            f"  Exit: {exit_price:.2f} ({exit_reason})\n"
-            f"  P&L: {pnl:.2f} ({pnl_percent:.2f}%)\n"
-            f"  RR Ratio: {trade.risk_reward_actual:.2f}\n"
-            f"  Balance: {self.balance:.2f}"
-        )
+        if store is None:
+            if not self.config.results_db:
+                return None
+            # Import di sini: sqlite hanya di-load jika results_db dipakai
+            from results_store import ResultsStore
+            with ResultsStore(self.config.results_db) as owned:
+                return self.save_results(report, owned, kind, label, start_idx, end_idx)
+        
+        return store.add_run(self.config, report or self.get_overall_report(), kind, label,
+                             self.symbol or None, start_idx, end_idx,
+                             self.closed_trades if self.config.save_trades else None)
     
     def get_daily_report(self) -> Dict:
         """Get daily performance report"""
@@ -755,8 +3363,8 @@ class TradingBot:
                 'daily_pnl_percent': 0.0
             }
         
-        wins = sum(1 for t in self.daily_trades if t.is_win)
-        losses = len(self.daily_trades) - wins
+        wins = self.daily_trades.wins
+        losses = self.daily_trades.losses
         
         return {
             'date': datetime.now().strftime('%Y-%m-%d'),
@@ -790,28 +3398,31 @@ class TradingBot:
                 'max_drawdown': 0.0
             }
         
-        wins = [t for t in self.closed_trades if t.is_win]
-        losses = [t for t in self.closed_trades if not t.is_win]
+        # Statistik running dari ledger, O(1)
+        ledger = self.closed_trades
+        wins = ledger.wins
+        losses = ledger.losses
         
-        total_pnl = sum(t.pnl for t in self.closed_trades)
-        gross_profit = sum(t.pnl for t in wins) if wins else 0
-        gross_loss = abs(sum(t.pnl for t in losses)) if losses else 0
+        total_pnl = ledger.total_pnl
+        gross_profit = ledger.gross_profit
+        gross_loss = abs(ledger.gross_loss)
         
         profit_factor = gross_profit / gross_loss if gross_loss > 0 else 0.0
         
-        avg_win = (gross_profit / len(wins)) if wins else 0.0
-        avg_loss = -(gross_loss / len(losses)) if losses else 0.0
+        avg_win = (gross_profit / wins) if wins else 0.0
+        avg_loss = -(gross_loss / losses) if losses else 0.0
         
-        max_win = max([t.pnl for t in wins]) if wins else 0.0
-        max_loss = min([t.pnl for t in losses]) if losses else 0.0
+        max_win = ledger.max_win if wins else 0.0
+        max_loss = ledger.max_loss if losses else 0.0
         
-        max_drawdown = (self.peak_equity - self.equity) / self.peak_equity if self.peak_equity > 0 else 0.0
+        # Max drawdown dari equity mark-to-market per bar (termasuk unrealized P&L)
+        max_drawdown = self.equity_curve.max_drawdown
         
         return {
             'total_trades': len(self.closed_trades),
-            'wins': len(wins),
-            'losses': len(losses),
-            'win_rate': (len(wins) / len(self.closed_trades)) * 100,
+            'wins': wins,
+            'losses': losses,
+            'win_rate': (wins / len(self.closed_trades)) * 100,
             'profit_factor': profit_factor,
             'total_pnl': total_pnl,
             'total_pnl_percent': (total_pnl / self.config.account_size) * 100,
@@ -826,7 +3437,138 @@ class TradingBot:
 
 
 # ============================================================================
-# 8. EXAMPLE USAGE
+# 8. PORTFOLIO ENGINE (MULTI-SYMBOL)
+# ============================================================================
+
+class SymbolState:
+    """State per symbol: data, strategi (dengan indikator ter-prepare) dan close"""
+    
+    __slots__ = ('symbol', 'data', 'strategy', 'close', 'timestamps')
+    
+    def __init__(self, symbol: str, data: pd.DataFrame, strategy: BaseStrategy):
+        self.symbol = symbol
+        self.data = data
+        self.strategy = strategy
+        self.close = data['close'].to_numpy()
+        
+        if 'timestamp' in data.columns:
+            self.timestamps = pd.to_datetime(data['timestamp']).to_numpy().view(np.int64)
+        else:
+            self.timestamps = np.arange(len(data), dtype=np.int64)
+
+
+class PortfolioEngine(TradingBot):
+    """
+    Multi-symbol engine: satu balance dan satu RiskManager untuk banyak symbol
+    
+    Setiap symbol punya strategi sendiri (indikator di-prepare sekali per
+    symbol), semua candle diproses berurutan menurut timestamp lewat
+    heap merge. Symbol dengan timestamp sama diproses sesuai urutan add_symbol.
+    """
+    
+    def __init__(self, config: BotConfig, logger: logging.Logger):
+        super().__init__(config, None, logger, symbol="")
+        self.symbols: Dict[str, SymbolState] = {}
+    
+    def add_symbol(self, symbol: str, data: pd.DataFrame,
+                   strategy: Optional[BaseStrategy] = None) -> None:
+        """Tambah symbol beserta data OHLCV (dan strategi opsional)"""
+        
+        if symbol in self.symbols:
+            raise ValueError(f"Symbol already added: {symbol}")
+        strategy = strategy or create_strategy(self.config, self.logger)
+        self.symbols[symbol] = SymbolState(symbol, data, strategy)
+    
+    def get_strategy(self, symbol: str) -> BaseStrategy:
+        return self.symbols[symbol].strategy
+    
+    def run_backtest(self, data: Union[pd.DataFrame, Dict[str, pd.DataFrame], None] = None,
+                     start_idx: int = 200, end_idx: Optional[int] = None,
+                     symbol: Optional[str] = None) -> Dict:
+        """
+        Entry point TradingBot untuk portfolio: data (dict symbol ->
+        DataFrame, atau satu DataFrame untuk `symbol`) ditambahkan lewat
+        add_symbol jika belum ada, lalu run(start_idx, end_idx)
+        
+        Satu DataFrame tanpa symbol hanya diterima jika engine punya tepat
+        satu symbol (data symbol itu diganti).
+        """
+        
+        if isinstance(data, pd.DataFrame):
+            if symbol is None:
+                if len(self.symbols) != 1:
+                    raise ValueError("Pass symbol= (or a dict symbol -> DataFrame) "
+                                     "when running a PortfolioEngine on a single DataFrame")
+                symbol = next(iter(self.symbols))
+            data = {symbol: data}
+        for symbol, frame in (data or {}).items():
+            if symbol not in self.symbols or self.symbols[symbol].data is not frame:
+                self.symbols.pop(symbol, None)
+                self.add_symbol(symbol, frame)
+        return self.run(start_idx, end_idx)
+    
+    def run_backtest_vectorized(self, data: Union[pd.DataFrame, Dict[str, pd.DataFrame], None] = None,
+                                start_idx: int = 200, end_idx: Optional[int] = None,
+                                symbol: Optional[str] = None) -> Dict:
+        """
+        Sama dengan run_backtest: balance bersama antar symbol membuat urutan
+        candle lintas symbol menentukan hasil, jadi portfolio selalu memakai
+        event loop
+        """
+        return self.run_backtest(data, start_idx, end_idx, symbol)
+    
+    def run(self, start_idx: int = 200, end_idx: Optional[int] = None) -> Dict:
+        """Backtest semua symbol dalam urutan timestamp, bar [start_idx, end_idx) per symbol"""
+        
+        states = list(self.symbols.values())
+        for state in states:
+            state.strategy.prepare(state.data)
+        
+        streams = [
+            zip(state.timestamps[start_idx:end_idx].tolist(), itertools.repeat(order),
+                range(start_idx, len(state.data) if end_idx is None
+                      else min(end_idx, len(state.data))))
+            for order, state in enumerate(states)
+        ]
+        
+        self._bind_exit_resolvers({state.symbol: state.data for state in states})
+        try:
+            for _, order, idx in heapq.merge(*streams):
+                state = states[order]
+                self.process_candle(state.data, idx, state.close[idx], state.symbol)
+        finally:
+            self._exit_resolvers.clear()
+        
+        report = self.get_overall_report()
+        if self.config.results_db and end_idx is None:
+            self.save_results(report, start_idx=start_idx)
+        return report
+    
+    def get_symbol_report(self) -> Dict[str, Dict]:
+        """Ringkasan closed trades per symbol"""
+        
+        report = {symbol: {'trades': 0, 'wins': 0, 'total_pnl': 0.0, 'open_trades': 0}
+                  for symbol in self.symbols}
+        
+        # Agregasi langsung dari kolom ledger, tanpa membuat object Trade
+        ledger = self.closed_trades
+        codes = ledger.column('symbol_code')
+        pnl = ledger.column('pnl')
+        size = len(ledger.symbols)
+        trades = np.bincount(codes, minlength=size)
+        wins = np.bincount(codes, weights=pnl > 0, minlength=size)
+        total_pnl = np.bincount(codes, weights=pnl, minlength=size)
+        for code, symbol in enumerate(ledger.symbols):
+            report[symbol].update(trades=int(trades[code]), wins=int(wins[code]),
+                                  total_pnl=float(total_pnl[code]))
+        
+        for trade in self.open_trades.values():
+            report[trade.symbol]['open_trades'] += 1
+        return report
+
+
+# ============================================================================
+# 9. EXAMPLE USAGE
 # ============================================================================
 
 if __name__ == "__main__":
@@ -847,13 +3589,8 @@ if __name__ == "__main__":
     )
     
     # Create strategy (select via environment variable STRATEGY or config)
-    selected = os.getenv('STRATEGY', config.strategy).lower()
-    if selected in ('mean_reversion', 'meanreversion', 'mean_rev'):
-        strategy = MeanReversionStrategy(config, logger)
-        logger.info('Selected strategy: MeanReversionStrategy')
-    else:
-        strategy = MACrossoverRSIStrategy(config, logger)
-        logger.info('Selected strategy: MACrossoverRSIStrategy')
+    strategy = create_strategy(config, logger, os.getenv('STRATEGY'))
+    logger.info('Selected strategy: %s', type(strategy).__name__)
     
     # Create bot
     bot = TradingBot(config, strategy, logger)
@@ -877,10 +3614,11 @@ if __name__ == "__main__":
     data['high'] = data[['high', 'close']].max(axis=1)
     data['low'] = data[['low', 'close']].min(axis=1)
     
-    # Run backtest
-    for idx in range(200, len(data)):
-        current_price = data['close'].iloc[idx]
-        bot.process_candle(data, idx, current_price)
+    # Run backtest (BACKTEST_MODE=vectorized untuk engine vectorized)
+    if os.getenv('BACKTEST_MODE', 'event').lower() == 'vectorized':
+        bot.run_backtest_vectorized(data, start_idx=200)
+    else:
+        bot.run_backtest(data, start_idx=200)
     
     # Print reports
     print("\n" + "="*60)
@@ -0,0 +1,237 @@
+"""
+Walk-Forward Optimization
+Geser window train (in-sample) / test (out-of-sample) di atas data: setiap
+window memilih config terbaik dari kandidat BotConfig di train window, lalu
+config tersebut di-backtest di test window berikutnya.
+
+Semua backtest berjalan di atas data full history dengan [start_idx,
+end_idx), bukan slice DataFrame, sehingga indikator setiap config dihitung
+sekali lewat INDICATOR_CACHE dan dipakai ulang oleh semua window (nilai
+identik dengan backtest atas data.iloc[:end_idx] karena semua indikator
+causal). Window independen dijalankan paralel di process pool dengan data di
+shared memory atau OHLCVStore lewat worker_pool.
+
+Contoh:
+    configs = grid_configs(BotConfig(), {'fast_ma_period': [10, 20],
+                                         'slow_ma_period': [50, 100]})
+    result = run_walk_forward(data, configs, train_bars=20_000, test_bars=5_000)
+    print(result.table)
+    print(result.stats())
+"""
+
+import logging
+import os
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from ohlcv_store import OHLCVStore
+from trading_bot import BotConfig, TradingBot, equity_stats
+from worker_pool import create_bot, run_pool, worker_data, worker_logger, worker_payload
+
+
+REPORT_COLUMNS = ('total_trades', 'win_rate', 'total_pnl', 'profit_factor', 'max_drawdown')
+
+
+# ============================================================================
+# 1. WINDOWS
+# ============================================================================
+
+@dataclass(frozen=True)
+class Window:
+    """Satu langkah walk-forward: train [train_start, train_end), test [test_start, test_end)"""
+    index: int
+    train_start: int
+    train_end: int
+    test_start: int
+    test_end: int
+
+
+def walk_forward_windows(n_bars: int, train_bars: int, test_bars: int,
+                         start_idx: int = 200, anchored: bool = False) -> List[Window]:
+    """
+    Window berurutan dengan test window yang tidak overlap
+
+    anchored=False: train window rolling sepanjang train_bars;
+    anchored=True: train window selalu mulai dari start_idx (expanding).
+    Test window terakhir bisa lebih pendek dari test_bars.
+    """
+
+    if train_bars <= 0 or test_bars <= 0:
+        raise ValueError("train_bars and test_bars must be positive")
+
+    windows = []
+    test_start = start_idx + train_bars
+    while test_start < n_bars:
+        train_start = start_idx if anchored else test_start - train_bars
+        windows.append(Window(len(windows), train_start, test_start, test_start,
+                              min(test_start + test_bars, n_bars)))
+        test_start += test_bars
+    return windows
+
+
+# ============================================================================
+# 2. WINDOW EVALUATION
+# ============================================================================
+
+def backtest_window(data: pd.DataFrame, config: BotConfig, start_idx: int, end_idx: int,
+                    vectorized: bool = True,
+                    logger: Optional[logging.Logger] = None) -> TradingBot:
+    """Backtest satu config di [start_idx, end_idx), return bot (report + equity curve)"""
+
+    bot = create_bot(config, logger)
+    if vectorized:
+        bot.run_backtest_vectorized(data, start_idx, end_idx)
+    else:
+        bot.run_backtest(data, start_idx, end_idx)
+    return bot
+
+
+def score_report(report: Dict, metric: str, min_trades: int = 1) -> float:
+    """Nilai metric untuk ranking; -inf jika trade kurang dari min_trades atau NaN"""
+
+    value = report.get(metric)
+    if value is None or report['total_trades'] < min_trades or value != value:
+        return float('-inf')
+    return float(value)
+
+
+def evaluate_window(data: pd.DataFrame, window: Window, configs: Sequence[BotConfig],
+                    metric: str = 'profit_factor', min_trades: int = 1,
+                    vectorized: bool = True,
+                    logger: Optional[logging.Logger] = None) -> Dict:
+    """
+    Optimasi di train window lalu backtest config terbaik di test window
+
+    Returns:
+        {'window', 'config_id', 'train_score', 'train_report', 'test_report',
+         'equity' (equity per bar test window)}; seri sama -> config pertama
+    """
+
+    scores = []
+    reports = []
+    for config in configs:
+        report = backtest_window(data, config, window.train_start, window.train_end,
+                                 vectorized, logger).get_overall_report()
+        reports.append(report)
+        scores.append(score_report(report, metric, min_trades))
+
+    best = int(np.argmax(scores))
+    bot = backtest_window(data, configs[best], window.test_start, window.test_end,
+                          vectorized, logger)
+    return {
+        'window': window,
+        'config_id': best,
+        'train_score': scores[best],
+        'train_report': reports[best],
+        'test_report': bot.get_overall_report(),
+        'equity': bot.equity_curve.curve.copy(),
+    }
+
+
+# ============================================================================
+# 3. WORKER
+# ============================================================================
+
+def _run_task(task: Tuple[Window, str, int, bool]) -> Dict:
+    window, metric, min_trades, vectorized = task
+    return evaluate_window(worker_data(), window, worker_payload(), metric, min_trades,
+                           vectorized)
+
+
+# ============================================================================
+# 4. WALK-FORWARD
+# ============================================================================
+
+@dataclass
+class WalkForwardResult:
+    """Tabel parameter per window dan equity out-of-sample yang disambung"""
+    table: pd.DataFrame
+    equity: pd.Series
+
+    def stats(self, periods_per_year: float = 252, risk_free: float = 0.0) -> Dict:
+        """Sharpe, sortino, drawdown dll. dari equity out-of-sample"""
+        return equity_stats(self.equity.to_numpy(), periods_per_year, risk_free)
+
+
+def run_walk_forward(data: Union[pd.DataFrame, OHLCVStore], configs: Sequence[BotConfig],
+                     train_bars: int, test_bars: int, start_idx: int = 200,
+                     anchored: bool = False, metric: str = 'profit_factor',
+                     min_trades: int = 1, processes: Optional[int] = None,
+                     vectorized: bool = True,
+                     log_level: int = logging.WARNING) -> WalkForwardResult:
+    """
+    Walk-forward optimization atas kandidat configs
+
+    Setiap test window mulai dengan account_size config terpilih; equity
+    out-of-sample disambung dengan compounding return per window. Trade
+    yang masih terbuka di akhir window tidak ditutup (hanya masuk equity
+    mark-to-market window tersebut).
+
+    Returns:
+        WalkForwardResult: table satu baris per window (batas window,
+        config_id, field yang di-optimasi, skor train dan metrics test)
+        dan equity per bar test, index = posisi bar di data
+    """
+
+    if not configs:
+        raise ValueError("configs must not be empty")
+    frame = data.to_frame() if isinstance(data, OHLCVStore) else data
+    windows = walk_forward_windows(len(frame), train_bars, test_bars, start_idx, anchored)
+
+    processes = min(processes or os.cpu_count() or 1, max(len(windows), 1))
+    tasks = [(window, metric, min_trades, vectorized) for window in windows]
+
+    if processes == 1:
+        worker_logger.setLevel(log_level)
+        results = [evaluate_window(frame, window, configs, metric, min_trades, vectorized)
+                   for window in windows]
+    else:
+        # Config dikirim sekali per worker, bukan per window
+        results = run_pool(data, _run_task, tasks, processes, list(configs), log_level)
+
+    results.sort(key=lambda result: result['window'].index)
+    return WalkForwardResult(_window_table(results, configs, metric),
+                             _stitch_equity(results, configs))
+
+
+def _window_table(results: List[Dict], configs: Sequence[BotConfig],
+                  metric: str) -> pd.DataFrame:
+    # Hanya field yang berbeda antar kandidat (parameter yang di-optimasi)
+    values = [asdict(config) for config in configs]
+    varied = [name for name in values[0] if any(v[name] != values[0][name] for v in values)]
+
+    rows = []
+    for result in results:
+        window, test, equity = result['window'], result['test_report'], result['equity']
+        start_equity = configs[result['config_id']].account_size
+        row = asdict(window)
+        row['config_id'] = result['config_id']
+        row.update({name: values[result['config_id']][name] for name in varied})
+        row[f'train_{metric}'] = result['train_score']
+        row['train_trades'] = result['train_report']['total_trades']
+        row.update({f'test_{name}': test[name] for name in REPORT_COLUMNS})
+        row['test_return_percent'] = ((equity[-1] / start_equity - 1) * 100
+                                      if len(equity) else 0.0)
+        rows.append(row)
+    return pd.DataFrame(rows)
+
+
+def _stitch_equity(results: List[Dict], configs: Sequence[BotConfig]) -> pd.Series:
+    start_equity = configs[0].account_size
+    segments = []
+    bars = []
+    for result in results:
+        window, equity = result['window'], result['equity']
+        scale = start_equity / configs[result['config_id']].account_size
+        segment = equity * scale
+        segments.append(segment)
+        bars.append(np.arange(window.test_start, window.test_start + len(segment)))
+        if len(segment):
+            start_equity = segment[-1]
+
+    if not segments:
+        return pd.Series([], dtype=np.float64, name='equity')
+    return pd.Series(np.concatenate(segments), index=np.concatenate(bars), name='equity')
@@ -0,0 +1,174 @@
+"""
+Process Pool Backtest Worker
+Boilerplate bersama parameter_sweep, walk_forward dan adaptive_search:
+data OHLCV ditaruh sekali di shared memory (DataFrame) atau dibaca dari
+OHLCVStore memmap di setiap worker, payload per worker (mis. daftar config)
+dikirim sekali lewat initializer, dan bot batch dibuat tanpa event log
+per trade dan tanpa results_db.
+
+Contoh:
+    def _run_task(config_id):
+        bot = create_bot(worker_payload()[config_id])
+        return config_id, bot.run_backtest_vectorized(worker_data())
+
+    results = run_pool(data, _run_task, range(len(configs)), processes=8,
+                       payload=configs)
+"""
+
+import logging
+from contextlib import contextmanager
+from dataclasses import replace
+from multiprocessing import Pool, shared_memory
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from ohlcv_store import OHLCVStore
+from trading_bot import BotConfig, EventLog, TradingBot, create_strategy
+
+
+OHLCV_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+
+worker_logger = logging.getLogger(f"{__name__}.worker")
+
+
+# ============================================================================
+# 1. SHARED MEMORY MARKET DATA
+# ============================================================================
+
+class SharedMarketData:
+    """
+    Kolom OHLCV dalam satu blok shared memory
+
+    Proses utama membuat blok sekali; worker attach lewat spec (nama blok
+    + layout kolom) dan membaca kolom sebagai numpy view tanpa copy.
+    """
+
+    def __init__(self, data: pd.DataFrame, columns: Sequence[str] = OHLCV_COLUMNS):
+        arrays = [np.ascontiguousarray(data[col].to_numpy()) for col in columns]
+
+        layout = []
+        offset = 0
+        for col, arr in zip(columns, arrays):
+            # Align setiap kolom ke 64 byte
+            offset = (offset + 63) // 64 * 64
+            layout.append((col, arr.dtype.str, offset))
+            offset += arr.nbytes
+
+        self.shm = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+        for (col, dtype, start), arr in zip(layout, arrays):
+            view = np.ndarray(len(arr), dtype=dtype, buffer=self.shm.buf, offset=start)
+            view[:] = arr
+
+        self.spec = (self.shm.name, len(data), tuple(layout))
+
+    @staticmethod
+    def attach(spec: Tuple) -> Tuple[shared_memory.SharedMemory, pd.DataFrame]:
+        """Attach ke blok yang sudah ada, return (shm, DataFrame zero-copy)"""
+
+        name, length, layout = spec
+        shm = shared_memory.SharedMemory(name=name)
+        columns = {
+            col: np.ndarray(length, dtype=dtype, buffer=shm.buf, offset=start)
+            for col, dtype, start in layout
+        }
+        return shm, pd.DataFrame(columns, copy=False)
+
+    def close(self) -> None:
+        """Lepas dan hapus blok shared memory"""
+        self.shm.close()
+        self.shm.unlink()
+
+    def __enter__(self) -> 'SharedMarketData':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+# ============================================================================
+# 2. BOT FACTORY
+# ============================================================================
+
+def create_bot(config: BotConfig, logger: Optional[logging.Logger] = None) -> TradingBot:
+    """
+    Bot untuk backtest batch: results_db dikosongkan (hasil ditulis sekali
+    oleh pemanggil, bukan per run) dan event log 'logging' diganti silent
+    (event per trade tidak dibaca, skip format sepenuhnya)
+    """
+
+    logger = logger or worker_logger
+    config = replace(config, results_db='') if config.results_db else config
+    bot = TradingBot(config, create_strategy(config, logger), logger)
+    if config.event_log == 'logging':
+        bot.set_event_log(EventLog.silent())
+    return bot
+
+
+# ============================================================================
+# 3. WORKER
+# ============================================================================
+
+_worker_shm: Optional[shared_memory.SharedMemory] = None
+_worker_store: Optional[OHLCVStore] = None
+_worker_data: Optional[pd.DataFrame] = None
+_worker_payload: Any = None
+
+
+def _init_worker(source: Tuple[str, object], payload: Any, log_level: int) -> None:
+    global _worker_shm, _worker_store, _worker_data, _worker_payload
+    kind, spec = source
+    if kind == 'store':
+        # Memmap: page di-share antar worker lewat OS page cache
+        _worker_store = OHLCVStore(spec)
+        _worker_data = _worker_store.to_frame()
+    else:
+        _worker_shm, _worker_data = SharedMarketData.attach(spec)
+    # Payload dikirim sekali per worker, bukan per task
+    _worker_payload = payload
+    worker_logger.setLevel(log_level)
+
+
+def worker_data() -> pd.DataFrame:
+    """DataFrame OHLCV di proses worker (di-set oleh initializer pool)"""
+    return _worker_data
+
+
+def worker_payload() -> Any:
+    """Payload yang diberikan ke worker_pool/run_pool"""
+    return _worker_payload
+
+
+# ============================================================================
+# 4. POOL
+# ============================================================================
+
+@contextmanager
+def worker_pool(data: Union[pd.DataFrame, OHLCVStore], processes: int, payload: Any = None,
+                log_level: int = logging.WARNING) -> Iterator[Pool]:
+    """
+    Process pool dengan worker_data() = data di setiap worker
+
+    DataFrame di-copy sekali ke shared memory (dihapus saat pool ditutup);
+    OHLCVStore dibuka sebagai memmap oleh setiap worker.
+    """
+
+    if isinstance(data, OHLCVStore):
+        with Pool(processes, initializer=_init_worker,
+                  initargs=(('store', data.path), payload, log_level)) as pool:
+            yield pool
+    else:
+        with SharedMarketData(data) as shared, \
+                Pool(processes, initializer=_init_worker,
+                     initargs=(('shm', shared.spec), payload, log_level)) as pool:
+            yield pool
+
+
+def run_pool(data: Union[pd.DataFrame, OHLCVStore], func: Callable, tasks: Iterable,
+             processes: int, payload: Any = None, log_level: int = logging.WARNING,
+             chunksize: int = 1) -> List:
+    """func(task) untuk setiap task di worker_pool, hasil dalam urutan selesai"""
+
+    with worker_pool(data, processes, payload, log_level) as pool:
+        return list(pool.imap_unordered(func, tasks, chunksize=chunksize))